@@ -4,6 +4,7 @@ Week 2 - LLM Foundations for Agents
 Visualizes how context window size affects agent performance
 """
 
+import csv
 from pathlib import Path
 
 import matplotlib.pyplot as plt
@@ -35,17 +36,25 @@ MLGRAY = "#7F7F7F"
 
 fig, ax = plt.subplots(figsize=(10, 6))
 
+# Data shared with the chart spec in docs/_data/chart_specs
+DATA_FILE = Path(__file__).parents[2] / "docs" / "_data" / "chart_specs" / "context_window.csv"
+with open(DATA_FILE, encoding="utf-8", newline="") as f:
+    rows = list(csv.DictReader(f))
+
 # Context window sizes (in K tokens)
-models = ["GPT-3.5\n4K", "GPT-3.5\n16K", "GPT-4\n8K", "GPT-4\n32K", "GPT-4\n128K", "Claude 3\n200K"]
-context_sizes = [4, 16, 8, 32, 128, 200]
+models = [f"{row['model']}\n{row['context_k']}K" for row in rows]
+context_sizes = [int(row["context_k"]) for row in rows]
 
 # Simulated capability scores (0-100) for different agent tasks
 # These represent approximate relative performance
+CAPABILITY_LABELS = {
+    "single_turn_qa": "Single-turn QA",
+    "multi_step_reasoning": "Multi-step reasoning",
+    "long_document_analysis": "Long document analysis",
+    "complex_agent_tasks": "Complex agent tasks",
+}
 capabilities = {
-    "Single-turn QA": [95, 95, 98, 98, 98, 98],
-    "Multi-step reasoning": [60, 75, 80, 90, 95, 95],
-    "Long document analysis": [30, 60, 45, 80, 95, 98],
-    "Complex agent tasks": [40, 55, 60, 75, 90, 92],
+    label: [int(row[column]) for row in rows] for column, label in CAPABILITY_LABELS.items()
 }
 
 x = np.arange(len(models))
@@ -3,6 +3,7 @@ Multi-Agent Coordination Overhead Analysis
 Week 5 - Multi-Agent Architectures
 """
 
+import csv
 from pathlib import Path
 
 import matplotlib.pyplot as plt
@@ -28,11 +29,14 @@ MLORANGE = "#FF7F0E"
 MLGREEN = "#2CA02C"
 MLGRAY = "#7F7F7F"
 
-# Number of agents vs metrics
-agents = [1, 2, 3, 4, 5, 6, 8, 10]
-task_performance = [60, 72, 80, 85, 86, 85, 82, 78]
-coordination_cost = [0, 15, 28, 42, 58, 75, 95, 120]
-net_efficiency = [60, 57, 52, 43, 28, 10, -13, -42]
+# Number of agents vs metrics (shared with the chart spec in docs/_data/chart_specs)
+DATA_FILE = Path(__file__).parents[2] / "docs" / "_data" / "chart_specs" / "coordination_overhead.csv"
+with open(DATA_FILE, encoding="utf-8", newline="") as f:
+    rows = list(csv.DictReader(f))
+agents = [int(row["agents"]) for row in rows]
+task_performance = [int(row["task_performance"]) for row in rows]
+coordination_cost = [int(row["coordination_cost"]) for row in rows]
+net_efficiency = [int(row["net_efficiency"]) for row in rows]
 
 fig, ax1 = plt.subplots(figsize=(10, 6))
 
@@ -3,6 +3,7 @@ RAG Retrieval Strategy Comparison
 Week 7 - Advanced RAG
 """
 
+import csv
 from pathlib import Path
 
 import matplotlib.pyplot as plt
@@ -28,10 +29,13 @@ MLORANGE = "#FF7F0E"
 MLGREEN = "#2CA02C"
 MLRED = "#D62728"
 
-# Comparison data (synthetic based on research patterns)
-strategies = ["Naive\nRAG", "Query\nRewrite", "HyDE", "Self-RAG", "CRAG", "Agentic\nRAG"]
-accuracy = [62, 68, 71, 78, 76, 82]
-latency = [1.0, 1.2, 1.5, 2.2, 1.8, 3.5]  # Relative latency
+# Comparison data (synthetic based on research patterns), shared with docs/_data/chart_specs
+DATA_FILE = Path(__file__).parents[2] / "docs" / "_data" / "chart_specs" / "retrieval_comparison.csv"
+with open(DATA_FILE, encoding="utf-8", newline="") as f:
+    rows = list(csv.DictReader(f))
+strategies = [row["strategy"].replace(" ", "\n") for row in rows]
+accuracy = [int(row["accuracy"]) for row in rows]
+latency = [float(row["latency"]) for row in rows]  # Relative latency
 
 x = np.arange(len(strategies))
 width = 0.35
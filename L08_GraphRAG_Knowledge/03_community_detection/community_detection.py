@@ -27,6 +27,9 @@ MLORANGE = "#FF7F0E"
 MLGREEN = "#2CA02C"
 MLGRAY = "#7F7F7F"
 
+# Fixed seed so the sampled intra-community edges are identical on every render
+np.random.seed(42)
+
 fig, ax = plt.subplots(figsize=(10, 6))
 ax.set_xlim(0, 10)
 ax.set_ylim(0, 6)
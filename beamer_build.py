@@ -0,0 +1,346 @@
+"""
+Incremental, parallel build of the Beamer lecture decks.
+
+Each lecture deck L*/L*.tex pulls in chart PDFs with \\includegraphics and
+(optionally) other sources with \\input. This module parses those references,
+hashes every input of a deck and recompiles only decks whose inputs (or PDF)
+changed since the last build, several at a time. Every deck compiles into its
+own aux directory (temp/<deck name>/ next to the .tex), so parallel runs never
+share .aux/.nav/.log files. Per-deck timings are written to a build report.
+
+Usage:
+    python beamer_build.py                 # build stale decks
+    python beamer_build.py --force --jobs 4
+    python beamer_build.py -k L05 --dry-run
+"""
+
+import argparse
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from chart_manifest import save_manifest, sha256_bytes, sha256_file
+
+ROOT = Path(__file__).parent
+STATE_PATH = ROOT / ".deck_manifest.json"
+STATE_VERSION = 1
+REPORT_PATH = ROOT / "build_report.json"
+
+# Deck-local folder for .aux/.log/.nav/... so the deck folder stays clean
+AUX_DIRNAME = "temp"
+
+DEFAULT_LATEX = "pdflatex"
+DEFAULT_TIMEOUT = 300
+
+INCLUDE_PATTERN = re.compile(r"\\(includegraphics|input|include)\s*(?:\[[^\]]*\])?\s*\{([^}]+)\}")
+COMMENT_PATTERN = re.compile(r"(?<!\\)%.*")
+
+# Extensions pdflatex tries, in order, for \includegraphics without one
+GRAPHICS_EXTENSIONS = [".pdf", ".png", ".jpg", ".jpeg"]
+
+
+@dataclass
+class DeckResult:
+    deck: Path
+    ok: bool
+    seconds: float
+    log: str = ""
+    status: str = "built"
+
+
+def find_decks(root: Path = ROOT) -> list[Path]:
+    """Lecture decks (L*/L*.tex) plus the shared template deck."""
+    decks = sorted(root.glob("L*_*/L*.tex"))
+    template = root / "template_beamer_final.tex"
+    if template.exists():
+        decks.append(template)
+    return decks
+
+
+def _resolve(base: Path, name: str, extensions: list[str]) -> Path:
+    path = base / name
+    if path.suffix:
+        return path.resolve()
+    for ext in extensions:
+        if path.with_suffix(ext).exists():
+            return path.with_suffix(ext).resolve()
+    return path.with_suffix(extensions[0]).resolve()
+
+
+def deck_dependencies(deck: Path) -> list[Path]:
+    """Files a deck reads: the deck itself, \\input sources (recursively) and graphics.
+
+    Paths are resolved relative to the deck folder, which is where LaTeX runs.
+    Commented-out references are ignored.
+    """
+    deck = Path(deck).resolve()
+    seen = [deck]
+    queue = [deck]
+    while queue:
+        source = queue.pop(0)
+        if not source.exists():
+            continue
+        text = COMMENT_PATTERN.sub("", source.read_text(encoding="utf-8", errors="replace"))
+        for command, name in INCLUDE_PATTERN.findall(text):
+            name = name.strip()
+            if command == "includegraphics":
+                path = _resolve(deck.parent, name, GRAPHICS_EXTENSIONS)
+            else:
+                path = _resolve(deck.parent, name, [".tex"])
+            if path not in seen:
+                seen.append(path)
+                if path.suffix == ".tex":
+                    queue.append(path)
+    return seen
+
+
+def dependents(decks: list[Path]) -> dict[Path, list[Path]]:
+    """Reverse index: dependency path -> decks that use it."""
+    index: dict[Path, list[Path]] = {}
+    for deck in decks:
+        for path in deck_dependencies(deck):
+            index.setdefault(path, []).append(Path(deck).resolve())
+    return index
+
+
+def aux_dir_for(deck: Path) -> Path:
+    """Private aux directory of a deck, e.g. L05_.../temp/L05_.../."""
+    deck = Path(deck)
+    return deck.parent / AUX_DIRNAME / deck.stem
+
+
+@lru_cache(maxsize=None)
+def latex_version(latex: str = DEFAULT_LATEX) -> str:
+    """First line of `latex --version`, part of every deck's input hash."""
+    try:
+        result = subprocess.run([latex, "--version"], capture_output=True, text=True, timeout=30)
+    except (OSError, subprocess.TimeoutExpired):
+        return "missing"
+    lines = result.stdout.splitlines()
+    return lines[0].strip() if lines else "unknown"
+
+
+def deck_inputs(deck: Path, latex: str = DEFAULT_LATEX, passes: int = 2) -> dict:
+    """Hashes of everything that determines a deck's PDF."""
+    deck = Path(deck).resolve()
+    files = {}
+    for path in deck_dependencies(deck):
+        key = os.path.relpath(path, deck.parent).replace(os.sep, "/")
+        files[key] = sha256_file(path) if path.exists() else "missing"
+    return {"files": files, "latex": latex_version(latex), "passes": passes}
+
+
+def inputs_key(inputs: dict) -> str:
+    return sha256_bytes(json.dumps(inputs, sort_keys=True).encode("utf-8"))
+
+
+def load_state(path: Path = STATE_PATH) -> dict:
+    """Load the per-deck build state, starting fresh if missing or outdated."""
+    try:
+        state = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {"version": STATE_VERSION, "decks": {}}
+    if state.get("version") != STATE_VERSION:
+        return {"version": STATE_VERSION, "decks": {}}
+    return state
+
+
+def is_stale(state: dict, deck: Path, inputs: dict, root: Path = ROOT) -> bool:
+    """True unless the deck was built from identical inputs and its PDF is unchanged."""
+    deck = Path(deck).resolve()
+    entry = state["decks"].get(deck.relative_to(root.resolve()).as_posix())
+    if not entry or entry.get("inputs_key") != inputs_key(inputs):
+        return True
+    pdf = deck.with_suffix(".pdf")
+    return not pdf.exists() or sha256_file(pdf) != entry.get("pdf_sha256")
+
+
+def record_build(state: dict, deck: Path, inputs: dict, seconds: float, root: Path = ROOT):
+    deck = Path(deck).resolve()
+    state["decks"][deck.relative_to(root.resolve()).as_posix()] = {
+        "inputs_key": inputs_key(inputs),
+        "pdf_sha256": sha256_file(deck.with_suffix(".pdf")),
+        "seconds": round(seconds, 3),
+        "built_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+
+
+def latex_command(deck: Path, aux_dir: Path, latex: str = DEFAULT_LATEX) -> list[str]:
+    return [
+        latex,
+        "-interaction=nonstopmode",
+        "-halt-on-error",
+        "-file-line-error",
+        f"-output-directory={aux_dir}",
+        deck.name,
+    ]
+
+
+def compile_deck(
+    deck: Path,
+    latex: str = DEFAULT_LATEX,
+    passes: int = 2,
+    aux_dir: Optional[Path] = None,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> DeckResult:
+    """Compile a deck and copy the PDF next to its .tex file.
+
+    Beamer needs a second pass for navigation and page references; when the
+    aux files from an earlier build are present, passes=1 is enough to pick
+    up a changed figure.
+    """
+    deck = Path(deck).resolve()
+    aux_dir = Path(aux_dir) if aux_dir else aux_dir_for(deck)
+    aux_dir.mkdir(parents=True, exist_ok=True)
+
+    start = time.perf_counter()
+    if shutil.which(latex) is None:
+        return DeckResult(deck, False, 0.0, f"{latex} not found on PATH")
+    for _ in range(passes):
+        try:
+            result = subprocess.run(
+                latex_command(deck, aux_dir, latex),
+                cwd=deck.parent,
+                capture_output=True,
+                text=True,
+                errors="replace",
+                timeout=timeout,
+            )
+        except subprocess.TimeoutExpired:
+            return DeckResult(
+                deck, False, time.perf_counter() - start, f"Timed out after {timeout}s"
+            )
+        if result.returncode != 0:
+            return DeckResult(deck, False, time.perf_counter() - start, result.stdout[-2000:])
+
+    pdf = aux_dir / deck.with_suffix(".pdf").name
+    shutil.copy2(pdf, deck.with_suffix(".pdf"))
+    return DeckResult(deck, True, time.perf_counter() - start)
+
+
+def build_decks(
+    decks: list[Path],
+    jobs: Optional[int] = None,
+    latex: str = DEFAULT_LATEX,
+    passes: int = 2,
+    force: bool = False,
+    dry_run: bool = False,
+    root: Path = ROOT,
+    state_path: Path = STATE_PATH,
+) -> list[DeckResult]:
+    """Compile the stale decks in parallel and return a result per deck.
+
+    LaTeX runs as a subprocess, so a thread per job is enough to keep
+    `jobs` compilers busy. The build state is saved after every finished
+    deck, so an interrupted build keeps the decks it already completed.
+    """
+    state = load_state(state_path)
+    stale, results = [], []
+    for deck in decks:
+        inputs = deck_inputs(deck, latex, passes)
+        if force or is_stale(state, deck, inputs, root):
+            stale.append((Path(deck).resolve(), inputs))
+        else:
+            results.append(DeckResult(Path(deck).resolve(), True, 0.0, status="skipped"))
+
+    if dry_run:
+        return results + [DeckResult(deck, True, 0.0, status="stale") for deck, _ in stale]
+
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(stale) or 1))
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = {
+            pool.submit(compile_deck, deck, latex, passes): (deck, inputs) for deck, inputs in stale
+        }
+        for future in as_completed(futures):
+            deck, inputs = futures[future]
+            result = future.result()
+            if result.ok:
+                record_build(state, deck, inputs, result.seconds, root)
+                save_manifest(state, state_path)
+            else:
+                result.status = "failed"
+            status = "OK" if result.ok else "FAILED"
+            print(f"{status:6} {result.seconds:6.2f}s  {deck.relative_to(root.resolve())}")
+            results.append(result)
+
+    order = {Path(deck).resolve(): i for i, deck in enumerate(decks)}
+    return sorted(results, key=lambda r: order[r.deck])
+
+
+def build_report(results: list[DeckResult], wall: float, jobs: int, latex: str, root: Path = ROOT):
+    """Per-deck status and timing, plus totals."""
+    return {
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "latex": latex_version(latex),
+        "jobs": jobs,
+        "wall_s": round(wall, 3),
+        "compile_s": round(sum(r.seconds for r in results), 3),
+        "totals": {
+            status: sum(1 for r in results if r.status == status)
+            for status in ("built", "skipped", "failed", "stale")
+        },
+        "decks": {
+            r.deck.relative_to(root.resolve()).as_posix(): {
+                "status": r.status,
+                "seconds": round(r.seconds, 3),
+                **({"log": r.log} if r.status == "failed" else {}),
+            }
+            for r in results
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build stale Beamer decks in parallel")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="Parallel LaTeX runs")
+    parser.add_argument("--latex", default=DEFAULT_LATEX, help="LaTeX engine")
+    parser.add_argument("--passes", type=int, default=2, help="LaTeX passes per deck")
+    parser.add_argument("--force", action="store_true", help="Rebuild every deck")
+    parser.add_argument("--dry-run", action="store_true", help="Only list stale decks")
+    parser.add_argument("--report", type=Path, default=REPORT_PATH, help="Build report JSON")
+    parser.add_argument("-k", dest="pattern", help="Only decks whose path contains this")
+    args = parser.parse_args()
+
+    decks = find_decks(ROOT)
+    if args.pattern:
+        decks = [d for d in decks if args.pattern in d.as_posix()]
+
+    start = time.perf_counter()
+    results = build_decks(
+        decks, args.jobs, args.latex, args.passes, force=args.force, dry_run=args.dry_run
+    )
+    wall = time.perf_counter() - start
+    jobs = args.jobs or os.cpu_count() or 1
+
+    report = build_report(results, wall, jobs, args.latex)
+    with open(args.report, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    totals = report["totals"]
+    if args.dry_run:
+        for r in results:
+            if r.status == "stale":
+                print(f"stale  {r.deck.relative_to(ROOT.resolve())}")
+    print(
+        f"\n{totals['built']} built, {totals['skipped']} up to date, {totals['failed']} failed, "
+        f"{totals['stale']} stale in {wall:.2f}s (jobs={jobs})"
+    )
+    print(f"Report saved to: {args.report}")
+    for r in results:
+        if r.status == "failed":
+            print(f"\n--- {r.deck.name} ---\n{r.log}")
+    return 1 if totals["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
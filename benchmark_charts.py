@@ -0,0 +1,221 @@
+"""
+Benchmark chart rendering and flag regressions against a checked-in baseline.
+
+For every chart found by discover_chart_scripts() this records wall time, CPU
+time, peak RSS, artist count and output bytes. Results are written as JSON so
+they can be trended over time, and compared against
+benchmarks/chart_baseline.json: a chart that got more than --max-slowdown
+percent slower or --max-growth percent larger fails the run.
+
+Usage:
+    python benchmark_charts.py
+    python benchmark_charts.py --output bench.json --repeat 3
+    python benchmark_charts.py --update-baseline
+"""
+
+import argparse
+import json
+import platform
+import sys
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from chart_engine import RenderEngine, discover_chart_scripts
+from chart_manifest import library_versions
+
+ROOT = Path(__file__).parent
+BASELINE_PATH = ROOT / "benchmarks" / "chart_baseline.json"
+
+# Metrics compared with the slowdown threshold (noisy, seconds)
+TIME_METRICS = ["wall_s", "cpu_s"]
+
+# Metrics compared with the growth threshold (stable, counts and sizes)
+SIZE_METRICS = ["peak_rss_kb", "artists", "output_bytes"]
+
+
+def benchmark_charts(
+    charts: list[Path], repeat: int = 1, workers: int = 1, isolate: bool = True
+) -> dict[str, dict]:
+    """Render each chart `repeat` times and keep the best timing per metric.
+
+    With isolate=True every render gets a fresh worker so peak RSS is measured
+    per chart; wall and CPU time are measured inside the worker and exclude
+    the matplotlib import either way.
+    """
+    metrics: dict[str, dict] = {}
+    with tempfile.TemporaryDirectory() as tmp, RenderEngine(
+        workers=workers, max_tasks_per_child=1 if isolate else None
+    ) as engine:
+        for _ in range(repeat):
+            for result in engine.render(charts, output_dir=Path(tmp)):
+                key = result.path.relative_to(ROOT).as_posix()
+                if not result.ok:
+                    metrics[key] = {"ok": False, "error": result.error.strip().splitlines()[-1]}
+                    continue
+                sample = {
+                    "ok": True,
+                    "wall_s": round(result.seconds, 4),
+                    "cpu_s": round(result.cpu_seconds, 4),
+                    "peak_rss_kb": result.peak_rss_kb,
+                    "artists": result.artists,
+                    "output_bytes": sum(p.stat().st_size for p in result.outputs if p.exists()),
+                }
+                best = metrics.get(key)
+                if best and best.get("ok"):
+                    sample = {
+                        k: min(v, best[k]) if k in TIME_METRICS else v for k, v in sample.items()
+                    }
+                metrics[key] = sample
+    return metrics
+
+
+def summarize(metrics: dict[str, dict]) -> dict:
+    """Totals across all successfully rendered charts."""
+    ok = [m for m in metrics.values() if m.get("ok")]
+    return {
+        "charts": len(metrics),
+        "failed": len(metrics) - len(ok),
+        "wall_s": round(sum(m["wall_s"] for m in ok), 4),
+        "cpu_s": round(sum(m["cpu_s"] for m in ok), 4),
+        "max_peak_rss_kb": max((m["peak_rss_kb"] for m in ok), default=0),
+        "artists": sum(m["artists"] for m in ok),
+        "output_bytes": sum(m["output_bytes"] for m in ok),
+    }
+
+
+def compare(
+    current: dict[str, dict],
+    baseline: dict[str, dict],
+    max_slowdown: float = 25.0,
+    max_growth: float = 10.0,
+    min_delta_s: float = 0.05,
+) -> list[dict]:
+    """List every metric that regressed beyond its threshold (in percent).
+
+    Time regressions smaller than min_delta_s seconds are ignored, since tiny
+    charts render in a few milliseconds and their relative jitter is large.
+    """
+    regressions = []
+    for chart, metrics in sorted(current.items()):
+        base = baseline.get(chart)
+        if not metrics.get("ok"):
+            regressions.append({"chart": chart, "metric": "ok", "error": metrics.get("error")})
+            continue
+        if not base or not base.get("ok"):
+            continue
+        for metric in TIME_METRICS + SIZE_METRICS:
+            old, new = base.get(metric), metrics.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old * 100
+            if metric in TIME_METRICS:
+                if change > max_slowdown and new - old > min_delta_s:
+                    regressions.append(_regression(chart, metric, old, new, change))
+            elif change > max_growth:
+                regressions.append(_regression(chart, metric, old, new, change))
+    return regressions
+
+
+def _regression(chart: str, metric: str, old, new, change: float) -> dict:
+    return {
+        "chart": chart,
+        "metric": metric,
+        "baseline": old,
+        "current": new,
+        "change_pct": round(change, 1),
+    }
+
+
+def load_baseline(path: Path) -> Optional[dict]:
+    if not path.exists():
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark chart rendering")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="Baseline JSON")
+    parser.add_argument("--output", type=Path, help="Write the benchmark report to this JSON file")
+    parser.add_argument("--update-baseline", action="store_true", help="Overwrite the baseline")
+    parser.add_argument("--repeat", type=int, default=1, help="Renders per chart (best is kept)")
+    parser.add_argument("--workers", type=int, default=1, help="Parallel render workers")
+    parser.add_argument("--max-slowdown", type=float, default=25.0, help="Allowed slowdown in %%")
+    parser.add_argument("--max-growth", type=float, default=10.0, help="Allowed size growth in %%")
+    parser.add_argument("-k", dest="pattern", help="Only benchmark charts whose path contains this")
+    args = parser.parse_args()
+
+    charts = discover_chart_scripts(ROOT)
+    if args.pattern:
+        charts = [c for c in charts if args.pattern in c.as_posix()]
+
+    print(f"Benchmarking {len(charts)} charts (repeat={args.repeat}, workers={args.workers})...")
+    metrics = benchmark_charts(charts, repeat=args.repeat, workers=args.workers)
+
+    report = {
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "platform": platform.platform(),
+        "versions": library_versions(),
+        "repeat": args.repeat,
+        "totals": summarize(metrics),
+        "charts": metrics,
+    }
+
+    print(f"\n{'Chart':60} {'wall s':>7} {'cpu s':>7} {'rss MB':>7} {'artists':>7} {'KB':>7}")
+    for chart, m in metrics.items():
+        if m.get("ok"):
+            print(
+                f"{chart[-60:]:60} {m['wall_s']:7.2f} {m['cpu_s']:7.2f} "
+                f"{m['peak_rss_kb'] / 1024:7.1f} {m['artists']:7d} {m['output_bytes'] / 1024:7.1f}"
+            )
+        else:
+            print(f"{chart[-60:]:60} FAILED: {m['error']}")
+
+    baseline = load_baseline(args.baseline)
+    if args.update_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"\nBaseline updated: {args.baseline}")
+        regressions = []
+    elif baseline is None:
+        print(f"\nNo baseline at {args.baseline}; run with --update-baseline to create one")
+        regressions = []
+    else:
+        regressions = compare(metrics, baseline["charts"], args.max_slowdown, args.max_growth)
+        report["baseline"] = {
+            "path": str(args.baseline),
+            "generated_at": baseline.get("generated_at"),
+        }
+
+    report["regressions"] = regressions
+    report["status"] = "fail" if regressions else "pass"
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+        print(f"\nReport saved to: {args.output}")
+
+    totals = report["totals"]
+    print(
+        f"\nTotal: {totals['wall_s']:.2f}s wall, {totals['cpu_s']:.2f}s CPU, "
+        f"{totals['output_bytes'] / 1024:.0f} KB output"
+    )
+    if regressions:
+        print(f"\n{len(regressions)} regressions:")
+        for r in regressions:
+            if r["metric"] == "ok":
+                print(f"  - {r['chart']}: failed ({r['error']})")
+            else:
+                print(
+                    f"  - {r['chart']}: {r['metric']} {r['baseline']} -> {r['current']} "
+                    f"(+{r['change_pct']}%)"
+                )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,439 @@
+"""
+Warm-worker rendering engine for the lecture chart scripts.
+
+Each worker process imports matplotlib and numpy once and then runs chart
+scripts in place with runpy, so the import cost is paid per worker instead of
+per chart. rcParams and pyplot figures are reset after every chart, which gives
+each script the same starting state as a fresh interpreter.
+
+With web_dir set, every PDF a chart saves is also exported for the website:
+an SVG plus PNG and WebP thumbnails at several widths. The figure is laid out
+and rasterized once; the SVG reuses that layout's bounding box and all
+thumbnails are downsampled from the single raster.
+
+Rendering is deterministic by default: the random generators are seeded before
+each chart and SOURCE_DATE_EPOCH pins the PDF CreationDate, so identical inputs
+produce byte-identical PDFs that downstream caches can key on.
+
+Usage:
+    from chart_engine import RenderEngine, discover_chart_scripts
+
+    with RenderEngine() as engine:
+        for result in engine.render(discover_chart_scripts()):
+            print(result.path, result.seconds)
+"""
+
+import contextlib
+import io
+import multiprocessing
+import os
+import random
+import re
+import runpy
+import subprocess
+import sys
+import time
+import traceback
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+ROOT = Path(__file__).parent
+
+# Per-chart timeout in seconds, matching the old subprocess-per-chart tests
+DEFAULT_TIMEOUT = 60
+
+# Seed injected into random/numpy before each chart in deterministic mode
+DEFAULT_SEED = 42
+
+# Fixed timestamp matplotlib writes as the PDF CreationDate (2024-01-01T00:00:00Z)
+SOURCE_DATE_EPOCH = "1704067200"
+
+# Salt for SVG element ids, which are otherwise random per run
+SVG_HASHSALT = "agentic-ai"
+
+# Web export: raster resolution and thumbnail widths in pixels
+WEB_DPI = 200
+THUMBNAIL_WIDTHS = (320, 640, 1280)
+
+# Bootstrap used by render_subprocess to seed a fresh interpreter before the chart runs
+_SUBPROCESS_BOOTSTRAP = (
+    "import random, runpy, sys; import numpy; "
+    "seed = int(sys.argv[2]); random.seed(seed); numpy.random.seed(seed); "
+    "import matplotlib; matplotlib.rcParams['svg.hashsalt'] = sys.argv[3]; "
+    "sys.argv = sys.argv[1:2]; runpy.run_path(sys.argv[0], run_name='__main__')"
+)
+
+
+def deterministic_env(env: Optional[dict] = None) -> dict:
+    """Environment with SOURCE_DATE_EPOCH pinned for reproducible PDF metadata."""
+    env = dict(os.environ if env is None else env)
+    env["SOURCE_DATE_EPOCH"] = SOURCE_DATE_EPOCH
+    return env
+
+
+@dataclass
+class ChartResult:
+    """Outcome of rendering one chart script."""
+
+    path: Path
+    ok: bool
+    seconds: float
+    stdout: str = ""
+    error: str = ""
+    mode: str = "warm"
+    outputs: list[Path] = field(default_factory=list)
+    cpu_seconds: float = 0.0
+    peak_rss_kb: int = 0
+    artists: int = 0
+
+
+def discover_chart_scripts(root: Path = ROOT) -> list[Path]:
+    """Find all chart Python files in lecture folders.
+
+    Charts are named after their folder, e.g.:
+    - 01_agent_definition/agent_definition.py
+    - 02_react_paradigm/react_paradigm.py
+    """
+    charts = []
+    for lesson_dir in root.glob("L*_*"):
+        if lesson_dir.is_dir():
+            for chart_dir in lesson_dir.glob("*_*"):
+                if chart_dir.is_dir():
+                    # Extract expected name from folder (e.g., "01_agent_definition" -> "agent_definition")
+                    match = re.match(r"^\d+[a-z]?_(.+)$", chart_dir.name)
+                    if match:
+                        chart_name = match.group(1)
+                        chart_py = chart_dir / f"{chart_name}.py"
+                        if chart_py.exists():
+                            charts.append(chart_py)
+    return sorted(charts)
+
+
+# ---------------------------------------------------------------------------
+# Worker side
+# ---------------------------------------------------------------------------
+
+
+def _init_worker(deterministic: bool = True):
+    """Import the heavy plotting stack once per worker process."""
+    if deterministic:
+        os.environ["SOURCE_DATE_EPOCH"] = SOURCE_DATE_EPOCH
+
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot  # noqa: F401
+    import numpy  # noqa: F401
+
+
+@contextlib.contextmanager
+def _capture_saves(
+    outputs: list, artists: list, output_dir: Optional[Path], web_dir: Optional[Path] = None
+):
+    """Record every file a chart saves, optionally redirecting it into output_dir.
+
+    The number of artists in each saved figure is appended to artists. With
+    web_dir, PDFs are additionally exported in web formats (see _export_web).
+    """
+    from matplotlib.figure import Figure
+
+    original = Figure.savefig
+
+    def savefig(fig, fname, *args, **kwargs):
+        artists.append(len(fig.findobj()))
+        if not isinstance(fname, (str, os.PathLike)):
+            return original(fig, fname, *args, **kwargs)
+
+        target = Path(fname)
+        if output_dir is not None:
+            output_dir.mkdir(parents=True, exist_ok=True)
+            target = output_dir / target.name
+        outputs.append(target.resolve())
+        saved = original(fig, target, *args, **kwargs)
+        if web_dir is not None and target.suffix == ".pdf":
+            outputs.extend(_export_web(fig, target.stem, web_dir, original, kwargs))
+        return saved
+
+    Figure.savefig = savefig
+    try:
+        yield
+    finally:
+        Figure.savefig = original
+
+
+def _export_web(fig, stem: str, web_dir: Path, savefig, kwargs: dict) -> list[Path]:
+    """Export a figure as SVG plus PNG/WebP thumbnails from a single layout and raster.
+
+    The figure is drawn once on its Agg canvas at WEB_DPI. The tight bounding
+    box from that draw is passed explicitly to the SVG save, so matplotlib
+    does not run another layout pass, and every thumbnail is a Lanczos
+    downsample of the one raster.
+    """
+    import numpy as np
+    from PIL import Image
+
+    web_dir.mkdir(parents=True, exist_ok=True)
+    facecolor = kwargs.get("facecolor", "white")
+    pad = kwargs.get("pad_inches", 0.1)
+
+    old_dpi, old_facecolor = fig.dpi, fig.get_facecolor()
+    try:
+        fig.set_dpi(WEB_DPI)
+        fig.set_facecolor(facecolor)
+        fig.canvas.draw()
+        bbox = fig.get_tightbbox(fig.canvas.get_renderer()).padded(pad)
+        pixels = np.asarray(fig.canvas.buffer_rgba())
+    finally:
+        fig.set_dpi(old_dpi)
+        fig.set_facecolor(old_facecolor)
+
+    svg_path = web_dir / f"{stem}.svg"
+    savefig(fig, svg_path, format="svg", bbox_inches=bbox, facecolor=facecolor)
+    written = [svg_path]
+
+    # Crop the raster to the tight box (bbox is in inches, origin bottom-left)
+    height, width = pixels.shape[:2]
+    x0, x1 = max(0, int(bbox.x0 * WEB_DPI)), min(width, int(np.ceil(bbox.x1 * WEB_DPI)))
+    y0 = max(0, height - int(np.ceil(bbox.y1 * WEB_DPI)))
+    y1 = min(height, height - int(bbox.y0 * WEB_DPI))
+    image = Image.fromarray(pixels[y0:y1, x0:x1]).convert("RGB")
+
+    # Downsample from largest to smallest, each step starting from the previous thumbnail
+    for thumb_width in sorted(THUMBNAIL_WIDTHS, reverse=True):
+        thumb_width = min(thumb_width, image.width)
+        thumb_height = round(image.height * thumb_width / image.width)
+        image = image.resize((thumb_width, thumb_height), Image.LANCZOS)
+        for ext, options in (("png", {}), ("webp", {"quality": 85, "method": 4})):
+            path = web_dir / f"{stem}-{thumb_width}.{ext}"
+            image.save(path, **options)
+            written.append(path)
+    return written
+
+
+def _run_chart(
+    path_str: str,
+    seed: Optional[int] = None,
+    output_dir: Optional[str] = None,
+    web_dir: Optional[str] = None,
+) -> ChartResult:
+    """Run a single chart script inside the current (warm) worker."""
+    import matplotlib.pyplot as plt
+    import numpy as np
+
+    path = Path(path_str)
+    outputs, artists = [], []
+    out = io.StringIO()
+    old_cwd = os.getcwd()
+    old_argv = sys.argv
+    ok, error = True, ""
+
+    start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        os.chdir(path.parent)
+        sys.argv = [str(path)]
+        with contextlib.ExitStack() as stack:
+            # rc_context restores rcParams on exit, undoing the script's rcParams.update()
+            stack.enter_context(plt.rc_context())
+            stack.enter_context(
+                _capture_saves(
+                    outputs, artists, output_dir and Path(output_dir), web_dir and Path(web_dir)
+                )
+            )
+            stack.enter_context(contextlib.redirect_stdout(out))
+            stack.enter_context(contextlib.redirect_stderr(out))
+            if seed is not None:
+                random.seed(seed)
+                np.random.seed(seed)
+                plt.rcParams["svg.hashsalt"] = SVG_HASHSALT
+            runpy.run_path(str(path), run_name="__main__")
+    except SystemExit as exc:
+        if exc.code not in (None, 0):
+            ok, error = False, f"SystemExit({exc.code})"
+    except BaseException:
+        ok, error = False, traceback.format_exc()
+    finally:
+        seconds = time.perf_counter() - start
+        cpu_seconds = time.process_time() - cpu_start
+        plt.close("all")
+        sys.argv = old_argv
+        os.chdir(old_cwd)
+
+    return ChartResult(
+        path=path,
+        ok=ok,
+        seconds=seconds,
+        stdout=out.getvalue(),
+        error=error,
+        outputs=outputs,
+        cpu_seconds=cpu_seconds,
+        peak_rss_kb=_peak_rss_kb(),
+        artists=sum(artists),
+    )
+
+
+def _peak_rss_kb() -> int:
+    """High-water resident set size of this worker process in KiB."""
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux reports KiB
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+# ---------------------------------------------------------------------------
+# Parent side
+# ---------------------------------------------------------------------------
+
+
+class RenderEngine:
+    """Pool of pre-warmed worker processes that render chart scripts.
+
+    The pool is started lazily and stays warm until close(), so repeated
+    render() calls reuse the same imported matplotlib. Pass seed=None to turn
+    off deterministic mode. web_dir enables SVG/PNG/WebP export of every PDF
+    into that directory. max_tasks_per_child=1 gives every chart a fresh
+    worker, which makes peak_rss_kb a per-chart figure (at the cost of warmth).
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        seed: Optional[int] = DEFAULT_SEED,
+        max_tasks_per_child: Optional[int] = None,
+        web_dir: Optional[Path] = None,
+    ):
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.timeout = timeout
+        self.seed = seed
+        self.max_tasks_per_child = max_tasks_per_child
+        self.web_dir = web_dir
+        self._pool = None
+
+    def __enter__(self) -> "RenderEngine":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.terminate()
+
+    def start(self) -> "RenderEngine":
+        """Spawn the worker pool if it is not running yet."""
+        if self._pool is None:
+            ctx = multiprocessing.get_context("spawn")
+            self._pool = ctx.Pool(
+                self.workers,
+                initializer=_init_worker,
+                initargs=(self.seed is not None,),
+                maxtasksperchild=self.max_tasks_per_child,
+            )
+        return self
+
+    def close(self):
+        """Let workers finish and shut the pool down."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def terminate(self):
+        """Kill workers immediately, e.g. after a chart hangs."""
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+    def render(
+        self, paths: Iterable[Path], output_dir: Optional[Path] = None
+    ) -> Iterator[ChartResult]:
+        """Render charts across the pool, yielding results in input order.
+
+        Charts are handed out one at a time, so the pool balances them across
+        workers. With output_dir, files a chart saves go to
+        output_dir/<chart folder>/ instead of next to the script.
+
+        A chart that exceeds the timeout is reported as failed; the pool is
+        then restarted and the remaining charts are resubmitted.
+        """
+        pending = [Path(p) for p in paths]
+        while pending:
+            self.start()
+            jobs = [
+                self._pool.apply_async(
+                    _run_chart,
+                    (
+                        str(p),
+                        self.seed,
+                        output_dir and str(Path(output_dir) / p.parent.name),
+                        self.web_dir and str(self.web_dir),
+                    ),
+                )
+                for p in pending
+            ]
+            for index, (path, job) in enumerate(zip(pending, jobs)):
+                try:
+                    yield job.get(timeout=self.timeout)
+                except multiprocessing.TimeoutError:
+                    yield ChartResult(
+                        path=path,
+                        ok=False,
+                        seconds=float(self.timeout),
+                        error=f"Timed out after {self.timeout}s",
+                    )
+                    self.terminate()
+                    pending = pending[index + 1 :]
+                    break
+            else:
+                pending = []
+
+    def render_one(self, path: Path, output_dir: Optional[Path] = None) -> ChartResult:
+        """Render a single chart in a warm worker."""
+        return next(self.render([path], output_dir))
+
+
+def render_subprocess(
+    path: Path, timeout: float = DEFAULT_TIMEOUT, seed: Optional[int] = DEFAULT_SEED
+) -> ChartResult:
+    """Render a chart in a fresh interpreter (the old one-process-per-chart path)."""
+    path = Path(path)
+    if seed is None:
+        cmd, env = [sys.executable, str(path)], None
+    else:
+        cmd = [sys.executable, "-c", _SUBPROCESS_BOOTSTRAP, str(path), str(seed), SVG_HASHSALT]
+        env = deterministic_env()
+
+    start = time.perf_counter()
+    try:
+        result = subprocess.run(
+            cmd,
+            cwd=str(path.parent),
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            env=env,
+        )
+    except subprocess.TimeoutExpired:
+        return ChartResult(
+            path=path,
+            ok=False,
+            seconds=time.perf_counter() - start,
+            error=f"Timed out after {timeout}s",
+            mode="subprocess",
+        )
+    return ChartResult(
+        path=path,
+        ok=result.returncode == 0,
+        seconds=time.perf_counter() - start,
+        stdout=result.stdout,
+        error=result.stderr if result.returncode != 0 else "",
+        mode="subprocess",
+    )
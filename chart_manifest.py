@@ -0,0 +1,181 @@
+"""
+Content-addressed build manifest for incremental chart rendering.
+
+For every chart the manifest stores hashes of its inputs (script source, its
+rcParams block, shared CSV data, the render engine, library versions, render
+seed and whether web formats are exported) together with the hash of the PDF
+it produced. A chart is skipped when its inputs are unchanged and its recorded
+PDF is still on disk, so a no-op rebuild only costs a few file reads instead
+of 48 renders. Charts are rendered deterministically, so the recorded PDF hash
+is stable and can be used as a cache key downstream.
+"""
+
+import hashlib
+import json
+import os
+import platform
+import re
+import subprocess
+from datetime import datetime, timezone
+from importlib import metadata
+from pathlib import Path
+from typing import Optional
+
+ROOT = Path(__file__).parent
+MANIFEST_PATH = ROOT / ".chart_manifest.json"
+MANIFEST_VERSION = 1
+
+# Files that shape every render; a change to any of them invalidates all charts
+ENGINE_FILES = [ROOT / "chart_engine.py"]
+
+# Shared chart data (CSV) read by chart scripts and by chart_specs.py
+DATA_DIR = ROOT / "docs" / "_data" / "chart_specs"
+
+RC_BLOCK_PATTERN = re.compile(r"rcParams\.update\(\s*\{.*?\}\s*\)", re.DOTALL)
+
+
+def sha256_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def sha256_file(path: Path) -> str:
+    return sha256_bytes(Path(path).read_bytes())
+
+
+def library_versions() -> dict[str, str]:
+    """Versions of the libraries that affect chart output (without importing them)."""
+    versions = {"python": platform.python_version()}
+    for package in ("matplotlib", "numpy"):
+        try:
+            versions[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            versions[package] = "missing"
+    return versions
+
+
+def engine_hash() -> str:
+    """Hash of the shared render engine sources."""
+    digest = hashlib.sha256()
+    for path in ENGINE_FILES:
+        if path.exists():
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def expected_output(chart_path: Path) -> Path:
+    """PDF written by a chart script, e.g. 01_agent_definition/agent_definition.pdf."""
+    return chart_path.with_suffix(".pdf")
+
+
+def chart_data_files(chart_path: Path, data_dir: Optional[Path] = None) -> list[Path]:
+    """Shared CSV files a chart script reads, found by file name in its source."""
+    data_dir = data_dir or DATA_DIR
+    source = chart_path.read_text(encoding="utf-8", errors="replace")
+    return [path for path in sorted(data_dir.glob("*.csv")) if path.name in source]
+
+
+def chart_inputs(
+    chart_path: Path, versions: dict, engine: str, seed: Optional[int] = None, web: bool = False
+) -> dict:
+    """Collect the hashed inputs that determine a chart's output, including its CSV data."""
+    source = chart_path.read_bytes()
+    rc_match = RC_BLOCK_PATTERN.search(source.decode("utf-8", errors="replace"))
+    rc_block = rc_match.group(0) if rc_match else ""
+    return {
+        "source": sha256_bytes(source),
+        "rcparams": sha256_bytes(rc_block.encode("utf-8")),
+        "data": {path.name: sha256_file(path) for path in chart_data_files(chart_path)},
+        "engine": engine,
+        "versions": versions,
+        "seed": seed,
+        "web": web,
+    }
+
+
+def inputs_key(inputs: dict) -> str:
+    """Single content address for a chart's inputs."""
+    return sha256_bytes(json.dumps(inputs, sort_keys=True).encode("utf-8"))
+
+
+def load_manifest(path: Optional[Path] = None) -> dict:
+    """Load the manifest, starting fresh if it is missing or from another version."""
+    try:
+        manifest = json.loads(Path(path or MANIFEST_PATH).read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {"version": MANIFEST_VERSION, "charts": {}}
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {"version": MANIFEST_VERSION, "charts": {}}
+    return manifest
+
+
+def save_manifest(manifest: dict, path: Optional[Path] = None):
+    """Write the manifest atomically so an interrupted build cannot corrupt it."""
+    path = Path(path or MANIFEST_PATH)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _output_matches(record: dict, output: Path) -> bool:
+    """Check the recorded PDF is still on disk, re-hashing only if its stat changed."""
+    try:
+        stat = output.stat()
+    except FileNotFoundError:
+        return False
+    if stat.st_size == record.get("size") and stat.st_mtime_ns == record.get("mtime_ns"):
+        return True
+    return stat.st_size == record.get("size") and sha256_file(output) == record.get("sha256")
+
+
+def is_up_to_date(manifest: dict, chart_path: Path, inputs: dict, root: Path = ROOT) -> bool:
+    """True if the chart was rendered from identical inputs and its PDF is intact."""
+    entry = manifest["charts"].get(chart_path.relative_to(root).as_posix())
+    if not entry or entry.get("inputs_key") != inputs_key(inputs):
+        return False
+    return _output_matches(entry.get("output", {}), expected_output(chart_path))
+
+
+def record_render(
+    manifest: dict, chart_path: Path, inputs: dict, seconds: float, root: Path = ROOT
+):
+    """Store the inputs and resulting PDF hash of a successful render."""
+    output = expected_output(chart_path)
+    stat = output.stat()
+    manifest["charts"][chart_path.relative_to(root).as_posix()] = {
+        "inputs": inputs,
+        "inputs_key": inputs_key(inputs),
+        "output": {
+            "path": output.relative_to(root).as_posix(),
+            "sha256": sha256_file(output),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        },
+        "seconds": round(seconds, 4),
+        "rendered_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+
+
+def changed_since(rev: str, root: Path = ROOT) -> Optional[set[Path]]:
+    """Chart scripts and CSV data changed since a git revision, including untracked files.
+
+    Returns None when a shared engine file changed, meaning every chart is affected.
+    """
+    diff = subprocess.run(
+        ["git", "diff", "--name-only", rev, "--"],
+        cwd=root,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.splitlines()
+    untracked = subprocess.run(
+        ["git", "ls-files", "--others", "--exclude-standard"],
+        cwd=root,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.splitlines()
+
+    changed = {(root / name).resolve() for name in diff + untracked}
+    if any(path.resolve() in changed for path in ENGINE_FILES):
+        return None
+    return {path for path in changed if path.suffix in (".py", ".csv")}
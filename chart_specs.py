@@ -0,0 +1,352 @@
+"""
+Render declarative chart specs in batch.
+
+Each YAML file in docs/_data/chart_specs describes one chart (its CSV data,
+axes and series) plus a list of variants: themes, figure sizes, translated
+labels and data transforms. All variants of all specs are rendered in a
+single warm process: every CSV is parsed once into a NumPy matrix, and
+transforms such as normalization are applied to the whole matrix at once
+instead of per series.
+
+The Beamer PDFs are still produced by the chart scripts in L*/, which read
+the same CSV files, so slide and web variants never drift apart.
+
+Usage:
+    python chart_specs.py
+    python chart_specs.py --spec coordination_overhead --variant dark
+    python chart_specs.py --format svg --format png --output-dir /tmp/variants
+"""
+
+import argparse
+import copy
+import csv
+import os
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+import yaml
+
+from chart_engine import SOURCE_DATE_EPOCH, SVG_HASHSALT
+
+ROOT = Path(__file__).parent
+SPEC_DIR = ROOT / "docs" / "_data" / "chart_specs"
+OUTPUT_DIR = ROOT / "docs" / "assets" / "charts" / "variants"
+
+# ML Course color palette, referenced by name from the specs
+PALETTE = {
+    "MLPURPLE": "#3333B2",
+    "MLLAVENDER": "#ADADE0",
+    "MLBLUE": "#0066CC",
+    "MLORANGE": "#FF7F0E",
+    "MLGREEN": "#2CA02C",
+    "MLRED": "#D62728",
+    "MLGRAY": "#7F7F7F",
+}
+
+# Same sizing as the chart scripts (Beamer slides at 70% display)
+BASE_RC = {
+    "font.size": 24,
+    "axes.labelsize": 22,
+    "axes.titlesize": 24,
+    "xtick.labelsize": 16,
+    "ytick.labelsize": 16,
+    "legend.fontsize": 14,
+    "figure.figsize": (10, 6),
+    "figure.dpi": 150,
+    "font.family": "sans-serif",
+    "svg.hashsalt": SVG_HASHSALT,
+}
+
+THEMES = {
+    "light": {
+        "rc": {"figure.facecolor": "white", "axes.facecolor": "white"},
+        "title_color": PALETTE["MLPURPLE"],
+    },
+    "dark": {
+        "rc": {
+            "figure.facecolor": "#1E1E2E",
+            "axes.facecolor": "#1E1E2E",
+            "savefig.facecolor": "#1E1E2E",
+            "axes.edgecolor": "#CDD6F4",
+            "axes.labelcolor": "#CDD6F4",
+            "text.color": "#CDD6F4",
+            "xtick.color": "#CDD6F4",
+            "ytick.color": "#CDD6F4",
+            "legend.facecolor": "#313244",
+            "legend.edgecolor": "#45475A",
+        },
+        "title_color": PALETTE["MLLAVENDER"],
+    },
+}
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    """Scale every column to percent of its largest absolute value."""
+    peak = np.abs(matrix).max(axis=0)
+    return np.divide(matrix * 100, peak, out=np.zeros_like(matrix), where=peak != 0)
+
+
+def _relative(matrix: np.ndarray) -> np.ndarray:
+    """Express every column as a multiple of its first row."""
+    first = matrix[0]
+    return np.divide(matrix, first, out=np.zeros_like(matrix), where=first != 0)
+
+
+TRANSFORMS = {
+    "normalize": _normalize,
+    "relative": _relative,
+    "cumulative": lambda matrix: np.cumsum(matrix, axis=0),
+}
+
+
+@dataclass
+class Dataset:
+    """A spec's CSV with its series columns stacked into one float matrix."""
+
+    x: list[str]
+    columns: list[str]
+    matrix: np.ndarray
+
+    def column(self, name: str) -> np.ndarray:
+        return self.matrix[:, self.columns.index(name)]
+
+    def transformed(self, transform: Optional[str]) -> "Dataset":
+        if not transform:
+            return self
+        if transform not in TRANSFORMS:
+            raise ValueError(
+                f"Unknown transform '{transform}' (expected one of {sorted(TRANSFORMS)})"
+            )
+        return Dataset(self.x, self.columns, TRANSFORMS[transform](self.matrix))
+
+
+def discover_specs(spec_dir: Path = SPEC_DIR) -> list[Path]:
+    return sorted(spec_dir.glob("*.yml"))
+
+
+def load_spec(path: Path) -> dict:
+    with open(path, encoding="utf-8") as f:
+        spec = yaml.safe_load(f)
+    spec["name"] = path.stem
+    spec["path"] = path
+    return spec
+
+
+def load_dataset(spec: dict) -> Dataset:
+    """Parse the spec's CSV once; series columns become a (rows, series) matrix."""
+    with open(spec["path"].parent / spec["data"], encoding="utf-8", newline="") as f:
+        rows = list(csv.DictReader(f))
+    columns = [series["column"] for series in spec["series"]]
+    matrix = np.array([[row[c] for c in columns] for row in rows], dtype=float)
+    x = [row[spec["x"]] for row in rows]
+    if spec.get("wrap_labels"):
+        x = [label.replace(" ", "\n") for label in x]
+    if spec.get("x_suffix"):
+        x = [f"{label}\n{row[spec['x_suffix']]}K" for label, row in zip(x, rows)]
+    return Dataset(x, columns, matrix)
+
+
+def resolve_variant(spec: dict, variant: dict) -> dict:
+    """Apply a variant's overrides (labels, axes, figsize, theme) to a copy of the spec."""
+    resolved = copy.deepcopy({k: v for k, v in spec.items() if k not in ("variants", "path")})
+    resolved["variant"] = variant["name"]
+    resolved["theme"] = variant.get("theme", "light")
+    resolved["figsize"] = tuple(variant.get("figsize", BASE_RC["figure.figsize"]))
+    resolved["transform"] = variant.get("transform")
+    for key in ("title", "x_label", "legend"):
+        if key in variant:
+            resolved[key] = variant[key]
+    for side, overrides in variant.get("axes", {}).items():
+        resolved["axes"].setdefault(side, {}).update(overrides)
+    labels = variant.get("series", {})
+    for series in resolved["series"]:
+        series["label"] = labels.get(series["column"], series["label"])
+    if "highlight" in variant and "highlight" in resolved:
+        resolved["highlight"]["label"] = variant["highlight"]
+    return resolved
+
+
+def _color(name: Optional[str]) -> Optional[str]:
+    return PALETTE.get(name, name) if name else None
+
+
+def _style_axis(ax, axis: dict):
+    color = _color(axis.get("color"))
+    ax.set_ylabel(axis["label"])
+    if color:
+        ax.yaxis.label.set_color(color)
+        ax.tick_params(axis="y", labelcolor=color)
+    if "ylim" in axis:
+        ax.set_ylim(*axis["ylim"])
+
+
+def _plot_dual_axis_line(fig, chart: dict, data: Dataset):
+    ax1 = fig.subplots()
+    ax2 = ax1.twinx()
+    x = np.array(data.x, dtype=float)
+    for series in chart["series"]:
+        ax = ax1 if series.get("axis", "left") == "left" else ax2
+        ax.plot(
+            x,
+            data.column(series["column"]),
+            series.get("style", "o-"),
+            linewidth=3,
+            markersize=10,
+            color=_color(series.get("color")),
+            label=series["label"],
+        )
+    highlight = chart.get("highlight")
+    if highlight:
+        color = _color(highlight.get("color"))
+        ax1.axvspan(*highlight["span"], alpha=0.15, color=color, label=highlight["label"])
+    _style_axis(ax1, chart["axes"]["left"])
+    _style_axis(ax2, chart["axes"]["right"])
+    ax1.spines["top"].set_visible(False)
+    return ax1, [ax1, ax2]
+
+
+def _plot_dual_axis_bar(fig, chart: dict, data: Dataset):
+    ax1 = fig.subplots()
+    ax2 = ax1.twinx()
+    x = np.arange(len(data.x))
+    width = 0.8 / len(chart["series"])
+    for i, series in enumerate(chart["series"]):
+        ax = ax1 if series.get("axis", "left") == "left" else ax2
+        offset = (i - (len(chart["series"]) - 1) / 2) * width
+        ax.bar(
+            x + offset,
+            data.column(series["column"]),
+            width,
+            color=_color(series.get("color")),
+            alpha=0.85,
+            label=series["label"],
+        )
+    ax1.set_xticks(x)
+    ax1.set_xticklabels(data.x, fontsize=12)
+    _style_axis(ax1, chart["axes"]["left"])
+    _style_axis(ax2, chart["axes"]["right"])
+    return ax1, [ax1, ax2]
+
+
+def _plot_grouped_bar(fig, chart: dict, data: Dataset):
+    ax = fig.subplots()
+    x = np.arange(len(data.x))
+    width = 0.8 / len(chart["series"])
+    for i, series in enumerate(chart["series"]):
+        ax.bar(
+            x + i * width,
+            data.column(series["column"]),
+            width,
+            color=_color(series.get("color")),
+            alpha=0.85,
+            label=series["label"],
+        )
+    ax.set_xticks(x + width * (len(chart["series"]) - 1) / 2)
+    ax.set_xticklabels(data.x, fontsize=10)
+    _style_axis(ax, chart["axes"]["left"])
+    ax.yaxis.grid(True, alpha=0.3)
+    ax.set_axisbelow(True)
+    return ax, [ax]
+
+
+KINDS = {
+    "dual_axis_line": _plot_dual_axis_line,
+    "dual_axis_bar": _plot_dual_axis_bar,
+    "grouped_bar": _plot_grouped_bar,
+}
+
+
+def render_variant(chart: dict, data: Dataset, output_dir: Path, formats: list[str]) -> list[Path]:
+    """Draw one resolved variant and save it in every requested format."""
+    theme = THEMES[chart["theme"]]
+    with plt.rc_context({**BASE_RC, **theme["rc"], "figure.figsize": chart["figsize"]}):
+        fig = plt.figure()
+        main_ax, axes = KINDS[chart["kind"]](fig, chart, data)
+        main_ax.set_xlabel(chart["x_label"])
+        main_ax.set_title(chart["title"], fontweight="bold", color=theme["title_color"])
+        handles, labels = [], []
+        for ax in axes:
+            h, l = ax.get_legend_handles_labels()
+            handles += h
+            labels += l
+        main_ax.legend(handles, labels, loc=chart.get("legend", "best"), framealpha=0.9)
+        fig.tight_layout()
+
+        outputs = []
+        stem = f"{chart['id']}-{chart['variant']}"
+        for fmt in formats:
+            path = output_dir / f"{stem}.{fmt}"
+            fig.savefig(path, dpi=150, bbox_inches="tight")
+            outputs.append(path)
+        plt.close(fig)
+    return outputs
+
+
+def render_specs(
+    spec_paths: list[Path],
+    output_dir: Path = OUTPUT_DIR,
+    variants: Optional[list[str]] = None,
+    formats: tuple[str, ...] = ("svg", "png"),
+) -> list[Path]:
+    """Render every (or every selected) variant of the given specs in this process."""
+    os.environ.setdefault("SOURCE_DATE_EPOCH", SOURCE_DATE_EPOCH)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    outputs = []
+    for spec_path in spec_paths:
+        spec = load_spec(spec_path)
+        if spec["kind"] not in KINDS:
+            raise ValueError(f"{spec_path.name}: unknown chart kind '{spec['kind']}'")
+        data = load_dataset(spec)
+        transformed = {}
+        for variant in spec.get("variants", [{"name": "light"}]):
+            if variants and variant["name"] not in variants:
+                continue
+            chart = resolve_variant(spec, variant)
+            if chart["transform"] not in transformed:
+                transformed[chart["transform"]] = data.transformed(chart["transform"])
+            outputs += render_variant(chart, transformed[chart["transform"]], output_dir, formats)
+    return outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Render chart variants from docs/_data/chart_specs"
+    )
+    parser.add_argument("--spec", action="append", help="Spec name to render (default: all)")
+    parser.add_argument("--variant", action="append", help="Variant name to render (default: all)")
+    parser.add_argument("--output-dir", type=Path, default=OUTPUT_DIR, help="Output directory")
+    parser.add_argument(
+        "--format", action="append", dest="formats", help="Output format (default: svg and png)"
+    )
+    args = parser.parse_args()
+
+    spec_paths = discover_specs()
+    if args.spec:
+        spec_paths = [p for p in spec_paths if p.stem in args.spec]
+        if not spec_paths:
+            print(f"No specs named {', '.join(args.spec)} in {SPEC_DIR}")
+            return 1
+
+    start = time.perf_counter()
+    outputs = render_specs(
+        spec_paths,
+        args.output_dir,
+        variants=args.variant,
+        formats=tuple(args.formats or ("svg", "png")),
+    )
+    elapsed = time.perf_counter() - start
+    print(f"Rendered {len(outputs)} files from {len(spec_paths)} specs in {elapsed:.2f}s")
+    print(f"Output: {args.output_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,17 @@
 """
 Create 58 GitHub issues for world-leading GitHub Pages enhancement.
-Run with: python create_enhancement_issues.py
-"""
+Run with: python create_enhancement_issues.py [--dry-run]
 
-import subprocess
-import time
+Reruns are safe: existing issues are matched by title and only updated
+where they differ from ISSUES.
+"""
 
-REPO = "Digital-AI-Finance/agentic-artificial-intelligence"
+from issue_engine import (
+    CACHE_PATH, JOURNAL_PATH, REPO, IssueCache, IssueEngine, Journal, print_operation,
+    sync_summary,
+)
 
-# Milestone titles (gh CLI needs titles, not numbers)
+# Milestone titles (resolved to numbers by the issue engine)
 MILESTONES = {
     "M1": "M1: Content Exposure",
     "M2": "M2: Quiz Completion",
@@ -1239,61 +1242,40 @@ Design printer-friendly layouts.
 ]
 
 
-def create_issue(issue_data):
-    """Create a single GitHub issue using gh CLI."""
-    title = issue_data["title"]
-    body = issue_data["body"]
-    milestone_title = MILESTONES[issue_data["milestone"]]
-    labels = ",".join(issue_data["labels"])
-
-    cmd = [
-        "gh", "issue", "create",
-        "--repo", REPO,
-        "--title", title,
-        "--body", body,
-        "--milestone", milestone_title,
-        "--label", labels
-    ]
-
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-        if result.returncode == 0:
-            # Extract issue number from URL
-            url = result.stdout.strip()
-            print(f"Created: {title} -> {url}")
-            return True
-        else:
-            print(f"Failed: {title}")
-            print(f"Error: {result.stderr}")
-            return False
-    except subprocess.TimeoutExpired:
-        print(f"Timeout: {title}")
-        return False
-    except Exception as e:
-        print(f"Exception: {title} - {e}")
-        return False
-
-
-def main():
-    """Create all 58 issues."""
-    print(f"Creating {len(ISSUES)} issues...")
-    print("=" * 60)
+def issue_payload(issue_data):
+    """Issue as sent to the API: milestone key replaced by its title."""
+    return {
+        "title": issue_data["title"],
+        "body": issue_data["body"],
+        "labels": issue_data["labels"],
+        "milestone": MILESTONES[issue_data["milestone"]],
+    }
+
 
-    success = 0
-    failed = 0
+def main(argv=None):
+    """Create the missing issues and update the ones that differ from ISSUES."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Sync the GitHub Pages enhancement issues")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Show what would be created or updated without changing anything")
+    parser.add_argument("--no-journal", action="store_true",
+                        help="Ignore the journal of completed operations and check every issue")
+    args = parser.parse_args(argv)
+    journal = None if args.no_journal else Journal(JOURNAL_PATH, REPO, batch="enhancement")
+
+    print(f"Syncing {len(ISSUES)} issues...")
+    print("=" * 60)
 
-    for i, issue in enumerate(ISSUES, 1):
-        print(f"\n[{i}/{len(ISSUES)}] ", end="")
-        if create_issue(issue):
-            success += 1
-        else:
-            failed += 1
-        # Small delay to avoid rate limiting
-        time.sleep(0.5)
+    with IssueEngine(REPO, cache=IssueCache(CACHE_PATH, REPO)) as engine:
+        operations = engine.sync([issue_payload(issue) for issue in ISSUES], dry_run=args.dry_run,
+                                 journal=journal,
+                                 on_operation=lambda op: print_operation(op, args.dry_run))
 
     print("\n" + "=" * 60)
-    print(f"Done! Created: {success}, Failed: {failed}")
+    print(f"Done! {sync_summary(operations, args.dry_run)}")
+    return 1 if any(op.error for op in operations) else 0
 
 
 if __name__ == "__main__":
-    main()
+    exit(main())
@@ -1,6 +1,8 @@
-"""Create GitHub Pages enhancement issues."""
-import subprocess
-import time
+"""Create GitHub Pages enhancement issues (rerun to sync; --dry-run to preview)."""
+from issue_engine import (
+    CACHE_PATH, JOURNAL_PATH, REPO, IssueCache, IssueEngine, Journal, print_operation,
+    sync_summary,
+)
 
 issues = [
     # Category 1: Site Structure and Navigation
@@ -686,42 +688,27 @@ Document maintenance tasks:
     },
 ]
 
-def create_issue(issue):
-    """Create a single GitHub issue."""
-    labels = ",".join(issue["labels"])
-    cmd = [
-        "gh", "issue", "create",
-        "--title", issue["title"],
-        "--body", issue["body"],
-        "--label", labels
-    ]
-
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    if result.returncode == 0:
-        print(f"Created: {issue['title']}")
-        return True
-    else:
-        print(f"Failed: {issue['title']}")
-        print(f"  Error: {result.stderr}")
-        return False
-
-def main():
-    print(f"Creating {len(issues)} GitHub Pages issues...")
-    print("=" * 60)
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Sync the GitHub Pages issues")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Show what would be created or updated without changing anything")
+    parser.add_argument("--no-journal", action="store_true",
+                        help="Ignore the journal of completed operations and check every issue")
+    args = parser.parse_args(argv)
+    journal = None if args.no_journal else Journal(JOURNAL_PATH, REPO, batch="pages")
 
-    success = 0
-    failed = 0
+    print(f"Syncing {len(issues)} GitHub Pages issues...")
+    print("=" * 60)
 
-    for i, issue in enumerate(issues, 1):
-        print(f"\n[{i}/{len(issues)}] ", end="")
-        if create_issue(issue):
-            success += 1
-        else:
-            failed += 1
-        time.sleep(0.5)  # Rate limiting
+    with IssueEngine(REPO, cache=IssueCache(CACHE_PATH, REPO)) as engine:
+        operations = engine.sync(issues, dry_run=args.dry_run, journal=journal,
+                                 on_operation=lambda op: print_operation(op, args.dry_run))
 
     print("\n" + "=" * 60)
-    print(f"Complete: {success} created, {failed} failed")
+    print(f"Complete: {sync_summary(operations, args.dry_run)}")
+    return 1 if any(op.error for op in operations) else 0
 
 if __name__ == "__main__":
-    main()
+    exit(main())
@@ -0,0 +1,123 @@
+/**
+ * Client for the prefix-sharded search index (docs/api/search/)
+ * Built by scripts/build_search_index.py; mirrors its SearchIndex reference lookup.
+ *
+ * Usage:
+ *   CourseSearch.search('self rag').then(function(hits) { ... });
+ *
+ * Only the manifest, the shard for each typed prefix and the document
+ * chunks holding the displayed hits are downloaded; all are cached.
+ */
+
+(function() {
+  'use strict';
+
+  const K1 = 1.2;
+  const STOPWORDS = new Set((
+    'a an and are as at be by can do does for from has have how if in into is it its not ' +
+    'of on or so than that the their then there these this to vs was we what when which ' +
+    'who why will with you your'
+  ).split(' '));
+
+  // api/search/ relative to this script (assets/js/search.js), so it works under any baseurl
+  const script = document.currentScript;
+  const BASE = new URL('../../api/search/', script ? script.src : window.location.href).href;
+
+  const cache = new Map();
+  let manifest = null;
+
+  function fetchJSON(name) {
+    if (!cache.has(name)) {
+      cache.set(name, fetch(BASE + name).then(function(response) {
+        if (!response.ok) throw new Error('Search index: ' + name + ' ' + response.status);
+        return response.json();
+      }).catch(function(error) {
+        cache.delete(name);
+        throw error;
+      }));
+    }
+    return cache.get(name);
+  }
+
+  function loadManifest() {
+    if (!manifest) {
+      manifest = fetchJSON('index.json').then(function(data) {
+        data.shardSet = new Set(data.shards);
+        return data;
+      });
+    }
+    return manifest;
+  }
+
+  function tokenize(text) {
+    return (text.toLowerCase().match(/[a-z0-9]+/g) || []).filter(function(token) {
+      return token.length > 1 && !STOPWORDS.has(token);
+    });
+  }
+
+  function shard(index, prefix) {
+    return index.shardSet.has(prefix) ? fetchJSON(prefix + '.json') : Promise.resolve({});
+  }
+
+  function document_(index, id) {
+    const chunk = Math.floor(id / index.document_chunk);
+    return fetchJSON('docs-' + chunk + '.json').then(function(docs) {
+      return docs[id % index.document_chunk];
+    });
+  }
+
+  function score(index, word, entries) {
+    const matched = new Map();
+    Object.keys(entries).forEach(function(token) {
+      if (!token.startsWith(word)) return;
+      const postings = entries[token];
+      const idf = Math.log(1 + index.documents / postings.length);
+      postings.forEach(function(posting) {
+        const weight = posting[1];
+        matched.set(posting[0], (matched.get(posting[0]) || 0) + idf * weight / (weight + K1));
+      });
+    });
+    return matched;
+  }
+
+  function search(query, limit) {
+    limit = limit || 10;
+    return loadManifest().then(function(index) {
+      const words = tokenize(query).filter(function(word) {
+        return word.length >= index.prefix_length;
+      });
+      if (!words.length) return [];
+
+      return Promise.all(words.map(function(word) {
+        return shard(index, word.slice(0, index.prefix_length));
+      })).then(function(shards) {
+        // Every word must match: intersect the per-word score maps
+        let combined = null;
+        words.forEach(function(word, i) {
+          const matched = score(index, word, shards[i]);
+          if (combined === null) {
+            combined = matched;
+            return;
+          }
+          const next = new Map();
+          combined.forEach(function(value, id) {
+            if (matched.has(id)) next.set(id, value + matched.get(id));
+          });
+          combined = next;
+        });
+
+        const ranked = Array.from(combined.entries()).sort(function(a, b) {
+          return b[1] - a[1] || a[0] - b[0];
+        }).slice(0, limit);
+
+        return Promise.all(ranked.map(function(entry) {
+          return document_(index, entry[0]).then(function(doc) {
+            return Object.assign({ score: entry[1] }, doc);
+          });
+        }));
+      });
+    });
+  }
+
+  window.CourseSearch = { search: search, tokenize: tokenize };
+})();
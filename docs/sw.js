@@ -4,91 +4,169 @@ layout: null
 // Service Worker for Agentic AI Course
 // Provides offline access to course materials
 
-const CACHE_NAME = 'agentic-ai-v1';
-const OFFLINE_URL = '/agentic-artificial-intelligence/offline.html';
-
-// Files to cache immediately
-const PRECACHE_URLS = [
-  '/agentic-artificial-intelligence/',
-  '/agentic-artificial-intelligence/syllabus',
-  '/agentic-artificial-intelligence/getting-started',
-  '/agentic-artificial-intelligence/glossary',
-  '/agentic-artificial-intelligence/papers',
-  '/agentic-artificial-intelligence/faq',
-  '/agentic-artificial-intelligence/offline.html',
-  '/agentic-artificial-intelligence/assets/css/just-the-docs-default.css'
-];
-
-// Install event - cache essential files
+const BASE = '{{ site.baseurl }}';
+const OFFLINE_URL = BASE + '/offline';
+
+// The app shell by content revision; a cache entry is only refetched when its revision changes
+const PRECACHE = 'agentic-ai-precache';
+// Slide PDFs and chart images, cached on first view and trimmed least-recently-used first
+const MEDIA_CACHE = 'agentic-ai-media';
+const MEDIA_MAX_ENTRIES = 120;
+const MEDIA_MAX_BYTES = 80 * 1024 * 1024;
+// Anything else fetched while online (pages, API, search shards), for offline fallback
+const RUNTIME_CACHE = 'agentic-ai-runtime';
+const RUNTIME_MAX_ENTRIES = 200;
+
+const MEDIA_PATTERN = /\.(pdf|png|webp|jpe?g|gif|svg)$/i;
+
+// [{url, revision}] injected at build time by scripts/build_precache.py (empty during `jekyll serve`)
+const PRECACHE_MANIFEST = [];
+
+function cacheKey(entry) {
+  return new URL(BASE + entry.url + '?__rev=' + entry.revision, self.location.origin).href;
+}
+
+// Canonical path of a request: index.html and .html suffixes dropped, as in the manifest
+function canonicalPath(pathname) {
+  return pathname.replace(/\/index\.html$/, '/').replace(/\.html$/, '');
+}
+
+const PRECACHE_KEYS = new Map(PRECACHE_MANIFEST.map(entry => [BASE + entry.url, cacheKey(entry)]));
+
+// Install event - download only the entries whose revision is not cached yet
 self.addEventListener('install', event => {
   event.waitUntil(
-    caches.open(CACHE_NAME)
-      .then(cache => {
-        console.log('Caching essential files');
-        return cache.addAll(PRECACHE_URLS);
-      })
+    caches.open(PRECACHE)
+      .then(cache => cache.keys().then(requests => {
+        const cached = new Set(requests.map(request => request.url));
+        const missing = PRECACHE_MANIFEST.filter(entry => !cached.has(cacheKey(entry)));
+        console.log(`Precaching ${missing.length} of ${PRECACHE_MANIFEST.length} files`);
+        return Promise.all(missing.map(entry =>
+          fetch(BASE + entry.url, { cache: 'reload' }).then(response => {
+            if (!response.ok) {
+              throw new Error(`Precache ${entry.url}: ${response.status}`);
+            }
+            return cache.put(cacheKey(entry), response);
+          })
+        ));
+      }))
       .then(() => self.skipWaiting())
   );
 });
 
-// Activate event - clean up old caches
+// Activate event - drop outdated revisions and caches of older service workers
 self.addEventListener('activate', event => {
+  const current = new Set(PRECACHE_KEYS.values());
   event.waitUntil(
-    caches.keys().then(cacheNames => {
-      return Promise.all(
+    caches.keys()
+      .then(cacheNames => Promise.all(
         cacheNames
-          .filter(cacheName => cacheName !== CACHE_NAME)
+          .filter(cacheName => ![PRECACHE, MEDIA_CACHE, RUNTIME_CACHE].includes(cacheName))
           .map(cacheName => caches.delete(cacheName))
-      );
-    }).then(() => self.clients.claim())
+      ))
+      .then(() => caches.open(PRECACHE))
+      .then(cache => cache.keys().then(requests => Promise.all(
+        requests
+          .filter(request => !current.has(request.url))
+          .map(request => cache.delete(request))
+      )))
+      .then(() => self.clients.claim())
   );
 });
 
-// Fetch event - serve from cache, fall back to network
+// Evict the oldest entries (Cache keys are kept in insertion order) beyond the caps
+function trimCache(cache, maxEntries, maxBytes) {
+  return cache.keys().then(requests =>
+    Promise.all(requests.map(request => cache.match(request).then(response =>
+      response ? Number(response.headers.get('content-length')) || 0 : 0
+    ))).then(sizes => {
+      let count = requests.length;
+      let total = sizes.reduce((sum, size) => sum + size, 0);
+      const deletions = [];
+      for (let i = 0; i < requests.length && (count > maxEntries || total > maxBytes); i++) {
+        deletions.push(cache.delete(requests[i]));
+        count -= 1;
+        total -= sizes[i];
+      }
+      return Promise.all(deletions);
+    })
+  );
+}
+
+function isCacheable(response) {
+  return response && response.status === 200 && response.type === 'basic';
+}
+
+// Cache first; a hit is re-inserted so it becomes the most recently used entry
+function mediaResponse(event) {
+  const request = event.request;
+  return caches.open(MEDIA_CACHE).then(cache =>
+    cache.match(request).then(cached => {
+      if (cached) {
+        const copy = cached.clone();
+        event.waitUntil(cache.put(request, copy));
+        return cached;
+      }
+      return fetch(request).then(response => {
+        if (isCacheable(response)) {
+          event.waitUntil(cache.put(request, response.clone())
+            .then(() => trimCache(cache, MEDIA_MAX_ENTRIES, MEDIA_MAX_BYTES)));
+        }
+        return response;
+      });
+    })
+  );
+}
+
+// Network first, falling back to the last cached copy and then the offline page
+function runtimeResponse(event) {
+  const request = event.request;
+  return fetch(request)
+    .then(response => {
+      if (isCacheable(response)) {
+        const copy = response.clone();
+        event.waitUntil(caches.open(RUNTIME_CACHE).then(cache =>
+          cache.put(request, copy).then(() => trimCache(cache, RUNTIME_MAX_ENTRIES, Infinity))
+        ));
+      }
+      return response;
+    })
+    .catch(() => caches.match(request).then(cached => {
+      if (cached) {
+        return cached;
+      }
+      if (request.mode === 'navigate') {
+        const offlineKey = PRECACHE_KEYS.get(OFFLINE_URL);
+        return offlineKey ? caches.match(offlineKey) : undefined;
+      }
+    }));
+}
+
+// Fetch event - precached files from cache, media LRU-cached, everything else network first
 self.addEventListener('fetch', event => {
-  // Skip cross-origin requests
-  if (!event.request.url.startsWith(self.location.origin)) {
+  const request = event.request;
+
+  // Skip cross-origin and non-GET requests
+  if (!request.url.startsWith(self.location.origin) || request.method !== 'GET') {
     return;
   }
 
-  // Skip non-GET requests
-  if (event.request.method !== 'GET') {
+  // Byte-range requests (PDF viewers) go straight to the network
+  if (request.headers.has('range')) {
     return;
   }
 
-  event.respondWith(
-    caches.match(event.request)
-      .then(cachedResponse => {
-        if (cachedResponse) {
-          // Return cached version
-          return cachedResponse;
-        }
-
-        // Fetch from network
-        return fetch(event.request)
-          .then(response => {
-            // Don't cache non-successful responses
-            if (!response || response.status !== 200 || response.type !== 'basic') {
-              return response;
-            }
-
-            // Cache successful responses
-            const responseToCache = response.clone();
-            caches.open(CACHE_NAME)
-              .then(cache => {
-                cache.put(event.request, responseToCache);
-              });
-
-            return response;
-          })
-          .catch(() => {
-            // Return offline page for navigation requests
-            if (event.request.mode === 'navigate') {
-              return caches.match(OFFLINE_URL);
-            }
-          });
-      })
-  );
+  const pathname = new URL(request.url).pathname;
+  const key = PRECACHE_KEYS.get(canonicalPath(pathname));
+  if (key) {
+    event.respondWith(
+      caches.match(key).then(cached => cached || runtimeResponse(event))
+    );
+  } else if (MEDIA_PATTERN.test(pathname)) {
+    event.respondWith(mediaResponse(event));
+  } else {
+    event.respondWith(runtimeResponse(event));
+  }
 });
 
 // Handle messages from the page
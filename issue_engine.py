@@ -0,0 +1,667 @@
+"""
+Concurrent, rate-limit-aware GitHub issue engine.
+
+Shared by the create_*_issues.py scripts. All requests go through one
+pooled requests.Session against the REST API, a bounded number at a time,
+and are paced by the rate-limit headers GitHub returns instead of fixed
+sleeps:
+
+- X-RateLimit-Remaining / X-RateLimit-Reset: when the budget runs low,
+  workers wait for the reset instead of running into 403s.
+- Retry-After (secondary rate limits, 429s): every worker pauses for the
+  given time, then the request is retried.
+- Secondary limit without Retry-After: pause for a minute, doubling on
+  each repeat, as GitHub asks.
+
+sync() makes reruns idempotent: existing issues are listed once (every
+page), compared with the declared ones by title, body hash, labels and
+milestone, and only the missing issues are created and the differing ones
+edited. With dry_run it only reports the plan. Given a Journal, every
+completed operation is appended to it as it finishes, and a rerun after a
+crash or interruption skips the issues already synced without a request.
+A run that completes without failures clears the journal again.
+
+Given an IssueCache, every GET is sent with the ETag of the last response
+(If-None-Match): an unchanged listing costs a 304, which does not count
+against the rate limit, and titles resolve to issue numbers offline.
+
+The API URL is configurable, so the engine can be exercised against a local
+stub server (see tests/test_issue_engine.py).
+
+Usage:
+    engine = IssueEngine()                  # token from GITHUB_TOKEN/GH_TOKEN or `gh auth token`
+    results = engine.create_issues([{'title': ..., 'body': ..., 'labels': [...],
+                                     'milestone': 'M1: Content Exposure'}])
+    operations = engine.sync(declared_issues, dry_run=True)
+    operations = engine.sync(declared_issues, journal=Journal(JOURNAL_PATH))
+    engine = IssueEngine(cache=IssueCache(CACHE_PATH))    # conditional GETs, saved on close()
+"""
+
+import hashlib
+import json
+import os
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+REPO = "Digital-AI-Finance/agentic-artificial-intelligence"
+API_URL = "https://api.github.com"
+
+# Concurrent requests; GitHub penalizes bursts of content creation with secondary limits
+DEFAULT_WORKERS = 4
+# Requests kept in reserve before waiting for the primary limit to reset
+RESERVE = 5
+# First pause after a secondary limit without Retry-After (doubles on repeats)
+SECONDARY_PAUSE = 60.0
+MAX_RETRIES = 5
+# Completed sync operations, so an interrupted batch resumes where it stopped
+JOURNAL_PATH = Path(__file__).parent / '.issue_journal.jsonl'
+# Remote issue state and the ETags it was served with
+CACHE_PATH = Path(__file__).parent / '.issue_cache.json'
+
+
+class IssueError(Exception):
+    """An API request that failed for good."""
+
+    def __init__(self, message, status=None):
+        super().__init__(message)
+        self.status = status
+
+
+@dataclass
+class IssueResult:
+    title: str
+    number: Optional[int] = None
+    url: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+@dataclass
+class SyncOperation:
+    # 'create', 'update', 'unchanged', 'missing' (not created) or 'journaled' (done earlier)
+    action: str
+    title: str
+    number: Optional[int] = None
+    changes: list[str] = field(default_factory=list)  # fields that differ
+    payload: dict = field(default_factory=dict)  # what is sent for them
+    error: Optional[str] = None
+    key: str = ''  # issue_id() of the declared issue
+    digest: str = ''  # declared_digest() of the declared issue
+
+
+def body_hash(body):
+    """Hash of an issue body, ignoring line endings and trailing whitespace."""
+    lines = (body or '').replace('\r\n', '\n').split('\n')
+    text = '\n'.join(line.rstrip() for line in lines).strip()
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
+
+
+def issue_summary(issue):
+    """The parts of an API issue object a sync needs, with the body reduced to its hash."""
+    summary = {
+        'number': issue['number'],
+        'title': issue['title'],
+        'body_hash': body_hash(issue.get('body')),
+        'labels': [{'name': label['name']} for label in issue.get('labels', [])],
+        'milestone': {'title': issue['milestone']['title']} if issue.get('milestone') else None,
+        'state': issue.get('state'),
+        'html_url': issue.get('html_url'),
+    }
+    if 'pull_request' in issue:
+        summary['pull_request'] = True
+    return summary
+
+
+def title_key(title):
+    """Titles match regardless of case and spacing."""
+    return ' '.join(title.split()).casefold()
+
+
+def issue_id(issue):
+    """Stable key of a declared issue: its id, else its number, else its normalized title."""
+    if 'id' in issue:
+        return str(issue['id'])
+    if 'number' in issue:
+        return f"#{issue['number']}"
+    return title_key(issue['title'])
+
+
+def declared_digest(issue):
+    """Hash of the declared content of an issue (the fields a sync compares)."""
+    content = {
+        'title': issue['title'],
+        'body': body_hash(issue['body']) if 'body' in issue else None,
+        'labels': sorted(issue['labels']) if 'labels' in issue else None,
+        'milestone': issue.get('milestone', ''),
+    }
+    return hashlib.sha256(json.dumps(content, sort_keys=True).encode()).hexdigest()[:16]
+
+
+class Journal:
+    """Append-only record of the completed operations of an unfinished batch, keyed by issue_id().
+
+    Every create or update that succeeded (and every issue found unchanged)
+    is appended as one JSON line and flushed to disk immediately, so a run
+    that crashes or is interrupted loses nothing: the rerun skips every
+    issue journaled with the same declared content and picks up the rest.
+    Once a run completes without failures the batch is cleared, so the next
+    run compares every issue with GitHub again. Batches (one per script)
+    share the file without touching each other's entries.
+    """
+
+    def __init__(self, path, repo=REPO, batch='default'):
+        self.path = Path(path)
+        self.repo = repo
+        self.batch = batch
+        self.entries = {}
+        self.lock = threading.Lock()
+        for entry in self._read():
+            if self._owns(entry):
+                self.entries[entry['id']] = entry
+
+    def _read(self):
+        if not self.path.exists():
+            return []
+        entries = []
+        for line in self.path.read_text(encoding='utf-8').splitlines():
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                continue  # a line cut short by a crash
+        return entries
+
+    def _owns(self, entry):
+        return entry.get('repo') == self.repo and entry.get('batch', 'default') == self.batch
+
+    def done(self, key, digest):
+        """The journal entry of an issue synced with this declared content, or None."""
+        entry = self.entries.get(key)
+        return entry if entry and entry['digest'] == digest else None
+
+    def record(self, operation):
+        entry = {'repo': self.repo, 'batch': self.batch, 'id': operation.key,
+                 'digest': operation.digest,
+                 'action': operation.action, 'number': operation.number,
+                 'time': time.strftime('%Y-%m-%dT%H:%M:%S')}
+        with self.lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            self.entries[operation.key] = entry
+
+    def clear(self):
+        """Forget the batch (it completed); entries of other batches are kept."""
+        with self.lock:
+            others = [entry for entry in self._read() if not self._owns(entry)]
+            if others:
+                temp = self.path.with_name(self.path.name + '.tmp')
+                temp.write_text(''.join(json.dumps(entry) + '\n' for entry in others),
+                                encoding='utf-8')
+                os.replace(temp, self.path)
+            else:
+                self.path.unlink(missing_ok=True)
+            self.entries = {}
+
+
+def plan_sync(declared, existing, create=True):
+    """Operations turning existing issues (API objects or summaries) into the declared ones.
+
+    A declared issue is {title, body, labels, milestone}; fields it leaves out
+    are not compared. It is matched to an existing issue by title, or by
+    number when it has one. Labels are only added, never removed, so labels set by
+    hand (status, assignee workflow) survive a sync. When a title exists more
+    than once the oldest issue is kept in sync.
+    """
+    by_title, by_number = {}, {}
+    for issue in sorted(existing, key=lambda i: i['number']):
+        by_title.setdefault(title_key(issue['title']), issue)
+        by_number[issue['number']] = issue
+
+    operations = []
+    for issue in declared:
+        key, digest = issue_id(issue), declared_digest(issue)
+        if 'number' in issue:
+            current = by_number.get(issue['number'])
+        else:
+            current = by_title.get(title_key(issue['title']))
+        if current is None:
+            action = 'create' if create else 'missing'
+            payload = {k: v for k, v in issue.items() if k not in ('id', 'number')}
+            operations.append(SyncOperation(action, issue['title'], changes=list(payload),
+                                            payload=payload, key=key, digest=digest))
+            continue
+
+        payload = {}
+        if current['title'] != issue['title']:
+            payload['title'] = issue['title']
+        if 'body' in issue:
+            current_hash = current.get('body_hash') or body_hash(current.get('body'))
+            if current_hash != body_hash(issue['body']):
+                payload['body'] = issue['body']
+        if 'labels' in issue:
+            labels = [label['name'] for label in current.get('labels', [])]
+            added = [label for label in issue['labels'] if label not in labels]
+            if added:
+                payload['labels'] = labels + added
+        if 'milestone' in issue:
+            milestone = (current.get('milestone') or {}).get('title')
+            if milestone != issue['milestone']:
+                payload['milestone'] = issue['milestone']
+        operations.append(SyncOperation('update' if payload else 'unchanged', issue['title'],
+                                        current['number'], list(payload), payload,
+                                        key=key, digest=digest))
+    return operations
+
+
+class IssueCache:
+    """On-disk copy of the remote issue state, kept fresh by conditional requests.
+
+    Every GET response is stored with its ETag; the next time the same URL is
+    requested it is sent with If-None-Match, and an unchanged resource comes
+    back as a bodyless 304 (which GitHub does not count against the rate
+    limit) served from here. Issues are stored as issue_summary()s, so the
+    file holds numbers, titles and body hashes rather than whole bodies, and
+    titles map to numbers without any request.
+    """
+
+    def __init__(self, path, repo=REPO):
+        self.path = Path(path)
+        self.repo = repo
+        self.responses = {}  # URL -> {'etag', 'data', 'next'}
+        self.issues = {}  # number -> issue_summary()
+        self.titles = {}  # title_key() -> number (the oldest issue of a title)
+        self.lock = threading.Lock()
+        self.dirty = False
+        try:
+            state = json.loads(self.path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return
+        if state.get('repo') == repo:
+            self.responses = state.get('responses', {})
+            self.remember(state.get('issues', []))
+            self.dirty = False
+
+    def response(self, url):
+        with self.lock:
+            return self.responses.get(url)
+
+    def store_response(self, url, etag, data, next_url=None):
+        with self.lock:
+            self.responses[url] = {'etag': etag, 'data': data, 'next': next_url}
+            self.dirty = True
+
+    def remember(self, issues):
+        """Record the current state of issues (summaries)."""
+        with self.lock:
+            for issue in issues:
+                if 'pull_request' in issue:
+                    continue
+                old = self.issues.get(issue['number'])
+                if old and self.titles.get(title_key(old['title'])) == old['number']:
+                    del self.titles[title_key(old['title'])]
+                self.issues[issue['number']] = issue
+                key = title_key(issue['title'])
+                if key not in self.titles or issue['number'] < self.titles[key]:
+                    self.titles[key] = issue['number']
+            self.dirty = True
+
+    def number(self, title):
+        """Number of the issue with this title as last seen, or None."""
+        with self.lock:
+            return self.titles.get(title_key(title))
+
+    def save(self):
+        """Write the cache if it changed (atomically, so a crash never leaves half a file)."""
+        with self.lock:
+            if not self.dirty:
+                return
+            state = {'repo': self.repo, 'responses': self.responses,
+                     'issues': sorted(self.issues.values(), key=lambda i: i['number'])}
+            temp = self.path.with_name(self.path.name + '.tmp')
+            temp.write_text(json.dumps(state), encoding='utf-8')
+            os.replace(temp, self.path)
+            self.dirty = False
+
+
+class RateLimiter:
+    """Pacing shared by all workers, driven by the headers of every response."""
+
+    def __init__(self, reserve=RESERVE, clock=time.time, sleep=time.sleep):
+        self.reserve = reserve
+        self.clock = clock
+        self.sleep = sleep
+        self.remaining = None
+        self.reset = 0.0
+        self.paused_until = 0.0
+        self.secondary_hits = 0
+        self.lock = threading.Lock()
+
+    def wait(self):
+        """Block until a request may be sent."""
+        while True:
+            with self.lock:
+                now = self.clock()
+                until = self.paused_until
+                if self.remaining is not None and self.remaining <= self.reserve:
+                    if self.reset > now:
+                        until = max(until, self.reset)
+                    else:
+                        self.remaining = None  # window has reset
+                if until <= now:
+                    if self.remaining is not None:
+                        self.remaining -= 1  # claim one request of the budget
+                    return
+            self.sleep(until - now)
+
+    def update(self, response):
+        """Record the limit state of a response; returns seconds to wait before a retry, or None."""
+        headers = response.headers
+        with self.lock:
+            if 'X-RateLimit-Remaining' in headers:
+                self.remaining = int(headers['X-RateLimit-Remaining'])
+                self.reset = float(headers.get('X-RateLimit-Reset', 0))
+            if response.status_code not in (403, 429):
+                if response.status_code < 400:
+                    self.secondary_hits = 0
+                return None
+
+            now = self.clock()
+            if 'Retry-After' in headers:
+                delay = float(headers['Retry-After'])
+            elif self.remaining == 0 and self.reset > now:
+                delay = self.reset - now
+            elif 'rate limit' in response.text.lower():
+                delay = SECONDARY_PAUSE * 2 ** self.secondary_hits
+                self.secondary_hits += 1
+            else:
+                return None  # a plain permission error
+            self.paused_until = max(self.paused_until, now + delay)
+            return delay
+
+
+def github_token():
+    """Token from GITHUB_TOKEN/GH_TOKEN, falling back to the gh CLI login."""
+    token = os.environ.get('GITHUB_TOKEN') or os.environ.get('GH_TOKEN')
+    if token:
+        return token
+    try:
+        result = subprocess.run(['gh', 'auth', 'token'], capture_output=True, text=True,
+                                timeout=30)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return result.stdout.strip() or None
+
+
+class IssueEngine:
+    """Issue operations for one repository over a pooled, rate-limited session."""
+
+    def __init__(self, repo=REPO, token=None, api_url=API_URL, workers=DEFAULT_WORKERS,
+                 limiter=None, max_retries=MAX_RETRIES, cache=None):
+        self.repo = repo
+        self.cache = cache
+        self.api_url = api_url.rstrip('/')
+        self.workers = max(1, workers)
+        self.limiter = limiter or RateLimiter()
+        self.max_retries = max_retries
+        self.session = requests.Session()
+        # One connection per worker, reused for every request
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.workers)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'Accept': 'application/vnd.github+json',
+            'X-GitHub-Api-Version': '2022-11-28',
+        })
+        token = token if token is not None else github_token()
+        if token:
+            self.session.headers['Authorization'] = f'Bearer {token}'
+        self._milestones = None
+        self._milestones_lock = threading.Lock()
+
+    def close(self):
+        self.session.close()
+        if self.cache is not None:
+            self.cache.save()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def request(self, method, path, **kwargs):
+        """Send a request (path relative to the API URL), waiting and retrying on rate limits."""
+        url = path if path.startswith('http') else f'{self.api_url}{path}'
+        for attempt in range(self.max_retries + 1):
+            self.limiter.wait()
+            try:
+                response = self.session.request(method, url, timeout=60, **kwargs)
+            except requests.RequestException as e:
+                if attempt == self.max_retries:
+                    raise IssueError(f"{method} {url}: {e}") from e
+                self.limiter.sleep(2 ** attempt)
+                continue
+            delay = self.limiter.update(response)
+            if delay is not None or response.status_code >= 500:
+                if attempt < self.max_retries:
+                    if delay is None:
+                        self.limiter.sleep(2 ** attempt)
+                    continue
+            if response.status_code >= 400:
+                raise IssueError(f"{method} {url}: HTTP {response.status_code} "
+                                 f"{response.text[:200]}", response.status_code)
+            return response
+        raise IssueError(f"{method} {url}: gave up after {self.max_retries} retries")
+
+    def get(self, path, params=None, compact=None):
+        """(data, next page URL) of a GET, conditional on the cached ETag when there is a cache.
+
+        compact() is applied to the response (each item of a list) before it is
+        returned and cached.
+        """
+        url = path if path.startswith('http') else f'{self.api_url}{path}'
+        if params:
+            url = requests.Request('GET', url, params=params).prepare().url
+        cached = self.cache.response(url) if self.cache is not None else None
+        headers = {'If-None-Match': cached['etag']} if cached else {}
+        response = self.request('GET', url, headers=headers)
+        if response.status_code == 304:
+            return cached['data'], cached['next']
+        data = response.json()
+        if compact:
+            data = [compact(item) for item in data] if isinstance(data, list) else compact(data)
+        next_url = response.links.get('next', {}).get('url')
+        if self.cache is not None and response.headers.get('ETag'):
+            self.cache.store_response(url, response.headers['ETag'], data, next_url)
+        return data, next_url
+
+    def paginate(self, path, params=None, compact=None):
+        """All items of a list endpoint, following the Link rel="next" headers."""
+        items = []
+        url, params = path, {'per_page': 100, **(params or {})}
+        while url:
+            data, url = self.get(url, params, compact)
+            items.extend(data)
+            params = None  # the next link carries the query
+        return items
+
+    def milestone_number(self, title):
+        """Number of the milestone with this title (looked up once per engine)."""
+        with self._milestones_lock:
+            if self._milestones is None:
+                milestones = self.paginate(f'/repos/{self.repo}/milestones', {'state': 'all'})
+                self._milestones = {m['title']: m['number'] for m in milestones}
+        if title not in self._milestones:
+            raise IssueError(f"Unknown milestone: {title}")
+        return self._milestones[title]
+
+    def create_issue(self, title, body, labels=(), milestone=None):
+        """Create one issue; milestone is a title. Returns the API's issue object."""
+        payload = {'title': title, 'body': body, 'labels': list(labels)}
+        if milestone:
+            payload['milestone'] = self.milestone_number(milestone)
+        created = self.request('POST', f'/repos/{self.repo}/issues', json=payload).json()
+        if self.cache is not None:
+            self.cache.remember([issue_summary(created)])
+        return created
+
+    def create_issues(self, issues, on_result: Optional[Callable[[IssueResult], None]] = None):
+        """Create issues ({title, body, labels, milestone}) concurrently; results in input order."""
+        def create(issue):
+            try:
+                created = self.create_issue(issue['title'], issue['body'],
+                                            issue.get('labels', ()), issue.get('milestone'))
+                result = IssueResult(issue['title'], created['number'], created['html_url'])
+            except IssueError as e:
+                result = IssueResult(issue['title'], error=str(e))
+            if on_result:
+                on_result(result)
+            return result
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            return list(pool.map(create, issues))
+
+    def list_issues(self, state='all'):
+        """Summaries of every issue of the repository (pull requests excluded), oldest first."""
+        items = self.paginate(f'/repos/{self.repo}/issues',
+                              {'state': state, 'sort': 'created', 'direction': 'asc'},
+                              compact=issue_summary)
+        issues = [item for item in items if 'pull_request' not in item]
+        if self.cache is not None:
+            self.cache.remember(issues)
+        return issues
+
+    def get_issue(self, number):
+        """Summary of one issue."""
+        issue, _ = self.get(f'/repos/{self.repo}/issues/{number}', compact=issue_summary)
+        if self.cache is not None:
+            self.cache.remember([issue])
+        return issue
+
+    def edit_issue(self, number, **fields):
+        """Update fields of an issue; a milestone is given by title (None clears it)."""
+        if fields.get('milestone') is not None:
+            fields['milestone'] = self.milestone_number(fields['milestone'])
+        edited = self.request('PATCH', f'/repos/{self.repo}/issues/{number}', json=fields).json()
+        if self.cache is not None:
+            self.cache.remember([issue_summary(edited)])
+        return edited
+
+    def apply(self, operations, on_operation=None, journal=None):
+        """Run the create and update operations of a sync plan concurrently.
+
+        Each operation that succeeds is recorded in the journal as soon as it
+        completes, whatever order the workers finish in.
+        """
+        def run(operation):
+            try:
+                if operation.action == 'create':
+                    payload = operation.payload
+                    created = self.create_issue(payload['title'], payload.get('body', ''),
+                                                payload.get('labels', ()),
+                                                payload.get('milestone'))
+                    operation.number = created['number']
+                elif operation.action == 'update':
+                    self.edit_issue(operation.number, **operation.payload)
+            except IssueError as e:
+                operation.error = str(e)
+            else:
+                if journal is not None:
+                    journal.record(operation)
+            if on_operation:
+                on_operation(operation)
+            return operation
+
+        pending = [op for op in operations if op.action in ('create', 'update')]
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            list(pool.map(run, pending))
+        return operations
+
+    def sync(self, declared, create=True, dry_run=False, on_operation=None, existing=None,
+             journal=None):
+        """Bring the repository in line with declared issues, touching only what differs.
+
+        Issues the journal records as synced with the same declared content
+        (by an earlier, interrupted run of the batch) are skipped without any
+        request (action 'journaled'); the rest are compared with the existing
+        issues, listed once (all pages) unless given. A run that completes
+        without failures clears the journal. With dry_run the plan is
+        returned without sending anything.
+        """
+        skipped, pending = [], []
+        for issue in declared:
+            key, digest = issue_id(issue), declared_digest(issue)
+            entry = journal.done(key, digest) if journal is not None else None
+            if entry:
+                skipped.append(SyncOperation('journaled', issue['title'], entry['number'],
+                                             key=key, digest=digest))
+            else:
+                pending.append(issue)
+
+        if pending and existing is None:
+            existing = self.list_issues()
+        operations = skipped + plan_sync(pending, existing or [], create=create)
+        # Report in the order of the declarations
+        order = {issue_id(issue): index for index, issue in enumerate(declared)}
+        operations.sort(key=lambda op: order[op.key])
+        if dry_run:
+            if on_operation:
+                for operation in operations:
+                    on_operation(operation)
+            return operations
+        for operation in operations:
+            if operation.action == 'unchanged' and journal is not None:
+                journal.record(operation)
+            if operation.action not in ('create', 'update') and on_operation:
+                on_operation(operation)
+        self.apply(operations, on_operation, journal)
+        if journal is not None and not any(op.error for op in operations):
+            journal.clear()
+        return operations
+
+
+def print_operation(operation, dry_run=False):
+    number = f"#{operation.number} " if operation.number else ''
+    if operation.error:
+        print(f"Failed: {operation.action} {number}{operation.title}")
+        print(f"  Error: {operation.error}")
+    elif operation.action == 'update':
+        verb = 'Would update' if dry_run else 'Updated'
+        print(f"{verb}: {number}{operation.title} ({', '.join(operation.changes)})")
+    elif operation.action == 'create':
+        print(f"{'Would create' if dry_run else 'Created'}: {number}{operation.title}")
+    elif operation.action == 'missing':
+        print(f"Missing: {operation.title}")
+
+
+def sync_summary(operations, dry_run=False):
+    """One-line count of a sync's outcome."""
+    counts = {}
+    for operation in operations:
+        key = 'failed' if operation.error else operation.action
+        counts[key] = counts.get(key, 0) + 1
+    order = ['create', 'update', 'unchanged', 'journaled', 'missing', 'failed']
+    parts = [f"{counts[key]} {key}" for key in order if counts.get(key)]
+    return ("Dry run: " if dry_run else "") + (', '.join(parts) or "nothing to do")
+
+
+def print_result(result):
+    if result.ok:
+        print(f"Created: {result.title} -> {result.url}")
+    else:
+        print(f"Failed: {result.title}")
+        print(f"  Error: {result.error}")
+
@@ -0,0 +1,377 @@
+"""
+Generate the static JSON API (docs/api/*.json) from the site data.
+
+Each endpoint is built from its YAML sources in docs/_data (and the course
+block of docs/_config.yml) and written as minified JSON with precompressed
+.gz and .br siblings. docs/api/manifest.json records, per endpoint, the hash
+of its sources and the content hash / ETag of the output. An endpoint is only
+rebuilt when one of its sources (or this generator) changed, or when its
+output no longer matches the recorded hash; missing compressed siblings are
+recreated without touching the JSON.
+
+Clients and the service worker can compare the manifest's ETags with what
+they have cached and skip refetching unchanged endpoints.
+
+Usage:
+    python scripts/build_api.py            # rebuild what changed
+    python scripts/build_api.py --force    # rebuild every endpoint
+    python scripts/build_api.py --check    # exit 1 if any endpoint is stale
+"""
+
+import gzip
+import hashlib
+import json
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Optional
+
+import yaml
+
+try:
+    import brotli
+except ImportError:  # .br siblings are skipped without the brotli package
+    brotli = None
+
+ROOT = Path(__file__).parent.parent
+DOCS_DIR = ROOT / 'docs'
+API_DIR = DOCS_DIR / 'api'
+MANIFEST_NAME = 'manifest.json'
+MANIFEST_VERSION = 1
+API_VERSION = '1.0'
+
+COLAB_URL = ('https://colab.research.google.com/github/Digital-AI-Finance/'
+             'agentic-artificial-intelligence/blob/main')
+
+
+def sha256_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def etag(data: bytes) -> str:
+    """Strong ETag for an output: a quoted prefix of its SHA-256."""
+    return f'"{sha256_bytes(data)[:16]}"'
+
+
+def minify(obj) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+
+
+def _glossary_entries(data: dict) -> list[dict]:
+    return [
+        {
+            'term': item['term'],
+            'definition': item.get('definition', ''),
+            'related': item.get('related', []),
+            'week': item.get('week'),
+        }
+        for item in data['_data/glossary.yml'] or []
+    ]
+
+
+def _week_titles(data: dict) -> dict[int, str]:
+    return {week['number']: week['title'] for week in data['_data/weeks.yml'] or []}
+
+
+def build_weeks(data: dict) -> dict:
+    keys = ('number', 'title', 'folder', 'description', 'status', 'topics',
+            'learning_objectives', 'papers', 'notebooks')
+    return {
+        'weeks': [{key: week.get(key) for key in keys} for week in data['_data/weeks.yml'] or []],
+        'generated_at': _now(),
+    }
+
+
+def build_glossary(data: dict) -> dict:
+    return {'glossary': _glossary_entries(data)}
+
+
+def build_course(data: dict) -> dict:
+    config = data['_config.yml'] or {}
+    course = config.get('course', {})
+    website = f"{config.get('url', '')}{config.get('baseurl', '')}"
+
+    weeks = []
+    for week in data['_data/weeks.yml'] or []:
+        papers = []
+        for paper in week.get('papers', []):
+            entry = {key: paper[key] for key in ('title', 'authors', 'year') if key in paper}
+            if paper.get('arxiv'):
+                entry['arxiv'] = paper['arxiv']
+                entry['url'] = f"https://arxiv.org/abs/{paper['arxiv']}"
+            elif paper.get('url'):
+                entry['url'] = paper['url']
+            papers.append(entry)
+        weeks.append({
+            'number': week['number'],
+            'title': week['title'],
+            'description': week.get('description', ''),
+            'folder': week['folder'],
+            'status': week.get('status'),
+            'topics': week.get('topics', []),
+            'learning_objectives': week.get('learning_objectives', []),
+            'notebooks': [
+                {
+                    'name': notebook['name'],
+                    'file': notebook['file'],
+                    'colab_url': f"{COLAB_URL}/{week['folder']}/{notebook['file']}",
+                }
+                for notebook in week.get('notebooks', [])
+            ],
+            'papers': papers,
+            'slides_url': f"{website}/slides/{week['folder']}.pdf",
+            'page_url': f"{website}/weeks/week-{week['number']}",
+        })
+
+    instructor = course.get('instructor', {})
+    return {
+        'course': {
+            'name': course.get('name'),
+            'code': course.get('code'),
+            'semester': course.get('semester'),
+            'credits': course.get('credits'),
+            'weeks': course.get('weeks'),
+            'instructor': {key: instructor.get(key) for key in ('name', 'email', 'institution')},
+            'github': course.get('github'),
+            'website': website,
+        },
+        'weeks': weeks,
+        'glossary': _glossary_entries(data),
+        'meta': {'generated_at': _now(), 'api_version': API_VERSION},
+    }
+
+
+def build_charts(data: dict) -> dict:
+    weeks = [
+        {
+            'week': week['week'],
+            'title': week['title'],
+            'folder': week['folder'],
+            'charts': [
+                {key: chart.get(key) for key in ('id', 'name', 'description', 'type', 'topics')}
+                for chart in week.get('charts', [])
+            ],
+        }
+        for week in data['_data/charts.yml'] or []
+    ]
+    return {
+        'charts': weeks,
+        'total_charts': sum(len(week['charts']) for week in weeks),
+        'generated': _now(),
+    }
+
+
+def build_exercises(data: dict) -> dict:
+    titles = _week_titles(data)
+    by_week: dict[int, list] = {}
+    for exercise in data['_data/exercises.yml'] or []:
+        week = exercise['week']
+        exercises = by_week.setdefault(week, [])
+        exercises.append({
+            'id': f"L{week:02d}-E{len(exercises) + 1}",
+            'title': exercise['title'],
+            'description': exercise.get('description', ''),
+            'difficulty': str(exercise.get('difficulty', '')).lower(),
+            'estimated_time': exercise.get('estimated_time'),
+            'total_points': exercise.get('total_points'),
+            'file': exercise.get('file'),
+        })
+    difficulties = Counter(e['difficulty'] for group in by_week.values() for e in group)
+    return {
+        'exercises': [
+            {'week': week, 'title': titles.get(week, ''), 'exercises': exercises}
+            for week, exercises in sorted(by_week.items())
+        ],
+        'total_exercises': sum(difficulties.values()),
+        'difficulty_distribution': dict(sorted(difficulties.items())),
+        'generated': _now(),
+    }
+
+
+def build_quizzes(data: dict) -> dict:
+    titles = _week_titles(data)
+    quizzes = []
+    for key, questions in (data['_data/quizzes.yml'] or {}).items():
+        week = int(key[4:]) if key.startswith('week') and key[4:].isdigit() else None
+        quizzes.append({
+            'week': week,
+            'title': titles.get(week, key),
+            'question_count': len(questions or []),
+        })
+    return {
+        'quizzes': quizzes,
+        'total_quizzes': len(quizzes),
+        'total_questions': sum(quiz['question_count'] for quiz in quizzes),
+        'generated': _now(),
+    }
+
+
+# Endpoint -> (sources relative to docs/, builder)
+ENDPOINTS: dict[str, tuple[tuple[str, ...], Callable[[dict], dict]]] = {
+    'charts': (('_data/charts.yml',), build_charts),
+    'course': (('_config.yml', '_data/weeks.yml', '_data/glossary.yml'), build_course),
+    'exercises': (('_data/exercises.yml', '_data/weeks.yml'), build_exercises),
+    'glossary': (('_data/glossary.yml',), build_glossary),
+    'quizzes': (('_data/quizzes.yml', '_data/weeks.yml'), build_quizzes),
+    'weeks': (('_data/weeks.yml',), build_weeks),
+}
+
+
+def generator_hash() -> str:
+    """Hash of this generator; a change to it rebuilds every endpoint."""
+    return sha256_bytes(Path(__file__).read_bytes())
+
+
+def inputs_key(sources: dict[str, str]) -> str:
+    """Cache key of an endpoint from its source hashes and the generator hash."""
+    return sha256_bytes(minify({'generator': generator_hash(), 'sources': sources}))
+
+
+def load_manifest(api_dir: Path = API_DIR) -> dict:
+    path = api_dir / MANIFEST_NAME
+    if path.exists():
+        try:
+            manifest = json.loads(path.read_text(encoding='utf-8'))
+            if manifest.get('version') == MANIFEST_VERSION:
+                return manifest
+        except (json.JSONDecodeError, OSError):
+            pass
+    return {'version': MANIFEST_VERSION, 'endpoints': {}}
+
+
+def save_manifest(manifest: dict, api_dir: Path = API_DIR):
+    (api_dir / MANIFEST_NAME).write_text(
+        json.dumps(manifest, indent=2, sort_keys=True) + '\n', encoding='utf-8'
+    )
+
+
+def compress(data: bytes) -> dict[str, bytes]:
+    """Precompressed variants by file suffix (.gz always, .br when brotli is installed)."""
+    variants = {'.gz': gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants['.br'] = brotli.compress(data, quality=11)
+    return variants
+
+
+def is_stale(name: str, entry: Optional[dict], key: str, api_dir: Path = API_DIR) -> bool:
+    """Whether an endpoint's JSON must be regenerated."""
+    if entry is None or entry.get('inputs') != key:
+        return True
+    path = api_dir / f'{name}.json'
+    return not path.exists() or sha256_bytes(path.read_bytes()) != entry.get('sha256')
+
+
+def build_api(api_dir: Path = API_DIR, docs_dir: Path = DOCS_DIR, force: bool = False,
+              endpoints: Optional[list[str]] = None) -> dict[str, str]:
+    """Rebuild stale endpoints; returns {endpoint: 'built' | 'compressed' | 'fresh'}."""
+    manifest = load_manifest(api_dir)
+    api_dir.mkdir(parents=True, exist_ok=True)
+    raw_sources: dict[str, bytes] = {}
+    parsed_sources: dict[str, object] = {}
+    status = {}
+
+    for name in endpoints or sorted(ENDPOINTS):
+        sources, builder = ENDPOINTS[name]
+        for source in sources:
+            if source not in raw_sources:
+                path = docs_dir / source
+                raw_sources[source] = path.read_bytes() if path.exists() else b''
+        key = inputs_key({source: sha256_bytes(raw_sources[source]) for source in sources})
+        entry = manifest['endpoints'].get(name)
+        path = api_dir / f'{name}.json'
+
+        if force or is_stale(name, entry, key, api_dir):
+            # Parse each YAML source once, and only for endpoints that are rebuilt
+            for source in sources:
+                if source not in parsed_sources:
+                    parsed_sources[source] = yaml.safe_load(raw_sources[source])
+            # Trailing newline keeps the end-of-file pre-commit hook from rewriting outputs
+            data = minify(builder({source: parsed_sources[source] for source in sources})) + b'\n'
+            path.write_bytes(data)
+            entry = {
+                'file': path.name,
+                'inputs': key,
+                'sources': sources,
+                'sha256': sha256_bytes(data),
+                'etag': etag(data),
+                'bytes': len(data),
+            }
+            status[name] = 'built'
+        else:
+            data = None
+            status[name] = 'fresh'
+
+        for suffix in ('.gz', '.br'):
+            sibling = path.with_name(path.name + suffix)
+            if suffix == '.br' and brotli is None:
+                # Never leave a .br sibling that no longer matches its JSON
+                if status[name] == 'built' and sibling.exists():
+                    sibling.unlink()
+                continue
+            if status[name] == 'built' or not sibling.exists():
+                data = data if data is not None else path.read_bytes()
+                compressed = compress(data)[suffix]
+                sibling.write_bytes(compressed)
+                entry[f'{suffix[1:]}_bytes'] = len(compressed)
+                if status[name] == 'fresh':
+                    status[name] = 'compressed'
+        manifest['endpoints'][name] = entry
+
+    save_manifest(manifest, api_dir)
+    return status
+
+
+def stale_endpoints(api_dir: Path = API_DIR, docs_dir: Path = DOCS_DIR) -> list[str]:
+    """Endpoints whose JSON is out of date with their sources."""
+    manifest = load_manifest(api_dir)
+    stale = []
+    for name, (sources, _) in sorted(ENDPOINTS.items()):
+        hashes = {
+            source: sha256_bytes((docs_dir / source).read_bytes())
+            if (docs_dir / source).exists() else sha256_bytes(b'')
+            for source in sources
+        }
+        if is_stale(name, manifest['endpoints'].get(name), inputs_key(hashes), api_dir):
+            stale.append(name)
+    return stale
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate docs/api/*.json from docs/_data")
+    parser.add_argument('--force', action='store_true', help="Rebuild every endpoint")
+    parser.add_argument('--check', action='store_true',
+                        help="Only report stale endpoints (exit 1 if any)")
+    parser.add_argument('endpoint', nargs='*',
+                        help=f"Endpoints to build (default: all of {', '.join(sorted(ENDPOINTS))})")
+    args = parser.parse_args(argv)
+    unknown = sorted(set(args.endpoint) - set(ENDPOINTS))
+    if unknown:
+        parser.error(f"unknown endpoint(s): {', '.join(unknown)}")
+
+    if args.check:
+        stale = stale_endpoints()
+        for name in stale:
+            print(f"stale  {name}.json")
+        print(f"{len(stale)} of {len(ENDPOINTS)} endpoints stale")
+        return 1 if stale else 0
+
+    status = build_api(force=args.force, endpoints=args.endpoint or None)
+    manifest = load_manifest()
+    for name, state in status.items():
+        entry = manifest['endpoints'][name]
+        sizes = ', '.join(f"{suffix} {entry[f'{suffix}_bytes']} B"
+                          for suffix in ('gz', 'br') if f'{suffix}_bytes' in entry)
+        print(f"{state:10} {name}.json  {entry['bytes']} B ({sizes})  etag {entry['etag']}")
+    if brotli is None:
+        print("brotli not installed: .br siblings skipped (pip install brotli)")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,162 @@
+"""
+Generate the service worker precache manifest from the built site.
+
+Run after `jekyll build`. The app shell (home and offline pages,
+stylesheets, scripts, fonts and icons) in docs/_site gets an entry
+{url, revision}, where revision is a content hash.
+The list is injected into the built sw.js (replacing its empty
+PRECACHE_MANIFEST) and also written to precache-manifest.json. Because the
+manifest is part of sw.js, any asset change produces a new service worker;
+on install it only downloads the entries whose revision it has not cached
+yet, so returning users fetch the delta rather than the whole shell.
+
+Everything else is left out of the manifest on purpose, so first visits stay
+light: slide PDFs and chart images are cached lazily, on first view, in a
+size-capped LRU cache, and the other pages, the JSON API and the search index
+shards (fetched per typed prefix) go to the runtime cache as they are used.
+
+Usage:
+    python scripts/build_precache.py
+    python scripts/build_precache.py --site docs/_site --previous https://.../precache-manifest.json
+"""
+
+import hashlib
+import json
+import re
+import urllib.request
+from pathlib import Path
+from typing import Optional
+
+ROOT = Path(__file__).parent.parent
+SITE_DIR = ROOT / 'docs' / '_site'
+SERVICE_WORKER = 'sw.js'
+MANIFEST_NAME = 'precache-manifest.json'
+
+# PDFs and images are not listed: sw.js caches them lazily (MEDIA_PATTERN, LRU)
+PRECACHE_SUFFIXES = {'.css', '.js', '.woff2', '.ico'}
+# The only pages precached; the rest are runtime-cached on first view
+SHELL_PAGES = {'index.html', 'offline.html'}
+# Fetched on demand (the search shards per typed prefix), never precached
+RUNTIME_DIRS = ('api/',)
+# Larger files are not worth downloading on install
+MAX_PRECACHE_BYTES = 2 * 1024 * 1024
+
+MANIFEST_PLACEHOLDER = re.compile(r'const PRECACHE_MANIFEST = \[.*?\];', re.DOTALL)
+
+
+def revision(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+def site_url(rel_path: str) -> str:
+    """URL (relative to the baseurl) a built file is served at; pages drop .html like site links."""
+    if rel_path == 'index.html' or rel_path.endswith('/index.html'):
+        rel_path = rel_path[:-len('index.html')]
+    elif rel_path.endswith('.html'):
+        rel_path = rel_path[:-len('.html')]
+    return '/' + rel_path
+
+
+def precache_files(site_dir: Path = SITE_DIR) -> list[Path]:
+    """Built files that belong in the precache, in a stable order."""
+    files = []
+    for path in sorted(site_dir.rglob('*')):
+        rel = path.relative_to(site_dir).as_posix()
+        if not path.is_file() or rel.startswith(RUNTIME_DIRS):
+            continue
+        if rel not in SHELL_PAGES and path.suffix not in PRECACHE_SUFFIXES:
+            continue
+        if rel in (SERVICE_WORKER, MANIFEST_NAME):
+            continue
+        if path.stat().st_size > MAX_PRECACHE_BYTES:
+            continue
+        files.append(path)
+    return files
+
+
+def build_manifest(site_dir: Path = SITE_DIR) -> list[dict]:
+    """[{url, revision, size}] for every precached file."""
+    entries = []
+    for path in precache_files(site_dir):
+        data = path.read_bytes()
+        entries.append({
+            'url': site_url(path.relative_to(site_dir).as_posix()),
+            'revision': revision(data),
+            'size': len(data),
+        })
+    return entries
+
+
+def inject(service_worker: str, entries: list[dict]) -> str:
+    """sw.js source with the manifest in place of its PRECACHE_MANIFEST placeholder."""
+    if not MANIFEST_PLACEHOLDER.search(service_worker):
+        raise ValueError(f"{SERVICE_WORKER} has no 'const PRECACHE_MANIFEST = [...];' to replace")
+    listing = json.dumps([{'url': e['url'], 'revision': e['revision']} for e in entries],
+                         separators=(',', ':'))
+    return MANIFEST_PLACEHOLDER.sub(lambda _: f'const PRECACHE_MANIFEST = {listing};',
+                                   service_worker, count=1)
+
+
+def load_previous(source: str) -> Optional[list[dict]]:
+    """A previously published manifest, from a file path or URL (None if unavailable)."""
+    try:
+        if source.startswith(('http://', 'https://')):
+            with urllib.request.urlopen(source, timeout=10) as response:
+                return json.loads(response.read().decode('utf-8'))['entries']
+        return json.loads(Path(source).read_text(encoding='utf-8'))['entries']
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Previous manifest unavailable ({source}): {e}")
+        return None
+
+
+def delta(previous: list[dict], entries: list[dict]) -> dict:
+    """What a client holding the previous precache downloads for the new one."""
+    old = {e['url']: e['revision'] for e in previous}
+    changed = [e for e in entries if old.get(e['url']) != e['revision']]
+    current = {e['url'] for e in entries}
+    return {
+        'changed': len(changed),
+        'changed_bytes': sum(e['size'] for e in changed),
+        'removed': sum(1 for url in old if url not in current),
+    }
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Inject the precache manifest into sw.js")
+    parser.add_argument('--site', type=Path, default=SITE_DIR, help="Built site (jekyll output)")
+    parser.add_argument('--previous', help="Path or URL of the currently deployed manifest, "
+                                           "to report the download delta for returning clients")
+    parser.add_argument('--dry-run', action='store_true', help="Report without writing")
+    args = parser.parse_args(argv)
+
+    sw_path = args.site / SERVICE_WORKER
+    if not sw_path.exists():
+        print(f"No {SERVICE_WORKER} in {args.site}; build the site first")
+        return 1
+
+    entries = build_manifest(args.site)
+    total = sum(e['size'] for e in entries)
+    print(f"Precache: {len(entries)} files, {total / 1024:.1f} KB")
+    if args.previous:
+        previous = load_previous(args.previous)
+        if previous is not None:
+            change = delta(previous, entries)
+            print(f"  returning clients download {change['changed']} changed files "
+                  f"({change['changed_bytes'] / 1024:.1f} KB), {change['removed']} removed")
+
+    if args.dry_run:
+        return 0
+    source = sw_path.read_text(encoding='utf-8')
+    sw_path.write_text(inject(source, entries), encoding='utf-8')
+    manifest = {'version': revision(json.dumps(entries, sort_keys=True).encode()),
+                'entries': entries}
+    (args.site / MANIFEST_NAME).write_text(json.dumps(manifest, indent=1) + '\n',
+                                           encoding='utf-8')
+    print(f"Injected into {sw_path}")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,408 @@
+"""
+Build the prefix-sharded client-side search index for the course site.
+
+Indexes the glossary, weeks, exercises, quizzes and readings
+(docs/_data/*.yml) and the text of every lecture slide into one inverted
+index, then splits it into small JSON shards keyed by the first
+PREFIX_LENGTH characters of each token. The browser loads the tiny manifest
+once and afterwards fetches only the shard for the prefix being typed, plus
+the few document chunks (titles, links and snippets, DOCUMENT_CHUNK per
+file) that hold the hits it displays.
+
+Output (docs/api/search/):
+    index.json       manifest: prefix length, shard prefixes, build metrics
+    <prefix>.json    {"token": [[document, weight], ...], ...}
+    docs-<n>.json    documents n*DOCUMENT_CHUNK.. as [{"type", "title", "url", "week", "snippet"}]
+
+Weights are field-weighted term frequencies (title tokens count
+TITLE_WEIGHT times). Queries match every word as a token prefix and rank
+documents by sum(idf * tf / (tf + K1)); SearchIndex below is the reference
+implementation of that lookup, mirrored by docs/assets/js/search.js, and its
+latency is published with the index size in the manifest.
+
+Usage:
+    python scripts/build_search_index.py
+    python scripts/build_search_index.py --prefix-length 3 --output /tmp/search
+    python scripts/build_search_index.py --query "self rag"
+"""
+
+import gzip
+import json
+import math
+import re
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Optional
+
+import yaml
+
+from corpus_index import lecture_files
+from extract_glossary import extract_week_number
+from frame_index import FrameIndex
+
+ROOT = Path(__file__).parent.parent
+DATA_DIR = ROOT / 'docs' / '_data'
+OUTPUT_DIR = ROOT / 'docs' / 'api' / 'search'
+
+FORMAT_VERSION = 1
+PREFIX_LENGTH = 2
+TITLE_WEIGHT = 5
+K1 = 1.2
+SNIPPET_LENGTH = 160
+DOCUMENT_CHUNK = 8
+
+TOKEN = re.compile(r'[a-z0-9]+')
+STOPWORDS = frozenset("""
+    a an and are as at be by can do does for from has have how if in into is it its not
+    of on or so than that the their then there these this to vs was we what when which
+    who why will with you your
+""".split())
+
+# LaTeX markup that carries no searchable text
+LATEX_COMMENT = re.compile(r'(?<!\\)%.*')
+LATEX_ENVIRONMENT = re.compile(r'\\(?:begin|end)\{[^}]*\}(?:\[[^\]]*\])?(?:\{[^{}]*\})?')
+LATEX_NON_TEXT_ARGUMENT = re.compile(
+    r'\\(?:includegraphics|vspace|hspace|label|ref|cite|url|textcolor|color|colorbox)\*?'
+    r'(?:\[[^\]]*\])?\{[^{}]*\}'
+)
+LATEX_COMMAND = re.compile(r'\\[a-zA-Z]+\*?(?:\[[^\]]*\])?|\\\\(?:\[[^\]]*\])?')
+LATEX_ESCAPE = re.compile(r'\\([%&$#_{}])')
+LATEX_PUNCTUATION = re.compile(r'[{}$&~^]')
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase alphanumeric tokens, without stopwords and single characters."""
+    return [t for t in TOKEN.findall(text.lower()) if len(t) > 1 and t not in STOPWORDS]
+
+
+def slugify(text: str) -> str:
+    """Jekyll's default slugify (used for the glossary anchors)."""
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')
+
+
+def latex_to_text(source: str) -> str:
+    """Readable text of a slide body: comments, environments and markup removed."""
+    text = LATEX_COMMENT.sub('', source)
+    text = LATEX_ENVIRONMENT.sub(' ', text)
+    text = LATEX_NON_TEXT_ARGUMENT.sub(' ', text)
+    text = LATEX_ESCAPE.sub(r'\1 ', text)
+    text = LATEX_COMMAND.sub(' ', text)
+    text = LATEX_PUNCTUATION.sub(' ', text)
+    return ' '.join(text.split())
+
+
+def snippet(text: str, length: int = SNIPPET_LENGTH) -> str:
+    text = ' '.join(text.split())
+    if len(text) <= length:
+        return text
+    return text[:length].rsplit(' ', 1)[0] + '...'
+
+
+def _document(doc_type: str, title: str, url: str, week: Optional[int], body: str) -> tuple:
+    return {
+        'type': doc_type,
+        'title': title,
+        'url': url,
+        'week': week,
+        'snippet': snippet(body),
+    }, body
+
+
+def _load_yaml(name: str, data_dir: Path):
+    path = data_dir / name
+    if not path.exists():
+        return []
+    with open(path, encoding='utf-8') as f:
+        return yaml.safe_load(f) or []
+
+
+def data_documents(data_dir: Path = DATA_DIR) -> list[tuple[dict, str]]:
+    """(document, body) pairs for the glossary, weeks, exercises, quizzes and readings."""
+    docs = []
+    for item in _load_yaml('glossary.yml', data_dir):
+        body = ' '.join([item.get('definition', ''), *item.get('related', [])])
+        docs.append(_document('glossary', item['term'], f"glossary#{slugify(item['term'])}",
+                              item.get('week'), body))
+
+    for week in _load_yaml('weeks.yml', data_dir):
+        papers = [paper.get('title', '') for paper in week.get('papers', [])]
+        body = ' '.join([week.get('description', ''), *week.get('topics', []),
+                         *week.get('learning_objectives', []), *papers])
+        docs.append(_document('week', f"Week {week['number']}: {week['title']}",
+                              f"weeks/week-{week['number']}", week['number'], body))
+
+    for exercise in _load_yaml('exercises.yml', data_dir):
+        tasks = [f"{task.get('name', '')} {task.get('description', '')}"
+                 for task in exercise.get('tasks', [])]
+        body = ' '.join([exercise.get('description', ''), *exercise.get('objectives', []), *tasks])
+        docs.append(_document('exercise', exercise['title'], f"weeks/week-{exercise['week']}",
+                              exercise['week'], body))
+
+    quizzes = _load_yaml('quizzes.yml', data_dir) or {}
+    for key, questions in quizzes.items():
+        week = int(key[4:]) if key[4:].isdigit() else None
+        for question in questions:
+            body = ' '.join([*question.get('options', []), question.get('explanation', '')])
+            docs.append(_document('quiz', question['question'], 'quizzes', week, body))
+
+    for reading in _load_yaml('readings.yml', data_dir):
+        paper = reading.get('primary_paper', {})
+        body = ' '.join([reading.get('description', ''), paper.get('title', ''),
+                         paper.get('authors', ''), *reading.get('topics', [])])
+        docs.append(_document('reading', reading['title'], f"weeks/week-{reading['week']}",
+                              reading['week'], body))
+    return docs
+
+
+def slide_documents(tex_files: list[Path]) -> list[tuple[dict, str]]:
+    """One (document, body) pair per frame, linking to its page in the published PDF."""
+    docs = []
+    for path in tex_files:
+        content = path.read_text(encoding='utf-8')
+        frames = FrameIndex.from_content(content)
+        lines = content.split('\n')
+        week = extract_week_number(path)
+        for number, (start, title) in enumerate(zip(frames.starts, frames.titles), 1):
+            end = frames.starts[number] - 1 if number < len(frames) else len(lines)
+            source = '\n'.join(lines[start:end]).split(r'\end{frame}', 1)[0]
+            body = latex_to_text(source)
+            if not (title or body):
+                continue
+            docs.append(_document('slide', latex_to_text(title or '') or f"Slide {number}",
+                                  f"slides/{path.stem}.pdf#page={number}", week, body))
+    return docs
+
+
+def build_postings(documents: list[tuple[dict, str]]) -> dict[str, list[list[int]]]:
+    """Inverted index: token -> [[document id, weighted term frequency], ...] by document id."""
+    postings = defaultdict(list)
+    for doc_id, (doc, body) in enumerate(documents):
+        weights = Counter(tokenize(body))
+        for token in tokenize(doc['title']):
+            weights[token] += TITLE_WEIGHT
+        for token, weight in weights.items():
+            postings[token].append([doc_id, weight])
+    return dict(sorted(postings.items()))
+
+
+def shard_postings(postings: dict[str, list],
+                   prefix_length: int = PREFIX_LENGTH) -> dict[str, dict]:
+    """Group the inverted index by token prefix."""
+    shards = defaultdict(dict)
+    for token, entries in postings.items():
+        shards[token[:prefix_length]][token] = entries
+    return dict(shards)
+
+
+def _dump(obj) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+class SearchIndex:
+    """Reference client: loads the manifest, then shards on demand like the browser does."""
+
+    def __init__(self, directory: Path = OUTPUT_DIR):
+        self.directory = Path(directory)
+        manifest = json.loads((self.directory / 'index.json').read_text(encoding='utf-8'))
+        self.prefix_length = manifest['prefix_length']
+        self.document_count = manifest['documents']
+        self.document_chunk = manifest['document_chunk']
+        self.prefixes = set(manifest['shards'])
+        self.shards: dict[str, dict] = {}
+        self.chunks: dict[int, list[dict]] = {}
+        self.bytes_fetched = 0
+
+    def _fetch(self, name: str):
+        data = (self.directory / name).read_bytes()
+        self.bytes_fetched += len(data)
+        return json.loads(data)
+
+    def shard(self, prefix: str) -> dict:
+        if prefix not in self.shards:
+            self.shards[prefix] = self._fetch(f'{prefix}.json') if prefix in self.prefixes else {}
+        return self.shards[prefix]
+
+    def document(self, doc_id: int) -> dict:
+        chunk = doc_id // self.document_chunk
+        if chunk not in self.chunks:
+            self.chunks[chunk] = self._fetch(f'docs-{chunk}.json')
+        return self.chunks[chunk][doc_id % self.document_chunk]
+
+    def scores(self, query: str) -> dict[int, float]:
+        """Document scores for a query; every word must prefix-match a token of the document."""
+        words = [w for w in tokenize(query) if len(w) >= self.prefix_length]
+        combined: Optional[dict[int, float]] = None
+        for word in words:
+            shard = self.shard(word[:self.prefix_length])
+            matched = defaultdict(float)
+            for token, entries in shard.items():
+                if not token.startswith(word):
+                    continue
+                idf = math.log(1 + self.document_count / len(entries))
+                for doc_id, weight in entries:
+                    matched[doc_id] += idf * weight / (weight + K1)
+            if combined is None:
+                combined = dict(matched)
+            else:
+                combined = {d: s + matched[d] for d, s in combined.items() if d in matched}
+            if not combined:
+                return {}
+        return combined or {}
+
+    def search(self, query: str, limit: int = 10) -> list[dict]:
+        scores = self.scores(query)
+        ranked = sorted(scores.items(), key=lambda x: (-x[1], x[0]))[:limit]
+        return [dict(self.document(doc_id), score=round(score, 3)) for doc_id, score in ranked]
+
+
+def reference_queries(documents: list[tuple[dict, str]]) -> list[str]:
+    """Glossary terms, typed both in full and as the prefixes a user sees results for."""
+    queries = []
+    for doc, _ in documents:
+        if doc['type'] != 'glossary':
+            continue
+        term = doc['title'].lower()
+        queries.append(term)
+        queries.extend(term[:n] for n in range(PREFIX_LENGTH, min(len(term), 6)))
+    return queries
+
+
+def measure_latency(directory: Path, queries: list[str]) -> dict:
+    """Per-query latency of the reference client, cold (fresh client) and warm (shards cached)."""
+    if not queries:
+        return {}
+    cold, warm, fetched = [], [], []
+    warm_index = SearchIndex(directory)
+    for query in queries:
+        start = time.perf_counter()
+        cold_index = SearchIndex(directory)
+        cold_index.search(query)
+        cold.append((time.perf_counter() - start) * 1000)
+        fetched.append(cold_index.bytes_fetched)
+        warm_index.search(query)
+    for query in queries:
+        start = time.perf_counter()
+        warm_index.search(query)
+        warm.append((time.perf_counter() - start) * 1000)
+
+    def percentile(values, p):
+        ordered = sorted(values)
+        return round(ordered[min(len(ordered) - 1, int(p * len(ordered)))], 3)
+
+    return {
+        'queries': len(queries),
+        'cold_p50_ms': percentile(cold, 0.5),
+        'cold_p95_ms': percentile(cold, 0.95),
+        'warm_p50_ms': percentile(warm, 0.5),
+        'warm_p95_ms': percentile(warm, 0.95),
+        'mean_bytes_fetched': round(sum(fetched) / len(fetched)),
+    }
+
+
+def built_files(output_dir: Path) -> list[Path]:
+    """Files of the index previously built in output_dir, as listed by its manifest."""
+    try:
+        manifest = json.loads((output_dir / 'index.json').read_text(encoding='utf-8'))
+        shards, chunk = manifest['shards'], manifest['document_chunk']
+        chunks = -(-manifest['documents'] // chunk)
+    except (OSError, ValueError, KeyError, TypeError, ZeroDivisionError):
+        return []  # no index of ours here
+    names = [f'{prefix}.json' for prefix in shards] + [f'docs-{n}.json' for n in range(chunks)]
+    return [output_dir / name for name in names + ['index.json']
+            if (output_dir / name).is_file()]
+
+
+def build_search_index(output_dir: Path = OUTPUT_DIR, data_dir: Path = DATA_DIR,
+                       tex_files: Optional[list[Path]] = None,
+                       prefix_length: int = PREFIX_LENGTH) -> dict:
+    """Write the sharded index to output_dir and return the manifest (with build metrics)."""
+    start = time.perf_counter()
+    if tex_files is None:
+        tex_files = lecture_files(ROOT)
+    documents = data_documents(data_dir) + slide_documents(tex_files)
+    postings = build_postings(documents)
+    shards = shard_postings(postings, prefix_length)
+
+    # Shards of vanished prefixes must not linger; nothing else in output_dir is touched
+    for path in built_files(output_dir):
+        path.unlink()
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    shard_sizes, chunk_sizes = [], []
+    for prefix, shard in shards.items():
+        data = _dump(shard)
+        (output_dir / f'{prefix}.json').write_bytes(data)
+        shard_sizes.append((len(data), len(gzip.compress(data))))
+    for chunk, first in enumerate(range(0, len(documents), DOCUMENT_CHUNK)):
+        data = _dump([doc for doc, _ in documents[first:first + DOCUMENT_CHUNK]])
+        (output_dir / f'docs-{chunk}.json').write_bytes(data)
+        chunk_sizes.append((len(data), len(gzip.compress(data))))
+
+    manifest = {
+        'version': FORMAT_VERSION,
+        'prefix_length': prefix_length,
+        'document_chunk': DOCUMENT_CHUNK,
+        'documents': len(documents),
+        'tokens': len(postings),
+        'shards': sorted(shards),
+    }
+    (output_dir / 'index.json').write_bytes(_dump(manifest))
+    build_seconds = time.perf_counter() - start
+
+    sizes = [size for size, _ in shard_sizes]
+    manifest['metrics'] = {
+        'build_seconds': round(build_seconds, 3),
+        'index_size': {
+            'manifest_bytes': len(_dump(manifest)),
+            'shards': len(sizes),
+            'shard_bytes_total': sum(sizes),
+            'shard_gzip_bytes_total': sum(gz for _, gz in shard_sizes),
+            'shard_bytes_max': max(sizes, default=0),
+            'shard_bytes_mean': round(sum(sizes) / len(sizes)) if sizes else 0,
+            'document_chunks': len(chunk_sizes),
+            'document_bytes_total': sum(size for size, _ in chunk_sizes),
+            'document_gzip_bytes_total': sum(gz for _, gz in chunk_sizes),
+        },
+        'query_latency': measure_latency(output_dir, reference_queries(documents)),
+    }
+    (output_dir / 'index.json').write_bytes(_dump(manifest))
+    return manifest
+
+
+def main(argv: Optional[list[str]] = None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build the sharded client-side search index")
+    parser.add_argument('--output', type=Path, default=OUTPUT_DIR, help="Output directory")
+    parser.add_argument('--prefix-length', type=int, default=PREFIX_LENGTH,
+                        help="Token prefix length used to split the shards")
+    parser.add_argument('--query', help="Run a query against the built index and print the hits")
+    args = parser.parse_args(argv)
+
+    manifest = build_search_index(args.output, prefix_length=args.prefix_length)
+    metrics = manifest['metrics']
+    size, latency = metrics['index_size'], metrics['query_latency']
+
+    print(f"Indexed {manifest['documents']} documents, {manifest['tokens']} tokens "
+          f"in {metrics['build_seconds']:.2f}s")
+    print(f"  {size['shards']} shards: {size['shard_bytes_total'] / 1024:.1f} KB "
+          f"({size['shard_gzip_bytes_total'] / 1024:.1f} KB gzip), "
+          f"largest {size['shard_bytes_max'] / 1024:.1f} KB, mean {size['shard_bytes_mean']} B")
+    print(f"  {size['document_chunks']} document chunks: "
+          f"{size['document_bytes_total'] / 1024:.1f} KB "
+          f"({size['document_gzip_bytes_total'] / 1024:.1f} KB gzip)")
+    if latency:
+        print(f"  {latency['queries']} reference queries: "
+              f"cold p50 {latency['cold_p50_ms']:.2f} ms / p95 {latency['cold_p95_ms']:.2f} ms, "
+              f"warm p50 {latency['warm_p50_ms']:.2f} ms / p95 {latency['warm_p95_ms']:.2f} ms, "
+              f"{latency['mean_bytes_fetched']} B fetched per cold query")
+    print(f"Saved: {args.output}")
+
+    if args.query:
+        for hit in SearchIndex(args.output).search(args.query):
+            print(f"  {hit['score']:6.2f}  [{hit['type']}] {hit['title']}  ->  {hit['url']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,369 @@
+"""
+Persistent inverted index of glossary terms over the lecture slides.
+
+Maps every glossary term to its occurrences (week, file, line, slide, slide
+title, line context, whether the line defines the term). The index is stored
+in a compact binary file next to the lectures (.corpus_index.bin) and is
+refreshed incrementally: a file is only re-tokenized when its size/mtime
+changed and its content hash no longer matches, so regenerating the glossary
+and term index after a one-line slide edit rescans one file.
+
+Binary layout (little endian):
+    b"CIDX" | u32 header length | header (JSON, utf-8) | padding to 8 bytes
+    | postings (packed numpy structured array, read back with one np.fromfile)
+    | contexts (utf-8, one line of slide text per posting group, "\\n"-joined)
+
+Usage:
+    python scripts/corpus_index.py            # refresh and print statistics
+    python scripts/corpus_index.py --rebuild  # re-tokenize every lecture
+"""
+
+import hashlib
+import json
+import os
+import struct
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Iterator, Optional
+
+import numpy as np
+
+from extract_glossary import (
+    DEFINITION_PATTERNS,
+    ROOT,
+    TERM_DEFINITIONS,
+    TERM_VARIANTS,
+    extract_week_number,
+    scan_terms,
+)
+from frame_index import FrameIndex
+
+INDEX_PATH = ROOT / '.corpus_index.bin'
+MAGIC = b'CIDX'
+FORMAT_VERSION = 1
+
+POSTING_DTYPE = np.dtype([
+    ('term', '<u2'),
+    ('file', '<u2'),
+    ('line', '<u4'),
+    ('slide', '<u2'),
+    ('defined', 'u1'),
+    ('context', '<u4'),
+], align=False)
+
+
+def lecture_files(root: Path = ROOT) -> list[Path]:
+    """Lecture decks (L*_*/L*_*.tex) in week order."""
+    return [
+        path for path in sorted(root.glob('L*_*/*.tex'))
+        if path.stem.startswith('L') and '_' in path.stem and extract_week_number(path)
+    ]
+
+
+def vocabulary_hash() -> str:
+    """Hash of the term list and variants; a change invalidates the whole index."""
+    vocabulary = {term: TERM_VARIANTS.get(term, [term]) for term in TERM_DEFINITIONS}
+    return hashlib.sha256(json.dumps(vocabulary, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def tokenize(content: str) -> tuple[list[tuple[str, int, int, bool, str]], FrameIndex]:
+    """All (term, line, slide, defined, context) occurrences of one file, in text order."""
+    frames = FrameIndex.from_content(content)
+    occurrences = []
+    for line_num, line_start, term in scan_terms(content):
+        line_end = content.find('\n', line_start)
+        line = content[line_start:] if line_end == -1 else content[line_start:line_end]
+        occurrences.append((
+            term,
+            line_num,
+            frames.slide_at(line_num),
+            bool(DEFINITION_PATTERNS[term].search(line)),
+            line.strip()[:100],
+        ))
+    return occurrences, frames
+
+
+def tokenize_file(content: str) -> tuple[np.ndarray, list[str], list[Optional[str]]]:
+    """Postings (file id 0, file-local context ids), context lines and frame titles of a file."""
+    occurrences, frames = tokenize(content)
+    term_ids = {term: i for i, term in enumerate(TERM_DEFINITIONS)}
+    postings = np.zeros(len(occurrences), POSTING_DTYPE)
+    contexts: list[str] = []
+    context_ids: dict[int, int] = {}
+    for i, (term, line, slide, defined, context) in enumerate(occurrences):
+        if line not in context_ids:
+            context_ids[line] = len(contexts)
+            contexts.append(context.replace('\n', ' '))
+        postings[i] = (term_ids[term], 0, line, slide, defined, context_ids[line])
+    return postings, contexts, frames.titles
+
+
+def _tokenize_job(job: tuple[int, str]) -> tuple:
+    key, content = job
+    start = time.perf_counter()
+    postings, contexts, titles = tokenize_file(content)
+    return key, postings, contexts, titles, time.perf_counter() - start
+
+
+def scan_contents(jobs: list[tuple[int, str]], workers: int = 1,
+                  ordered: bool = True) -> Iterator[tuple]:
+    """Tokenize (key, content) jobs, yielding (key, postings, contexts, titles, seconds).
+
+    With workers > 1 the files are tokenized in a process pool. ordered=False
+    streams each result as soon as its file finishes; every result carries
+    its key, so callers can still merge in a deterministic order.
+    """
+    if workers <= 1 or len(jobs) <= 1:
+        for job in jobs:
+            yield _tokenize_job(job)
+        return
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        if ordered:
+            yield from pool.map(_tokenize_job, jobs)
+        else:
+            for future in as_completed([pool.submit(_tokenize_job, job) for job in jobs]):
+                yield future.result()
+
+
+class CorpusIndex:
+    """Term postings for a set of lecture files, with per-file change tracking."""
+
+    def __init__(self, files: list[dict], terms: list[str], postings: np.ndarray,
+                 contexts: list[str], vocabulary: str):
+        self.files = files
+        self.terms = terms
+        self.postings = postings
+        self.contexts = contexts
+        self.vocabulary = vocabulary
+        self._term_ids = {term: i for i, term in enumerate(terms)}
+
+    @classmethod
+    def empty(cls) -> 'CorpusIndex':
+        return cls([], list(TERM_DEFINITIONS), np.zeros(0, POSTING_DTYPE), [], vocabulary_hash())
+
+    # -- persistence -------------------------------------------------------
+
+    @classmethod
+    def load(cls, path: Path = INDEX_PATH) -> Optional['CorpusIndex']:
+        """Load an index file, or None if it is missing, corrupt or from another version."""
+        try:
+            with open(path, 'rb') as f:
+                if f.read(4) != MAGIC:
+                    return None
+                (header_len,) = struct.unpack('<I', f.read(4))
+                header = json.loads(f.read(header_len).decode('utf-8'))
+        except (OSError, ValueError, struct.error):
+            return None
+        if header.get('version') != FORMAT_VERSION:
+            return None
+
+        offset = _align(8 + header_len)
+        count = header['postings']
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            postings = np.fromfile(f, dtype=POSTING_DTYPE, count=count)
+            blob = f.read().decode('utf-8')
+        contexts = blob.split('\n') if header['contexts'] else []
+        return cls(header['files'], header['terms'], postings, contexts, header['vocabulary'])
+
+    def save(self, path: Path = INDEX_PATH):
+        """Write the index atomically."""
+        header = json.dumps({
+            'version': FORMAT_VERSION,
+            'vocabulary': self.vocabulary,
+            'terms': self.terms,
+            'files': self.files,
+            'postings': len(self.postings),
+            'contexts': len(self.contexts),
+        }, separators=(',', ':')).encode('utf-8')
+        offset = _align(8 + len(header))
+
+        tmp = Path(path).with_suffix('.tmp')
+        with open(tmp, 'wb') as f:
+            f.write(MAGIC + struct.pack('<I', len(header)) + header)
+            f.write(b'\0' * (offset - 8 - len(header)))
+            f.write(np.ascontiguousarray(self.postings, dtype=POSTING_DTYPE).tobytes())
+            f.write('\n'.join(self.contexts).encode('utf-8'))
+        os.replace(tmp, path)
+
+    # -- incremental refresh -----------------------------------------------
+
+    def refresh(self, tex_files: list[Path], root: Path = ROOT, rebuild: bool = False,
+                workers: int = 1, on_scanned=None) -> tuple['CorpusIndex', dict]:
+        """Return an index for tex_files, re-tokenizing only files that changed.
+
+        Changed files are tokenized across `workers` processes. Results are
+        merged by file position, so the index is identical for any worker
+        count and files stay in the given (week) order. on_scanned(path,
+        postings, seconds) is called for each tokenized file as soon as it
+        finishes. Unchanged files keep their postings; self is left untouched.
+        """
+        rebuild = (rebuild or self.vocabulary != vocabulary_hash()
+                   or self.terms != list(TERM_DEFINITIONS))
+        known = {} if rebuild else {entry['path']: i for i, entry in enumerate(self.files)}
+        stats = {'files': len(tex_files), 'rescanned': 0, 'rehashed': 0, 'reused': 0}
+
+        entries: list[dict] = []
+        results: dict[int, tuple[np.ndarray, list[str]]] = {}
+        jobs: list[tuple[int, str]] = []
+        for file_id, tex_path in enumerate(tex_files):
+            rel = tex_path.relative_to(root).as_posix()
+            stat = tex_path.stat()
+            old_id = known.get(rel)
+            old = self.files[old_id] if old_id is not None else None
+
+            if old and old['size'] == stat.st_size and old['mtime_ns'] == stat.st_mtime_ns:
+                stats['reused'] += 1
+                entries.append(old)
+                results[file_id] = self._file_postings(old_id)
+                continue
+
+            data = tex_path.read_bytes()
+            digest = hashlib.sha256(data).hexdigest()
+            if old and old['sha256'] == digest:
+                # Touched but not edited: keep postings, remember the new stat
+                stats['rehashed'] += 1
+                entries.append(dict(old, size=stat.st_size, mtime_ns=stat.st_mtime_ns))
+                results[file_id] = self._file_postings(old_id)
+                continue
+
+            stats['rescanned'] += 1
+            entries.append({
+                'path': rel,
+                'week': extract_week_number(tex_path),
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'sha256': digest,
+                'frame_titles': [],
+            })
+            jobs.append((file_id, data.decode('utf-8')))
+
+        for file_id, postings, file_contexts, titles, seconds in scan_contents(
+                jobs, workers, ordered=False):
+            entries[file_id]['frame_titles'] = titles
+            results[file_id] = (postings, file_contexts)
+            if on_scanned:
+                on_scanned(entries[file_id]['path'], len(postings), seconds)
+
+        # Merge in file (week) order, whatever order the scans finished in
+        parts, contexts = [], []
+        for file_id in range(len(entries)):
+            postings, file_contexts = results[file_id]
+            parts.append(_with_file_and_offset(postings, file_id, len(contexts)))
+            contexts.extend(file_contexts)
+
+        postings = np.concatenate(parts) if parts else np.zeros(0, POSTING_DTYPE)
+        return CorpusIndex(entries, list(TERM_DEFINITIONS), postings, contexts,
+                           vocabulary_hash()), stats
+
+    def _file_postings(self, file_id: int) -> tuple[np.ndarray, list[str]]:
+        """Copy of one file's postings with file-local context ids, and its contexts."""
+        # Postings are grouped by file id, so one file is a contiguous slice
+        files = self.postings['file']
+        lo, hi = np.searchsorted(files, file_id, 'left'), np.searchsorted(files, file_id, 'right')
+        postings = np.array(self.postings[lo:hi])
+        if not len(postings):
+            return postings, []
+        first, last = int(postings['context'].min()), int(postings['context'].max())
+        postings['context'] -= first
+        return postings, self.contexts[first:last + 1]
+
+    # -- queries -----------------------------------------------------------
+
+    def occurrences(self, term: str) -> Iterator[dict]:
+        """All occurrences of a term, in week order then line order."""
+        term_id = self._term_ids.get(term)
+        if term_id is None:
+            return
+        for posting in self.postings[self.postings['term'] == term_id]:
+            yield self._describe(posting)
+
+    def first_occurrences(self) -> dict[str, dict]:
+        """First occurrence of every term found in the corpus, keyed by term."""
+        if not len(self.postings):
+            return {}
+        # Postings are stored in file (week) order then text order, so the
+        # first posting of each term is its first use
+        _, first = np.unique(self.postings['term'], return_index=True)
+        return {
+            self.terms[int(self.postings[i]['term'])]: self._describe(self.postings[i])
+            for i in first
+        }
+
+    def _describe(self, posting) -> dict:
+        entry = self.files[int(posting['file'])]
+        slide = int(posting['slide'])
+        return {
+            'week': entry['week'],
+            'file': entry['path'],
+            'line': int(posting['line']),
+            'slide': slide,
+            'slide_title': entry['frame_titles'][slide - 1] if slide else None,
+            'context': self.contexts[int(posting['context'])],
+            'defined': bool(posting['defined']),
+        }
+
+
+def _align(offset: int, boundary: int = 8) -> int:
+    return (offset + boundary - 1) // boundary * boundary
+
+
+def _with_file_and_offset(postings: np.ndarray, file_id: int, context_offset: int) -> np.ndarray:
+    postings = np.array(postings)
+    postings['file'] = file_id
+    postings['context'] += context_offset
+    return postings
+
+
+def load_index(root: Path = ROOT, path: Optional[Path] = INDEX_PATH, rebuild: bool = False,
+               workers: int = 1, on_scanned=None) -> tuple[CorpusIndex, dict]:
+    """Load the on-disk index, refresh it against the lectures and save it if anything changed.
+
+    path=None keeps the index in memory only. workers and on_scanned are
+    passed to CorpusIndex.refresh.
+    """
+    index = (CorpusIndex.load(path) if path else None) or CorpusIndex.empty()
+    refreshed, stats = index.refresh(lecture_files(root), root, rebuild=rebuild,
+                                     workers=workers, on_scanned=on_scanned)
+    if path and (stats['rescanned'] or stats['rehashed'] or len(refreshed.files) != len(index.files)):
+        refreshed.save(path)
+    return refreshed, stats
+
+
+def add_scan_arguments(parser):
+    """--workers/--stream options shared by the scripts that refresh the index."""
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Processes used to scan changed lecture files")
+    parser.add_argument('--stream', action='store_true',
+                        help="Report each lecture file as soon as it has been scanned")
+
+
+def print_scanned(path: str, postings: int, seconds: float):
+    print(f"  scanned {path}: {postings} occurrences ({seconds * 1000:.1f} ms)", flush=True)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Refresh the lecture term index")
+    parser.add_argument('--rebuild', action='store_true', help="Re-tokenize every lecture")
+    add_scan_arguments(parser)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    index, stats = load_index(rebuild=args.rebuild, workers=args.workers,
+                              on_scanned=print_scanned if args.stream else None)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    print(f"Index: {INDEX_PATH}")
+    print(f"  Files: {stats['files']} ({stats['rescanned']} rescanned, "
+          f"{stats['rehashed']} rehashed, {stats['reused']} unchanged)")
+    print(f"  Terms found: {len(index.first_occurrences())} of {len(index.terms)}")
+    print(f"  Postings: {len(index.postings)}")
+    print(f"  Size: {INDEX_PATH.stat().st_size / 1024:.1f} KB")
+    print(f"  Refreshed in {elapsed:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
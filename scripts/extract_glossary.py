@@ -10,9 +10,12 @@ Usage:
 import json
 import re
 import yaml
+from bisect import bisect_right
 from pathlib import Path
 from typing import Optional
 
+from frame_index import FrameIndex
+
 # Project root
 ROOT = Path(__file__).parent.parent
 
@@ -403,6 +406,60 @@ for term in TERM_DEFINITIONS.keys():
     combined_pattern = r'\b(' + '|'.join(pattern_parts) + r')\b'
     TERM_PATTERNS[term] = re.compile(combined_pattern, re.IGNORECASE)
 
+# Patterns that suggest a term is being defined on the line where it appears
+DEFINITION_PATTERNS = {}
+for term in TERM_DEFINITIONS.keys():
+    escaped = re.escape(term)
+    DEFINITION_PATTERNS[term] = re.compile('|'.join([
+        rf'{escaped}\s*[:-]',  # "Term: definition" or "Term - definition"
+        rf'{escaped}\s*\([^)]+\)',  # "Term (explanation)"
+        rf'\\textbf{{{escaped}}}',  # Bold term (often definitions)
+        rf'{escaped}.*is\s+(a|an|the)',  # "Term is a..."
+        rf'define\s+{escaped}',  # "define Term"
+    ]), re.IGNORECASE)
+
+# Single-pass scanner: one alternation over every variant of every term. The
+# lookahead makes the match zero-width, so overlapping hits such as "RAG"
+# inside "Self-RAG" or "LLM" inside "LLM-as-Judge" are all reported.
+_ALL_VARIANTS = sorted(
+    {v for term in TERM_DEFINITIONS for v in TERM_VARIANTS.get(term, [term])},
+    key=lambda v: (-len(v), v),
+)
+SCANNER = re.compile(
+    r'(?=\b(?:' + '|'.join(re.escape(v) for v in _ALL_VARIANTS) + r')\b)',
+    re.IGNORECASE,
+)
+
+# Variants keyed by lowercase first character, to resolve which terms matched
+# at a scanner hit. The leading \b is already checked by SCANNER.
+VARIANTS_BY_INITIAL: dict[str, list[tuple[str, re.Pattern]]] = {}
+for term in TERM_DEFINITIONS.keys():
+    for variant in TERM_VARIANTS.get(term, [term]):
+        VARIANTS_BY_INITIAL.setdefault(variant[0].lower(), []).append(
+            (term, re.compile(re.escape(variant) + r'\b', re.IGNORECASE))
+        )
+
+
+def scan_terms(content: str):
+    """Yield (line_num, line_start, term) for every term occurrence, in text order.
+
+    Each term is reported at most once per line, matching TERM_PATTERNS[term]
+    .search(line) semantics, but the whole file is walked only once.
+    """
+    line_starts = [0] + [m.end() for m in re.finditer('\n', content)]
+    seen_on_line = set()
+    current_line = 0
+    for hit in SCANNER.finditer(content):
+        pos = hit.start()
+        line_num = bisect_right(line_starts, pos)
+        if line_num != current_line:
+            current_line = line_num
+            seen_on_line = set()
+        for term, variant in VARIANTS_BY_INITIAL.get(content[pos].lower(), ()):
+            if term not in seen_on_line and variant.match(content, pos):
+                seen_on_line.add(term)
+                yield line_num, line_starts[line_num - 1], term
+
 
 def extract_week_number(path: Path) -> int:
     """Extract week number from lecture folder name."""
@@ -413,73 +470,67 @@ def extract_week_number(path: Path) -> int:
 
 
 def extract_slide_number(content: str, line_num: int) -> int:
-    """Estimate slide number from line number by counting frame environments."""
-    lines = content[:content.find('\n' * line_num)].split('\n') if line_num > 0 else []
-    slide_count = 0
-    for line in lines[:line_num]:
-        if r'\begin{frame}' in line:
-            slide_count += 1
-    return max(1, slide_count)
+    """Slide number of a line, counting frame environments (at least 1)."""
+    return max(1, FrameIndex.from_content(content).slide_at(line_num))
 
 
 def find_first_occurrence(tex_path: Path) -> dict[str, dict]:
-    """Find first occurrence of each term in a .tex file."""
+    """Find first occurrence of each term in a .tex file (single pass over the file)."""
     content = tex_path.read_text(encoding='utf-8')
-    lines = content.split('\n')
+    frames = FrameIndex.from_content(content)
     occurrences = {}
 
-    for term, pattern in TERM_PATTERNS.items():
-        for line_num, line in enumerate(lines, 1):
-            if pattern.search(line):
-                # Check if term is defined at this location
-                is_defined = False
-                # Look for common definition patterns
-                definition_patterns = [
-                    rf'{re.escape(term)}\s*[:-]',  # "Term: definition" or "Term - definition"
-                    rf'{re.escape(term)}\s*\([^)]+\)',  # "Term (explanation)"
-                    rf'\\textbf{{{re.escape(term)}}}',  # Bold term (often definitions)
-                    rf'{re.escape(term)}.*is\s+(a|an|the)',  # "Term is a..."
-                    rf'define\s+{re.escape(term)}',  # "define Term"
-                ]
-                for def_pattern in definition_patterns:
-                    if re.search(def_pattern, line, re.IGNORECASE):
-                        is_defined = True
-                        break
-
-                occurrences[term] = {
-                    "line": line_num,
-                    "slide": extract_slide_number(content, line_num),
-                    "context": line.strip()[:100],
-                    "defined_at_first_use": is_defined,
-                }
-                break  # Only first occurrence
-
-    return occurrences
-
-
-def process_all_lectures() -> list[dict]:
-    """Process all lecture .tex files and build glossary inventory."""
-    glossary = []
+    for line_num, line_start, term in scan_terms(content):
+        if term in occurrences:
+            continue
+        line_end = content.find('\n', line_start)
+        line = content[line_start:] if line_end == -1 else content[line_start:line_end]
+        occurrences[term] = {
+            "line": line_num,
+            "slide": max(1, frames.slide_at(line_num)),
+            "slide_title": frames.title_at(line_num),
+            "context": line.strip()[:100],
+            "defined_at_first_use": bool(DEFINITION_PATTERNS[term].search(line)),
+        }
+        if len(occurrences) == len(TERM_PATTERNS):
+            break
 
-    # Find all lecture .tex files
-    tex_files = sorted(ROOT.glob("L*_*/*.tex"))
+    # Report terms in TERM_DEFINITIONS order, as the per-term scan did
+    return {term: occurrences[term] for term in TERM_PATTERNS if term in occurrences}
 
-    # Track first occurrence across all lectures
-    first_occurrences: dict[str, dict] = {}
 
-    for tex_path in tex_files:
-        if tex_path.stem.startswith("L") and "_" in tex_path.stem:
-            week = extract_week_number(tex_path)
-            occurrences = find_first_occurrence(tex_path)
+def process_all_lectures(rebuild_index: bool = False, workers: int = 1,
+                         on_scanned=None) -> list[dict]:
+    """Build the glossary inventory from the lecture term index.
 
-            for term, occurrence in occurrences.items():
-                if term not in first_occurrences:
-                    first_occurrences[term] = {
-                        "term": term,
-                        "week": week,
-                        "file": str(tex_path.relative_to(ROOT)),
-                        **occurrence,
-                    }
+    The index (see corpus_index.py) is refreshed first, so only lecture
+    files that changed since the last run are scanned again, across
+    `workers` processes; on_scanned is called as each file finishes.
+    """
+    from corpus_index import load_index
+    from term_cooccurrence import analyze
+
+    glossary = []
+    index, _ = load_index(ROOT, rebuild=rebuild_index, workers=workers, on_scanned=on_scanned)
+
+    # First occurrence across all lectures (the index is in week order)
+    first_occurrences: dict[str, dict] = {
+        term: {
+            "term": term,
+            **occ,
+            "slide": max(1, occ["slide"]),
+            "defined_at_first_use": occ["defined"],
+        }
+        for term, occ in index.first_occurrences().items()
+    }
+
+    # Related terms and clusters suggested by slide co-occurrence
+    associations = analyze(index)
+    cluster_of = {
+        term: number
+        for number, cluster in enumerate(associations["clusters"], 1)
+        for term in cluster
+    }
 
     # Build final glossary with definitions
     for term, data in TERM_DEFINITIONS.items():
@@ -488,6 +539,12 @@ def process_all_lectures() -> list[dict]:
             "definition": data["definition"],
             "category": data["category"],
             "related_terms": data.get("related", []),
+            # Only suggest what is not already curated in "related"
+            "suggested_related": [
+                suggestion for suggestion in associations["related"].get(term, [])
+                if suggestion["term"] not in data.get("related", [])
+            ],
+            "cluster": cluster_of.get(term),
         }
 
         if "source_paper" in data:
@@ -499,6 +556,7 @@ def process_all_lectures() -> list[dict]:
             entry["first_use"] = {
                 "week": occ["week"],
                 "slide": occ["slide"],
+                "slide_title": occ["slide_title"],
                 "line": occ["line"],
                 "file": occ["file"],
             }
@@ -602,6 +660,8 @@ def main():
     """Generate complete glossary inventory."""
     import argparse
 
+    from corpus_index import add_scan_arguments, print_scanned
+
     parser = argparse.ArgumentParser(description="Extract glossary from course slides")
     parser.add_argument(
         "--output",
@@ -613,10 +673,20 @@ def main():
         action="store_true",
         help="Merge with existing glossary.yml",
     )
+    parser.add_argument(
+        "--rebuild-index",
+        action="store_true",
+        help="Rescan every lecture instead of only the changed ones",
+    )
+    add_scan_arguments(parser)
     args = parser.parse_args()
 
     print("Extracting terms from lecture slides...")
-    glossary = process_all_lectures()
+    glossary = process_all_lectures(
+        rebuild_index=args.rebuild_index,
+        workers=args.workers,
+        on_scanned=print_scanned if args.stream else None,
+    )
 
     if args.merge:
         existing_path = ROOT / "docs" / "_data" / "glossary.yml"
@@ -626,11 +696,20 @@ def main():
     # Generate statistics
     stats = generate_statistics(glossary)
 
+    # Term clusters derived from slide co-occurrence (see term_cooccurrence.py)
+    clusters: dict[int, list[str]] = {}
+    for entry in glossary:
+        if entry.get("cluster"):
+            clusters.setdefault(entry["cluster"], []).append(entry["term"])
+
     output = {
         "metadata": {
             "generated_from": "scripts/extract_glossary.py",
             "total_terms": stats["total_terms"],
             "statistics": stats,
+            "term_clusters": [
+                sorted(terms, key=str.lower) for _, terms in sorted(clusters.items())
+            ],
         },
         "glossary": glossary,
     }
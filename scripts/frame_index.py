@@ -0,0 +1,85 @@
+"""
+Frame index for Beamer lecture files.
+
+Maps line numbers to slide (frame) numbers and titles with a binary search
+over the sorted frame start lines, so locating a term occurrence costs
+O(log frames) instead of rescanning the file prefix.
+
+Usage:
+    frames = FrameIndex.from_file(Path("L01_Introduction_Agentic_AI/L01_Introduction_Agentic_AI.tex"))
+    frames.slide_at(120)   # -> 5
+    frames.title_at(120)   # -> "Why Agents Now?"
+"""
+
+import re
+from bisect import bisect_right
+from pathlib import Path
+from typing import Optional
+
+FRAME_BEGIN = r'\begin{frame}'
+FRAME_OPTIONS = re.compile(r'\s*(<[^>]*>)?\s*(\[[^\]]*\])?\s*')
+FRAMETITLE = re.compile(r'\\frametitle\s*(?=\{)')
+
+
+def _braced(text: str, start: int) -> Optional[str]:
+    """Contents of the balanced {...} group starting at text[start], if any."""
+    if start >= len(text) or text[start] != '{':
+        return None
+    depth = 0
+    for i in range(start, len(text)):
+        if text[i] == '{':
+            depth += 1
+        elif text[i] == '}':
+            depth -= 1
+            if depth == 0:
+                return text[start + 1:i]
+    return None
+
+
+class FrameIndex:
+    """Sorted frame start lines (1-based) and frame titles of one .tex file."""
+
+    def __init__(self, starts: list[int], titles: list[Optional[str]]):
+        self.starts = starts
+        self.titles = titles
+
+    @classmethod
+    def from_content(cls, content: str) -> 'FrameIndex':
+        lines = content.split('\n')
+        starts, titles = [], []
+        for line_num, line in enumerate(lines, 1):
+            pos = line.find(FRAME_BEGIN)
+            if pos == -1:
+                continue
+            starts.append(line_num)
+            rest = line[pos + len(FRAME_BEGIN):]
+            title = _braced(rest, FRAME_OPTIONS.match(rest).end())
+            titles.append(title.strip() if title else None)
+
+        # Frames without a title argument may set it with \frametitle{...}
+        for i, title in enumerate(titles):
+            if title is not None:
+                continue
+            end = starts[i + 1] - 1 if i + 1 < len(starts) else len(lines)
+            body = '\n'.join(lines[starts[i] - 1:end])
+            match = FRAMETITLE.search(body)
+            if match:
+                title = _braced(body, match.end())
+                titles[i] = title.strip() if title else None
+        return cls(starts, titles)
+
+    @classmethod
+    def from_file(cls, path: Path) -> 'FrameIndex':
+        return cls.from_content(Path(path).read_text(encoding='utf-8'))
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def slide_at(self, line_num: int) -> int:
+        """Number of the frame containing line_num (1-based), or 0 before the first frame."""
+        return bisect_right(self.starts, line_num)
+
+    def title_at(self, line_num: int) -> Optional[str]:
+        """Title of the frame containing line_num, or None (untitled or before the first frame)."""
+        slide = self.slide_at(line_num)
+        return self.titles[slide - 1] if slide else None
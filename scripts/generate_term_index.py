@@ -4,56 +4,33 @@ Creates both JSON data and markdown visualization.
 """
 
 import json
-import re
 from pathlib import Path
 from collections import defaultdict
 
 ROOT = Path(__file__).parent.parent
 
 # Import term definitions from extract_glossary
-from extract_glossary import TERM_DEFINITIONS, TERM_VARIANTS
+from extract_glossary import TERM_DEFINITIONS
+from corpus_index import add_scan_arguments, load_index, print_scanned
 
 
-def find_all_occurrences() -> dict:
-    """Find all occurrences of each term across all lectures."""
+def find_all_occurrences(workers: int = 1, on_scanned=None) -> dict:
+    """Find all occurrences of each term across all lectures.
+
+    Answers from the lecture term index (corpus_index.py), which rescans
+    only the lecture files that changed since the last run, across
+    `workers` processes; on_scanned is called as each file finishes.
+    """
     term_occurrences = defaultdict(lambda: defaultdict(list))
+    index, _ = load_index(ROOT, workers=workers, on_scanned=on_scanned)
 
-    # Build patterns
-    patterns = {}
     for term in TERM_DEFINITIONS.keys():
-        variants = TERM_VARIANTS.get(term, [term])
-        pattern_parts = [re.escape(v) for v in variants]
-        combined_pattern = r'\b(' + '|'.join(pattern_parts) + r')\b'
-        patterns[term] = re.compile(combined_pattern, re.IGNORECASE)
-
-    # Process all lecture files
-    tex_files = sorted(ROOT.glob("L*_*/*.tex"))
-
-    for tex_path in tex_files:
-        if not tex_path.stem.startswith("L"):
-            continue
-
-        # Extract week number
-        match = re.match(r'L(\d+)_', tex_path.parent.name)
-        if not match:
-            continue
-        week = int(match.group(1))
-
-        content = tex_path.read_text(encoding='utf-8')
-        lines = content.split('\n')
-
-        # Find current slide
-        current_slide = 0
-        for line_num, line in enumerate(lines, 1):
-            if r'\begin{frame}' in line:
-                current_slide += 1
-
-            for term, pattern in patterns.items():
-                if pattern.search(line):
-                    term_occurrences[term][week].append({
-                        "slide": current_slide,
-                        "line": line_num
-                    })
+        for occ in index.occurrences(term):
+            term_occurrences[term][occ["week"]].append({
+                "slide": occ["slide"],
+                "title": occ["slide_title"],
+                "line": occ["line"]
+            })
 
     return term_occurrences
 
@@ -146,9 +123,17 @@ def generate_week_focus(matrix: dict) -> dict:
 
 
 def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate the cross-lecture term index")
+    add_scan_arguments(parser)
+    args = parser.parse_args()
+
     print("Generating cross-lecture term index...")
 
-    occurrences = find_all_occurrences()
+    occurrences = find_all_occurrences(
+        workers=args.workers, on_scanned=print_scanned if args.stream else None
+    )
     matrix = generate_term_matrix(occurrences)
     week_focus = generate_week_focus(matrix)
 
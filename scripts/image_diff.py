@@ -0,0 +1,201 @@
+"""
+Perceptual image diff for site screenshots.
+
+Compares two captures with a blockwise SSIM: the luma of both images is cut
+into BLOCK x BLOCK tiles and the structural similarity of every tile pair is
+computed at once from per-tile means, variances and covariance (array
+reshapes and reductions, no per-pixel Python). Tiles below the threshold are
+grouped into connected regions and reported as pixel bounding boxes.
+
+Full-page captures of different heights are compared over their common
+height; the extra rows of the taller one count as a changed region.
+
+Usage:
+    python scripts/image_diff.py baseline.png current.png [--output diff.png]
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+from PIL import Image, ImageDraw
+from scipy import ndimage
+
+BLOCK = 16
+# SSIM below this marks a tile as changed (1.0 is identical)
+THRESHOLD = 0.98
+# Rows of context kept above and below the changes in a highlight
+CONTEXT = 200
+# Stabilizing constants of SSIM for a dynamic range of 255
+C1 = (0.01 * 255) ** 2
+C2 = (0.03 * 255) ** 2
+
+
+@dataclass
+class Region:
+    x: int
+    y: int
+    width: int
+    height: int
+    score: float  # lowest tile SSIM in the region
+
+
+@dataclass
+class DiffResult:
+    score: float  # mean tile SSIM over the common area
+    changed_fraction: float  # share of tiles below the threshold
+    regions: list[Region] = field(default_factory=list)
+    size: tuple[int, int] = (0, 0)  # (width, height) of the current image
+    baseline_size: tuple[int, int] = (0, 0)
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.regions)
+
+
+def luma(image: Image.Image) -> np.ndarray:
+    """8-bit luma (ITU-R 601, as converted by Pillow) of an image, shape (height, width)."""
+    return np.asarray(image if image.mode == 'L' else image.convert('L'))
+
+
+def _pad(array: np.ndarray, block: int) -> np.ndarray:
+    """array edge-padded to a whole number of tiles."""
+    pad_y, pad_x = -array.shape[0] % block, -array.shape[1] % block
+    if pad_y or pad_x:
+        array = np.pad(array, ((0, pad_y), (0, pad_x)), mode='edge')
+    return array
+
+
+def _tile_means(array: np.ndarray, block: int) -> np.ndarray:
+    """Mean of every block x block tile of an array whose sides are multiples of block."""
+    height, width = array.shape
+    # Two contiguous partial sums (along rows, then down the columns) beat one strided reduction
+    sums = array.reshape(height, width // block, block).sum(axis=2)
+    sums = sums.reshape(height // block, block, width // block).sum(axis=1)
+    return sums.astype(np.float64) / (block * block)
+
+
+def block_ssim(a: np.ndarray, b: np.ndarray, block: int = BLOCK) -> np.ndarray:
+    """SSIM of every block x block tile of two equally sized luma arrays."""
+    x = _pad(a, block).astype(np.float32)
+    y = _pad(b, block).astype(np.float32)
+    mean_x, mean_y = _tile_means(x, block), _tile_means(y, block)
+    var_x = _tile_means(x * x, block) - mean_x ** 2
+    var_y = _tile_means(y * y, block) - mean_y ** 2
+    covariance = _tile_means(x * y, block) - mean_x * mean_y
+    return (((2 * mean_x * mean_y + C1) * (2 * covariance + C2))
+            / ((mean_x ** 2 + mean_y ** 2 + C1) * (var_x + var_y + C2)))
+
+
+def tile_scores(a: np.ndarray, b: np.ndarray, block: int = BLOCK) -> np.ndarray:
+    """block_ssim() computed only over the bands of tile rows where a and b differ.
+
+    Identical tiles score exactly 1, and a page change usually touches a few
+    bands of a tall capture, so the statistics are skipped everywhere else.
+    """
+    rows, cols = -(-a.shape[0] // block), -(-a.shape[1] // block)
+    scores = np.ones((rows, cols))
+    changed_lines = np.zeros(rows * block, dtype=bool)
+    changed_lines[:a.shape[0]] = (a != b).any(axis=1)
+    differing = np.flatnonzero(changed_lines.reshape(rows, block).any(axis=1))
+    if differing.size:
+        lines = (differing[:, None] * block + np.arange(block)).ravel()
+        scores[differing] = block_ssim(_pad(a, block)[lines], _pad(b, block)[lines], block)
+    return scores
+
+
+def changed_regions(scores: np.ndarray, threshold: float = THRESHOLD,
+                    block: int = BLOCK) -> list[Region]:
+    """Bounding boxes (in pixels) of the connected groups of changed tiles."""
+    labels, count = ndimage.label(scores < threshold, structure=np.ones((3, 3)))
+    regions = []
+    for index, (rows, cols) in enumerate(ndimage.find_objects(labels), start=1):
+        score = float(scores[rows, cols][labels[rows, cols] == index].min())
+        regions.append(Region(cols.start * block, rows.start * block,
+                              (cols.stop - cols.start) * block,
+                              (rows.stop - rows.start) * block, round(score, 4)))
+    return regions
+
+
+def compare(baseline: Image.Image, current: Image.Image, threshold: float = THRESHOLD,
+            block: int = BLOCK) -> DiffResult:
+    """Perceptual diff of two screenshots."""
+    a, b = luma(baseline), luma(current)
+    height = min(a.shape[0], b.shape[0])
+    width = min(a.shape[1], b.shape[1])
+    scores = tile_scores(a[:height, :width], b[:height, :width], block)
+    regions = changed_regions(scores, threshold, block)
+
+    # Regions are clipped to the image; rows only one capture has are a change of their own
+    for region in regions:
+        region.width = min(region.width, width - region.x)
+        region.height = min(region.height, height - region.y)
+    taller = max(a.shape[0], b.shape[0])
+    if taller > height:
+        regions.append(Region(0, height, max(a.shape[1], b.shape[1]), taller - height, 0.0))
+    if a.shape[1] != b.shape[1]:
+        regions.append(Region(width, 0, abs(a.shape[1] - b.shape[1]), height, 0.0))
+
+    return DiffResult(
+        score=round(float(scores.mean()), 4),
+        changed_fraction=round(float((scores < threshold).mean()), 4),
+        regions=regions,
+        size=current.size,
+        baseline_size=baseline.size,
+    )
+
+
+def compare_files(baseline: Path, current: Path, threshold: float = THRESHOLD,
+                  output: Optional[Path] = None) -> DiffResult:
+    """compare() for two image files; optionally writes the changed band with regions boxed.
+
+    Captures of an unchanged page are usually byte-identical files, and
+    decoding a tall PNG costs far more than diffing it, so those are not decoded.
+    """
+    with Image.open(baseline) as old, Image.open(current) as new:
+        if baseline.read_bytes() == current.read_bytes():
+            return DiffResult(1.0, 0.0, [], new.size, old.size)
+        result = compare(old, new, threshold)
+        if output is not None and result.changed:
+            # Only the band around the changes: encoding a whole tall page is the slow part
+            top = max(0, min(r.y for r in result.regions) - CONTEXT)
+            bottom = min(new.height, max(r.y + r.height for r in result.regions) + CONTEXT)
+            band = new.crop((0, top, new.width, bottom))
+            shifted = [Region(r.x, r.y - top, r.width, r.height, r.score) for r in result.regions]
+            highlight(band, shifted).save(output, compress_level=1)
+    return result
+
+
+def highlight(image: Image.Image, regions: list[Region]) -> Image.Image:
+    """Copy of image with a red box around every region."""
+    marked = image.convert('RGB')
+    draw = ImageDraw.Draw(marked)
+    for region in regions:
+        draw.rectangle([region.x, region.y, region.x + region.width - 1,
+                        region.y + region.height - 1], outline=(220, 0, 0), width=3)
+    return marked
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Blockwise SSIM diff of two screenshots")
+    parser.add_argument('baseline', type=Path)
+    parser.add_argument('current', type=Path)
+    parser.add_argument('--threshold', type=float, default=THRESHOLD,
+                        help="Tile SSIM below which a tile counts as changed")
+    parser.add_argument('--output', type=Path, help="Write the changed band, regions boxed")
+    args = parser.parse_args(argv)
+
+    result = compare_files(args.baseline, args.current, args.threshold, args.output)
+    print(f"SSIM {result.score:.4f}, {result.changed_fraction:.1%} of tiles changed, "
+          f"{len(result.regions)} regions")
+    for region in result.regions:
+        print(f"  {region.width}x{region.height} at ({region.x}, {region.y}), "
+              f"SSIM {region.score:.3f}")
+    return 1 if result.changed else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,331 @@
+"""
+Offline link and anchor checker for the built site.
+
+Reads every HTML file in docs/_site (in a process pool for large sites) and
+builds an index of the files the site serves and the anchors (id, a[name])
+each page defines. Every internal href/src is then resolved the way GitHub
+Pages serves it (baseurl, directory index, extensionless .html) and every
+#fragment is checked against the target page's anchors. GitHub and Colab
+URLs that point into this repository are checked against the working tree.
+
+The week pages' PDF and notebook links are also checked at the source: the
+links written in docs/weeks/*.md and the slides/notebooks the week layout
+renders from docs/_data/weeks.yml. That pass needs no built site.
+
+Results are merged into quality_report.json (same schema as
+quality_check.py: one entry per page with broken links, plus a summary).
+
+Usage:
+    python scripts/link_check.py                 # after `jekyll build` in docs/
+    python scripts/link_check.py --workers 4 --no-report
+    python scripts/link_check.py --sources-only  # docs/weeks/*.md links only
+"""
+
+import html
+import os
+import posixpath
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+from urllib.parse import unquote, urljoin, urlsplit
+
+import yaml
+
+from quality_check import BASE_URL, REPORT_PATH, SITE_DIR, merge_report
+
+ROOT = Path(__file__).parent.parent
+DOCS_DIR = ROOT / 'docs'
+REPOSITORY = 'Digital-AI-Finance/agentic-artificial-intelligence'
+
+# Regex extraction instead of a full HTML parser: an order of magnitude faster
+TAG_URL = re.compile(
+    r'<(a|link|img|script|iframe|source)\s[^>]*?\b(?:href|src)\s*=\s*'
+    r'(?:"([^"]*)"|\'([^\']*)\'|([^\s"\'>]+))[^>]*>',
+    re.IGNORECASE,
+)
+ID = re.compile(r'<[a-zA-Z][^>]*?\sid\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s"\'>]+))')
+A_NAME = re.compile(r'<a\s[^>]*?\bname\s*=\s*(?:"([^"]*)"|\'([^\']*)\')', re.IGNORECASE)
+# <link rel=...> values that are hints, not resources
+LINK_HINT = re.compile(r'\brel\s*=\s*["\']?[^"\'>]*\b(?:preconnect|dns-prefetch)\b', re.IGNORECASE)
+SKIPPED_SCHEMES = ('mailto:', 'tel:', 'javascript:', 'data:')
+
+REPO_URL = re.compile(
+    r'^https?://(?:github\.com/' + re.escape(REPOSITORY) + r'/(?:blob|raw|tree)/main/'
+    r'|colab\.research\.google\.com/github/' + re.escape(REPOSITORY) + r'/blob/main/'
+    r'|raw\.githubusercontent\.com/' + re.escape(REPOSITORY) + r'/main/)(?P<path>[^?#]*)'
+)
+MARKDOWN_LINK = re.compile(r'\]\(\s*<?([^)\s>]+)>?(?:\s+"[^"]*")?\s*\)')
+HTML_HREF = re.compile(r'\b(?:href|src)\s*=\s*"([^"]+)"')
+LIQUID_URL = re.compile(r"\{\{\s*'([^']*)'\s*\|\s*relative_url\s*\}\}")
+SOURCE_SUFFIXES = ('.pdf', '.ipynb')
+
+
+@dataclass
+class Broken:
+    page: str
+    href: str
+    reason: str
+
+
+def _value(groups) -> str:
+    value = next((g for g in groups if g is not None), '')
+    return html.unescape(value) if '&' in value else value
+
+
+def extract(content: str) -> tuple[set[str], list[tuple[str, str]]]:
+    """Anchors defined by a page and its (tag, url) links."""
+    anchors = {_value(m.groups()) for m in ID.finditer(content)}
+    anchors.update(_value(m.groups()) for m in A_NAME.finditer(content))
+    links = []
+    for match in TAG_URL.finditer(content):
+        tag = match.group(1).lower()
+        url = _value(match.groups()[1:]).strip()
+        if not url or (tag == 'link' and LINK_HINT.search(match.group(0))):
+            continue
+        links.append((tag, url))
+    return anchors, links
+
+
+def _extract_files(paths: list[str]) -> list[tuple[str, set[str], list[tuple[str, str]]]]:
+    results = []
+    for path in paths:
+        content = Path(path).read_text(encoding='utf-8', errors='replace')
+        anchors, links = extract(content)
+        results.append((path, anchors, links))
+    return results
+
+
+def index_site(site_dir: Path, workers: int = 1) -> tuple[set[str], dict[str, set[str]],
+                                                          dict[str, list[tuple[str, str]]]]:
+    """Files served by the site, anchors per HTML page, and links per HTML page."""
+    files, pages = set(), []
+    for dirpath, _, filenames in os.walk(site_dir):
+        for filename in filenames:
+            rel = Path(dirpath, filename).relative_to(site_dir).as_posix()
+            files.add(rel)
+            if filename.endswith('.html'):
+                pages.append(str(site_dir / rel))
+    pages.sort()
+
+    if workers > 1 and len(pages) > 50:
+        # A few chunks per worker keeps the pool busy without per-file overhead
+        size = max(1, len(pages) // (workers * 4))
+        chunks = [pages[i:i + size] for i in range(0, len(pages), size)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            extracted = [item for chunk in pool.map(_extract_files, chunks) for item in chunk]
+    else:
+        extracted = _extract_files(pages)
+
+    anchors, links = {}, {}
+    for path, page_anchors, page_links in extracted:
+        rel = Path(path).relative_to(site_dir).as_posix()
+        anchors[rel] = page_anchors
+        links[rel] = page_links
+    return files, anchors, links
+
+
+def site_target(url: str, rel: str, baseurl: str) -> Optional[tuple[str, str]]:
+    """(absolute path, fragment) a link on page rel points to, or None for other sites."""
+    if url.startswith('//') or ':' in url.split('/', 1)[0].split('#', 1)[0]:
+        target = urlsplit(urljoin(f'http://site{baseurl}/{rel}', url))
+        return (target.path, target.fragment) if target.netloc == 'site' else None
+    # Plain paths (almost every link) are resolved without urljoin
+    url, _, fragment = url.partition('#')
+    path = url.partition('?')[0]
+    if not path:
+        return f'{baseurl}/{rel}', fragment
+    if not path.startswith('/'):
+        directory = rel.rsplit('/', 1)[0] if '/' in rel else ''
+        joined = posixpath.normpath(posixpath.join(f'{baseurl}/{directory}', path))
+        path = joined + '/' if path.endswith('/') and joined != '/' else joined
+    return path, fragment
+
+
+def resolve(path: str, files: set[str]) -> Optional[str]:
+    """Built file served for a site path (relative to the baseurl), or None."""
+    path = unquote(path).lstrip('/')
+    if path == '' or path.endswith('/'):
+        candidates = [path + 'index.html']
+    else:
+        candidates = [path, path + '.html', path + '/index.html']
+    return next((c for c in candidates if c in files), None)
+
+
+def check_link(tag: str, url: str, rel: str, files: set[str], anchors: dict[str, set[str]],
+               baseurl: str, root: Path = ROOT) -> Optional[str]:
+    """Reason a link from page rel is broken, or None if it resolves."""
+    if '{{' in url or '{%' in url:
+        return "unrendered Liquid"
+    if url.startswith(SKIPPED_SCHEMES):
+        return None
+    repo = REPO_URL.match(url)
+    if repo:
+        path = unquote(repo.group('path')).rstrip('/')
+        return None if (root / path).exists() else f"missing repository file {path}"
+    if url.startswith(BASE_URL + '/') or url == BASE_URL:
+        url = urlsplit(BASE_URL).path + url[len(BASE_URL):]
+
+    target = site_target(url, rel, baseurl)
+    if target is None:
+        return None  # external
+    path, fragment = target
+    if not (path + '/').startswith(baseurl + '/'):
+        return f"outside the site ({baseurl or '/'})"
+    resolved = resolve(path[len(baseurl):], files)
+    if resolved is None:
+        return "not found"
+    if fragment and tag == 'a' and resolved in anchors:
+        fragment = unquote(fragment)
+        if fragment != 'top' and fragment not in anchors[resolved]:
+            return f"missing anchor #{fragment}"
+    return None
+
+
+def check_site(site_dir: Path = SITE_DIR, baseurl: str = urlsplit(BASE_URL).path,
+               workers: int = 1, root: Path = ROOT) -> tuple[list[Broken], dict]:
+    """Broken links of every page in the built site, plus statistics."""
+    baseurl = baseurl.rstrip('/')
+    files, anchors, links = index_site(site_dir, workers)
+    broken, checked = [], 0
+    # Identical links repeat on every page (navigation); resolve each once per page directory
+    cache: dict[tuple, Optional[str]] = {}
+    for rel, page_links in links.items():
+        directory = rel.rsplit('/', 1)[0] if '/' in rel else ''
+        for tag, url in page_links:
+            checked += 1
+            key = (tag, url) if url.startswith(('/', 'http')) else (tag, url, directory)
+            if url.startswith(('#', '?')):
+                key = (tag, url, rel)
+            if key not in cache:
+                cache[key] = check_link(tag, url, rel, files, anchors, baseurl, root)
+            if cache[key]:
+                broken.append(Broken(rel, url, cache[key]))
+    stats = {'pages': len(links), 'files': len(files), 'links': checked,
+             'anchors': sum(len(a) for a in anchors.values())}
+    return broken, stats
+
+
+def week_source_links(docs_dir: Path = DOCS_DIR) -> list[tuple[str, str]]:
+    """(week page, url) for the PDF and notebook links of every docs/weeks/*.md page.
+
+    Covers links written in the page itself and the slides and notebooks the
+    week layout renders from docs/_data/weeks.yml for its week_number.
+    """
+    weeks_file = docs_dir / '_data' / 'weeks.yml'
+    weeks = {}
+    if weeks_file.exists():
+        weeks = {w['number']: w for w in yaml.safe_load(weeks_file.read_text(encoding='utf-8'))}
+
+    links = []
+    for path in sorted((docs_dir / 'weeks').glob('*.md')):
+        content = LIQUID_URL.sub(lambda m: m.group(1), path.read_text(encoding='utf-8'))
+        name = f'weeks/{path.name}'
+        found = MARKDOWN_LINK.findall(content) + HTML_HREF.findall(content)
+        for url in found:
+            if urlsplit(url).path.endswith(SOURCE_SUFFIXES):
+                links.append((name, url))
+
+        match = re.search(r'^week_number:\s*(\d+)', content, re.MULTILINE)
+        week = weeks.get(int(match.group(1))) if match else None
+        if week:
+            links.append((name, f"/slides/{week['folder']}.pdf"))
+            for notebook in week.get('notebooks', []):
+                links.append((name, f"https://colab.research.google.com/github/{REPOSITORY}"
+                                    f"/blob/main/{week['folder']}/{notebook['file']}"))
+    return links
+
+
+def check_sources(docs_dir: Path = DOCS_DIR, root: Path = ROOT) -> tuple[list[Broken], int]:
+    """Broken PDF/notebook links of the week pages, checked against docs/ and the repository."""
+    broken = []
+    links = week_source_links(docs_dir)
+    for page, url in links:
+        repo = REPO_URL.match(url)
+        if repo:
+            path = unquote(repo.group('path'))
+            if not (root / path).exists():
+                broken.append(Broken(page, url, f"missing repository file {path}"))
+            continue
+        if urlsplit(url).netloc:
+            continue  # external
+        path = unquote(urlsplit(url).path)
+        target = docs_dir / path.lstrip('/') if path.startswith('/') else docs_dir / 'weeks' / path
+        if not target.exists():
+            broken.append(Broken(page, url, "not found"))
+    return broken, len(links)
+
+
+def report_entries(broken: list[Broken], stats: dict) -> list[dict]:
+    """quality_report.json entries: one per page with broken links, then a summary."""
+    by_page: dict[str, list[Broken]] = {}
+    for item in broken:
+        by_page.setdefault(item.page, []).append(item)
+    entries = []
+    for page, items in sorted(by_page.items()):
+        if page.endswith('.md'):
+            page_path = page[:-len('.md')] + '.html'
+        elif page.endswith('index.html'):
+            page_path = page[:-len('index.html')]
+        else:
+            page_path = page
+        entries.append({
+            'name': f'Links: {page}',
+            'url': f'{BASE_URL}/{page_path}',
+            'status': 'issues',
+            'issues': [f"{item.reason}: {item.href}" for item in items],
+        })
+    summary = f"{stats['links']} links on {stats['pages']} pages, {len(broken)} broken"
+    entries.append({
+        'name': 'Links',
+        'url': BASE_URL + '/',
+        'status': 'issues' if broken else 'pass',
+        'issues': [summary] if broken else [],
+    })
+    return entries
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Check internal links and anchors offline")
+    parser.add_argument('--site', type=Path, default=SITE_DIR, help="Built site (jekyll output)")
+    parser.add_argument('--baseurl', default=urlsplit(BASE_URL).path,
+                        help="Base URL the site was built with")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="Processes used to read the pages")
+    parser.add_argument('--sources-only', action='store_true',
+                        help="Only check the PDF/notebook links of docs/weeks/*.md")
+    parser.add_argument('--no-report', action='store_true',
+                        help="Do not update quality_report.json")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    broken, source_links = check_sources()
+    stats = {'pages': 0, 'files': 0, 'links': source_links, 'anchors': 0}
+    if not args.sources_only:
+        if not (args.site / 'index.html').exists():
+            print(f"No built site in {args.site}; run `bundle exec jekyll build` in docs/ "
+                  f"or use --sources-only")
+            return 1
+        site_broken, site_stats = check_site(args.site, args.baseurl, args.workers)
+        broken += site_broken
+        stats = {key: stats[key] + site_stats[key] for key in stats}
+    elapsed = time.perf_counter() - start
+
+    for item in broken:
+        print(f"BROKEN {item.page}: {item.href} ({item.reason})")
+    print(f"\nChecked {stats['links']} links on {stats['pages']} pages "
+          f"({stats['files']} files, {stats['anchors']} anchors) in {elapsed:.2f}s: "
+          f"{len(broken)} broken")
+
+    if not args.no_report:
+        merge_report(report_entries(broken, stats), 'Links')
+        print(f"Report: {REPORT_PATH}")
+    return 1 if broken else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,282 @@
+"""
+Page-weight and render-performance budgets for the course website.
+
+Serves the built site (docs/_site) locally, loads every audited page in a
+fresh browser context (cold cache) and reads the Navigation, Resource and
+Paint Timing entries of the page: transfer bytes, request count, largest
+asset, first contentful paint and DOMContentLoaded. Off-site requests are
+blocked so the numbers depend only on the build; they are counted apart.
+The site's service worker is blocked too, so its precache downloads do not
+compete with the page being timed.
+
+Each page is held to the budget of its page type (home, week, gallery,
+reference); budgets can be overridden from a YAML file. The metrics are
+written to perf_report.json and compared with the previous report: the
+audit fails when a page is over budget or heavier (bytes or requests)
+than before. Pages are loaded one at a time so timings are not skewed by
+concurrent loads. A summary per page is merged into quality_report.json.
+
+Usage:
+    python scripts/perf_budget.py                    # after `jekyll build` in docs/
+    python scripts/perf_budget.py --budgets budgets.yml --previous old/perf_report.json
+"""
+
+import asyncio
+import copy
+import json
+import time
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlsplit
+
+import yaml
+
+from quality_check import BASE_URL, SITE_DIR, VIEWPORT, merge_report, pages_to_check, serve_site
+
+ROOT = Path(__file__).parent.parent
+PERF_REPORT_PATH = ROOT / 'perf_report.json'
+
+# Budgets per page type; transfer sizes in KB, timings in ms
+BUDGETS = {
+    'home': {'transfer_kb': 600, 'requests': 40, 'largest_asset_kb': 250,
+             'fcp_ms': 1500, 'dcl_ms': 2000},
+    'week': {'transfer_kb': 800, 'requests': 50, 'largest_asset_kb': 300,
+             'fcp_ms': 1500, 'dcl_ms': 2000},
+    # Chart gallery and slide listing: many thumbnails, PDFs linked not embedded
+    'gallery': {'transfer_kb': 3000, 'requests': 120, 'largest_asset_kb': 500,
+                'fcp_ms': 2000, 'dcl_ms': 3000},
+    'reference': {'transfer_kb': 700, 'requests': 45, 'largest_asset_kb': 300,
+                  'fcp_ms': 1500, 'dcl_ms': 2000},
+}
+# A page is "heavier" past this growth, so that rebuild noise is not a regression
+HEAVIER_TOLERANCE_BYTES = 1024
+HEAVIER_TOLERANCE_REQUESTS = 0
+
+GALLERY_PAGES = ('/charts.html', '/slides.html', '/visual-assets.html')
+
+# Runs in the page after load; transferSize is 0 for cached files, so fall back to the body size
+METRICS_SCRIPT = """() => {
+  const nav = performance.getEntriesByType('navigation')[0];
+  const entries = [nav, ...performance.getEntriesByType('resource')].filter(Boolean);
+  const paint = performance.getEntriesByName('first-contentful-paint')[0];
+  return {
+    entries: entries.map(e => ({url: e.name, bytes: e.transferSize || e.encodedBodySize || 0})),
+    fcp: paint ? paint.startTime : null,
+    dcl: nav ? nav.domContentLoadedEventEnd : null,
+  };
+}"""
+
+
+def pages_to_measure() -> list[tuple[str, str]]:
+    """The quality-check pages plus the asset-heavy gallery pages."""
+    return pages_to_check() + [
+        ('/charts.html', 'Charts'),
+        ('/slides.html', 'Slides'),
+        ('/visual-assets.html', 'Visual Assets'),
+    ]
+
+
+def page_type(path: str) -> str:
+    if path == '/':
+        return 'home'
+    if path.startswith('/weeks/'):
+        return 'week'
+    if path in GALLERY_PAGES:
+        return 'gallery'
+    return 'reference'
+
+
+def load_budgets(path: Optional[Path] = None) -> dict[str, dict]:
+    """BUDGETS, with the per-type values of a YAML file (if given) taking precedence."""
+    budgets = copy.deepcopy(BUDGETS)
+    if path is not None:
+        overrides = yaml.safe_load(path.read_text(encoding='utf-8')) or {}
+        for kind, values in overrides.items():
+            budgets.setdefault(kind, {}).update(values)
+    return budgets
+
+
+def summarize(entries: list[dict], fcp: Optional[float], dcl: Optional[float],
+              origin: str, blocked: int = 0) -> dict:
+    """Page metrics from timing entries [{url, bytes}]; off-origin requests are only counted."""
+    local = [e for e in entries if e['url'].startswith(origin)]
+    external = {e['url'] for e in entries if not e['url'].startswith(origin)}
+    largest = max(local, key=lambda e: e['bytes'], default={'url': '', 'bytes': 0})
+    return {
+        'transfer_bytes': sum(e['bytes'] for e in local),
+        'requests': len(local),
+        # Aborted requests may or may not leave a timing entry
+        'external_requests': max(len(external), blocked),
+        'largest_asset': {'url': urlsplit(largest['url']).path, 'bytes': largest['bytes']},
+        'fcp_ms': round(fcp, 1) if fcp is not None else None,
+        'dcl_ms': round(dcl, 1) if dcl is not None else None,
+    }
+
+
+def budget_issues(metrics: dict, budget: dict) -> list[str]:
+    """Budget overruns of one page."""
+    issues = []
+    checks = [
+        ('transfer_kb', metrics['transfer_bytes'] / 1024, "Transfer {:.0f} KB > {} KB"),
+        ('requests', metrics['requests'], "{} requests > {}"),
+        ('largest_asset_kb', metrics['largest_asset']['bytes'] / 1024,
+         "Largest asset {:.0f} KB > {} KB (" + metrics['largest_asset']['url'] + ")"),
+        ('fcp_ms', metrics['fcp_ms'], "First contentful paint {:.0f} ms > {} ms"),
+        ('dcl_ms', metrics['dcl_ms'], "DOMContentLoaded {:.0f} ms > {} ms"),
+    ]
+    for key, value, message in checks:
+        if key in budget and value is not None and value > budget[key]:
+            issues.append(message.format(value, budget[key]))
+    return issues
+
+
+def regressions(previous: dict, metrics: dict) -> list[str]:
+    """How a page got heavier than in the previous report."""
+    issues = []
+    grown = metrics['transfer_bytes'] - previous['transfer_bytes']
+    if grown > HEAVIER_TOLERANCE_BYTES:
+        issues.append(f"Heavier by {grown / 1024:.1f} KB "
+                      f"({previous['transfer_bytes'] / 1024:.0f} -> "
+                      f"{metrics['transfer_bytes'] / 1024:.0f} KB)")
+    added = metrics['requests'] - previous['requests']
+    if added > HEAVIER_TOLERANCE_REQUESTS:
+        issues.append(f"{added} more requests ({previous['requests']} -> {metrics['requests']})")
+    return issues
+
+
+def evaluate(measured: dict[str, dict], budgets: dict[str, dict],
+             previous: Optional[dict] = None) -> list[dict]:
+    """Report entries {name, url, type, metrics, delta, status, issues} in page order."""
+    previous_pages = (previous or {}).get('pages', {})
+    results = []
+    for path, (name, metrics) in measured.items():
+        kind = page_type(path)
+        entry = {'name': name, 'url': BASE_URL + path, 'type': kind}
+        if 'error' in metrics:
+            results.append({**entry, 'status': 'error', 'issues': [metrics['error']]})
+            continue
+        entry['metrics'] = metrics
+        issues = budget_issues(metrics, budgets.get(kind, {}))
+        before = previous_pages.get(path, {}).get('metrics')
+        if before:
+            entry['delta'] = {
+                'transfer_bytes': metrics['transfer_bytes'] - before['transfer_bytes'],
+                'requests': metrics['requests'] - before['requests'],
+            }
+            issues += regressions(before, metrics)
+        entry['status'] = 'pass' if not issues else 'issues'
+        entry['issues'] = issues
+        results.append(entry)
+    return results
+
+
+def load_report(path: Path) -> Optional[dict]:
+    try:
+        return json.loads(path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+
+
+async def measure_async(base_url: str, pages: list[tuple[str, str]]) -> dict[str, tuple]:
+    """{path: (name, metrics)} for every page, each loaded cold in its own context."""
+    from playwright.async_api import async_playwright
+
+    origin = '{0.scheme}://{0.netloc}'.format(urlsplit(base_url))
+    measured = {}
+    blocked = set()
+
+    async def block_off_site(route):
+        if route.request.url.startswith(origin):
+            await route.continue_()
+        else:
+            blocked.add(route.request.url)
+            await route.abort()
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        for path, name in pages:
+            blocked.clear()
+            # No service worker: its precache downloads would compete with the timed load
+            context = await browser.new_context(viewport=VIEWPORT, service_workers='block')
+            await context.route('**/*', block_off_site)
+            await context.add_init_script('performance.setResourceTimingBufferSize(2000)')
+            page = await context.new_page()
+            try:
+                await page.goto(base_url + path, wait_until='load', timeout=30000)
+                data = await page.evaluate(METRICS_SCRIPT)
+                measured[path] = (name, summarize(data['entries'], data['fcp'], data['dcl'],
+                                                  origin, len(blocked)))
+            except Exception as e:
+                measured[path] = (name, {'error': str(e)})
+            finally:
+                await context.close()
+        await browser.close()
+    return measured
+
+
+def print_entry(entry: dict):
+    if entry['status'] == 'error':
+        print(f"ERROR  {entry['name']:20} {entry['issues'][0]}")
+        return
+    metrics = entry['metrics']
+    delta = entry.get('delta')
+    change = f" ({delta['transfer_bytes'] / 1024:+.1f} KB)" if delta else ''
+    fcp = f"{metrics['fcp_ms']:.0f} ms" if metrics['fcp_ms'] is not None else 'n/a'
+    print(f"{'OK' if entry['status'] == 'pass' else 'OVER':6} {entry['name']:20} "
+          f"{metrics['transfer_bytes'] / 1024:8.1f} KB{change:14} {metrics['requests']:4} req  "
+          f"FCP {fcp}")
+    for issue in entry['issues']:
+        print(f"       - {issue}")
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Page-weight and performance budget audit")
+    parser.add_argument('--site', type=Path, default=SITE_DIR, help="Built site to serve")
+    parser.add_argument('--budgets', type=Path, help="YAML file of per-page-type budgets")
+    parser.add_argument('--previous', type=Path,
+                        help="Report to diff against (default: the existing perf_report.json)")
+    parser.add_argument('--no-report', action='store_true',
+                        help="Do not write perf_report.json or update quality_report.json")
+    args = parser.parse_args(argv)
+
+    if not (args.site / 'index.html').exists():
+        print(f"No built site in {args.site}; run `bundle exec jekyll build` in docs/ first")
+        return 1
+    budgets = load_budgets(args.budgets)
+    previous = load_report(args.previous or PERF_REPORT_PATH)
+
+    print("Performance Budget Report")
+    print("=" * 60)
+    start = time.perf_counter()
+    server, local_url = serve_site(args.site)
+    try:
+        measured = asyncio.run(measure_async(local_url, pages_to_measure()))
+    finally:
+        server.shutdown()
+    results = evaluate(measured, budgets, previous)
+    for entry in results:
+        print_entry(entry)
+
+    passed = sum(1 for r in results if r['status'] == 'pass')
+    over = sum(1 for r in results if r['status'] == 'issues')
+    errors = sum(1 for r in results if r['status'] == 'error')
+    total = sum(r['metrics']['transfer_bytes'] for r in results if 'metrics' in r)
+    print("\n" + "=" * 60)
+    print(f"Summary: {passed} within budget, {over} over budget or heavier, {errors} errors; "
+          f"{total / 1024:.0f} KB in {time.perf_counter() - start:.1f}s")
+
+    if not args.no_report:
+        report = {'generated': time.strftime('%Y-%m-%dT%H:%M:%S'), 'budgets': budgets,
+                  'pages': dict(zip(measured, results))}
+        PERF_REPORT_PATH.write_text(json.dumps(report, indent=2) + '\n', encoding='utf-8')
+        merge_report([{'name': f"Performance: {r['name']}", 'url': r['url'],
+                       'status': r['status'], 'issues': r['issues']} for r in results],
+                     'Performance')
+        print(f"\nDetailed report: {PERF_REPORT_PATH}")
+    return 0 if passed == len(results) else 1
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
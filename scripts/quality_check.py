@@ -1,104 +1,280 @@
-"""Quality and accessibility check for the course website."""
-from playwright.sync_api import sync_playwright
-from pathlib import Path
+"""Quality and accessibility check for the course website.
+
+By default the live site is audited page by page. With --local the built
+site (docs/_site) is served from a local HTTP server and audited concurrently
+with asyncio Playwright: several browser contexts, each with a few pages,
+pull from a shared queue. Off-site requests (analytics, fonts) and the
+site's service worker are blocked in local mode so the results do not depend
+on the network or on precaching.
+
+Both modes run the same checks and write their entries into
+quality_report.json in the same schema, keeping the entries the link check,
+performance budget and visual suites merge in; report URLs always point at
+the public site so reports from either mode can be compared directly.
+
+Usage:
+    python scripts/quality_check.py
+    python scripts/quality_check.py --local                  # after `jekyll build` in docs/
+    python scripts/quality_check.py --local --contexts 6 --pages-per-context 3
+"""
+import asyncio
+import functools
 import json
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlsplit
 
 BASE_URL = 'https://digital-ai-finance.github.io/agentic-artificial-intelligence'
+SITE_DIR = Path(__file__).parent.parent / 'docs' / '_site'
+REPORT_PATH = Path(__file__).parent.parent / 'quality_report.json'
 
-def check_page(page, url, name):
-    """Check a single page for quality issues."""
-    issues = []
+MAIN_SELECTOR = 'main, article, .main-content'
+MISSING_ALT_SELECTOR = 'img:not([alt]), img[alt=""]'
+NAV_SELECTOR = 'nav, [role="navigation"]'
+VIEWPORT = {'width': 1920, 'height': 1080}
+# Name prefixes of the entries other tools merge into the report; the rest are page checks
+REPORT_PREFIXES = ('Links', 'Performance', 'Visual')
 
-    try:
-        response = page.goto(url, wait_until='networkidle', timeout=30000)
-        if response.status != 200:
-            issues.append(f"HTTP {response.status}")
-            return {'name': name, 'url': url, 'status': 'error', 'issues': issues}
-    except Exception as e:
-        return {'name': name, 'url': url, 'status': 'error', 'issues': [str(e)]}
+
+def pages_to_check():
+    """(path, name) of every audited page (note: .html extension required)."""
+    pages = [
+        ('/', 'Home'),
+        ('/glossary.html', 'Glossary'),
+        ('/quizzes.html', 'Quizzes'),
+        ('/architectures.html', 'Architectures'),
+    ]
+    # Add all 12 weeks
+    for i in range(1, 13):
+        pages.append((f'/weeks/week-{i}.html', f'Week {i}'))
+    return pages
+
+
+def page_issues(title, main_visible, h1_count, missing_alt, nav_visible):
+    """Issues for the facts gathered from one rendered page."""
+    issues = []
 
     # Check for page title
-    title = page.title()
     if not title or len(title) < 5:
         issues.append("Missing or short page title")
 
     # Check for main content
-    main = page.locator('main, article, .main-content').first
-    if not main.is_visible():
+    if not main_visible:
         issues.append("No main content area found")
 
     # Check for headings hierarchy
-    h1_count = page.locator('h1').count()
     if h1_count == 0:
         issues.append("No H1 heading")
     elif h1_count > 1:
         issues.append(f"Multiple H1 headings ({h1_count})")
 
     # Check for images without alt text
-    images = page.locator('img:not([alt]), img[alt=""]').all()
-    if images:
-        issues.append(f"{len(images)} images missing alt text")
-
-    # Check for broken internal links
-    links = page.locator('a[href^="/"], a[href^="./"], a[href^="../"]').all()
-    broken = 0
-    for link in links[:10]:  # Check first 10 internal links
-        href = link.get_attribute('href')
-        if href and not href.startswith('#'):
-            try:
-                full_url = f"{BASE_URL}{href}" if href.startswith('/') else href
-                # Just check if the element is valid, don't navigate
-            except:
-                broken += 1
-
-    # Check for skip link (accessibility)
-    skip_link = page.locator('a[href="#main-content"], a[href="#content"], .skip-link').first
-    if not skip_link.is_visible():
-        pass  # Skip link check - optional for this site
+    if missing_alt:
+        issues.append(f"{missing_alt} images missing alt text")
 
     # Check for navigation
-    nav = page.locator('nav, [role="navigation"]').first
-    if not nav.is_visible():
+    if not nav_visible:
         issues.append("No navigation element")
+    return issues
+
 
+def page_result(name, url, issues):
     status = 'pass' if not issues else 'issues'
     return {'name': name, 'url': url, 'status': status, 'issues': issues}
 
 
-def main():
-    results = []
+def check_page(page, url, name):
+    """Check a single page for quality issues."""
+    try:
+        response = page.goto(url, wait_until='networkidle', timeout=30000)
+        if response.status != 200:
+            return {'name': name, 'url': url, 'status': 'error',
+                    'issues': [f"HTTP {response.status}"]}
+    except Exception as e:
+        return {'name': name, 'url': url, 'status': 'error', 'issues': [str(e)]}
+
+    issues = page_issues(
+        page.title(),
+        page.locator(MAIN_SELECTOR).first.is_visible(),
+        page.locator('h1').count(),
+        page.locator(MISSING_ALT_SELECTOR).count(),
+        page.locator(NAV_SELECTOR).first.is_visible(),
+    )
+    return page_result(name, url, issues)
+
+
+async def check_page_async(page, url, name, report_url):
+    """Async twin of check_page; the result carries report_url instead of the audited URL."""
+    try:
+        response = await page.goto(url, wait_until='load', timeout=15000)
+        if response is None or response.status != 200:
+            status = response.status if response is not None else 'no response'
+            return {'name': name, 'url': report_url, 'status': 'error',
+                    'issues': [f"HTTP {status}"]}
+    except Exception as e:
+        return {'name': name, 'url': report_url, 'status': 'error', 'issues': [str(e)]}
+
+    issues = page_issues(
+        await page.title(),
+        await page.locator(MAIN_SELECTOR).first.is_visible(),
+        await page.locator('h1').count(),
+        await page.locator(MISSING_ALT_SELECTOR).count(),
+        await page.locator(NAV_SELECTOR).first.is_visible(),
+    )
+    return page_result(name, report_url, issues)
+
+
+class SiteRequestHandler(SimpleHTTPRequestHandler):
+    """Serves a built site under its baseurl, resolving extensionless pages like GitHub Pages."""
+
+    prefix = ''
+
+    def translate_path(self, path):
+        path = urlsplit(path).path
+        if self.prefix and path.startswith(self.prefix):
+            path = path[len(self.prefix):] or '/'
+        translated = super().translate_path(path)
+        if not Path(translated).exists() and Path(translated + '.html').is_file():
+            translated += '.html'
+        return translated
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve_site(site_dir, prefix=urlsplit(BASE_URL).path):
+    """Start a local server for site_dir in a background thread; returns (server, base URL)."""
+    handler = type('Handler', (SiteRequestHandler,), {'prefix': prefix.rstrip('/')})
+    server = ThreadingHTTPServer(('127.0.0.1', 0),
+                                 functools.partial(handler, directory=str(site_dir)))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address[:2]
+    return server, f'http://{host}:{port}{prefix.rstrip("/")}'
+
+
+async def audit_async(base_url, pages, contexts=4, pages_per_context=2, on_result=None):
+    """Audit pages concurrently across browser contexts; results follow the order of pages."""
+    from playwright.async_api import async_playwright
+
+    queue = asyncio.Queue()
+    for index, (path, name) in enumerate(pages):
+        queue.put_nowait((index, path, name))
+    results = [None] * len(pages)
+    origin = '{0.scheme}://{0.netloc}'.format(urlsplit(base_url))
+
+    async def block_off_site(route):
+        if route.request.url.startswith(origin):
+            await route.continue_()
+        else:
+            await route.abort()
+
+    async def worker(context):
+        page = await context.new_page()
+        while True:
+            try:
+                index, path, name = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            result = await check_page_async(page, base_url + path, name, BASE_URL + path)
+            results[index] = result
+            if on_result:
+                on_result(result)
+        await page.close()
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        browser_contexts = []
+        for _ in range(max(1, contexts)):
+            context = await browser.new_context(viewport=VIEWPORT, service_workers='block')
+            await context.route('**/*', block_off_site)
+            browser_contexts.append(context)
+        await asyncio.gather(*(
+            worker(context)
+            for context in browser_contexts
+            for _ in range(max(1, pages_per_context))
+        ))
+        await browser.close()
+    return results
 
+
+def audit_live(pages, on_result=None):
+    """Audit the live site one page at a time (the original mode)."""
+    from playwright.sync_api import sync_playwright
+
+    results = []
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=True)
-        page = browser.new_page(viewport={'width': 1920, 'height': 1080})
-
-        # Pages to check (note: .html extension required)
-        pages_to_check = [
-            ('/', 'Home'),
-            ('/glossary.html', 'Glossary'),
-            ('/quizzes.html', 'Quizzes'),
-            ('/architectures.html', 'Architectures'),
-        ]
-
-        # Add all 12 weeks
-        for i in range(1, 13):
-            pages_to_check.append((f'/weeks/week-{i}.html', f'Week {i}'))
-
-        print("Quality Check Report")
-        print("=" * 60)
-
-        for path, name in pages_to_check:
-            url = BASE_URL + path
-            result = check_page(page, url, name)
+        page = browser.new_page(viewport=VIEWPORT)
+        for path, name in pages:
+            result = check_page(page, BASE_URL + path, name)
             results.append(result)
+            if on_result:
+                on_result(result)
+        browser.close()
+    return results
 
-            status_icon = 'OK' if result['status'] == 'pass' else 'ISSUES' if result['status'] == 'issues' else 'ERROR'
-            print(f"{status_icon:6} {name:20} {url}")
-            if result['issues']:
-                for issue in result['issues']:
-                    print(f"       - {issue}")
 
-        browser.close()
+def print_result(result):
+    status_icon = ('OK' if result['status'] == 'pass'
+                   else 'ISSUES' if result['status'] == 'issues' else 'ERROR')
+    print(f"{status_icon:6} {result['name']:20} {result['url']}")
+    for issue in result['issues']:
+        print(f"       - {issue}")
+
+
+def merge_report(entries, prefix=None, path=REPORT_PATH):
+    """Replace the entries named prefix... of an existing report, keeping all others.
+
+    With prefix None the page checks (entries without one of REPORT_PREFIXES)
+    are replaced, and come first.
+    """
+    results = []
+    if path.exists():
+        try:
+            results = json.loads(path.read_text(encoding='utf-8'))
+        except json.JSONDecodeError:
+            results = []
+    if prefix is None:
+        others = [r for r in results if str(r.get('name', '')).startswith(REPORT_PREFIXES)]
+        results = entries + others
+    else:
+        results = [r for r in results if not str(r.get('name', '')).startswith(prefix)]
+        results += entries
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2)
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Quality and accessibility check for the site")
+    parser.add_argument('--local', action='store_true',
+                        help="Audit the locally built site concurrently instead of the live site")
+    parser.add_argument('--site', type=Path, default=SITE_DIR, help="Built site to serve (--local)")
+    parser.add_argument('--contexts', type=int, default=4, help="Browser contexts (--local)")
+    parser.add_argument('--pages-per-context', type=int, default=2,
+                        help="Concurrent pages per browser context (--local)")
+    args = parser.parse_args(argv)
+
+    print("Quality Check Report")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    if args.local:
+        if not (args.site / 'index.html').exists():
+            print(f"No built site in {args.site}; run `bundle exec jekyll build` in docs/ first")
+            return 1
+        server, local_url = serve_site(args.site)
+        try:
+            results = asyncio.run(audit_async(local_url, pages_to_check(), args.contexts,
+                                              args.pages_per_context, on_result=print_result))
+        finally:
+            server.shutdown()
+    else:
+        results = audit_live(pages_to_check(), on_result=print_result)
+    elapsed = time.perf_counter() - start
 
     # Summary
     print("\n" + "=" * 60)
@@ -107,13 +283,11 @@ def main():
     errors = sum(1 for r in results if r['status'] == 'error')
 
     print(f"Summary: {passed} passed, {with_issues} with issues, {errors} errors")
-    print(f"Total pages checked: {len(results)}")
+    print(f"Total pages checked: {len(results)} in {elapsed:.1f}s")
 
-    # Save results
-    output_path = Path(__file__).parent.parent / 'quality_report.json'
-    with open(output_path, 'w') as f:
-        json.dump(results, f, indent=2)
-    print(f"\nDetailed report: {output_path}")
+    # Save results, keeping the entries merged in by the other checks
+    merge_report(results)
+    print(f"\nDetailed report: {REPORT_PATH}")
 
     return 0 if errors == 0 else 1
 
@@ -1,34 +1,266 @@
-"""Take a screenshot of the course website to verify all 12 weeks are visible."""
-from playwright.sync_api import sync_playwright
+"""
+Visual regression suite for the course website.
+
+Serves the built site (docs/_site) locally and captures a full-page
+screenshot of every page at every viewport, concurrently (several browser
+contexts pulling from one queue). Animations, transitions and the caret are
+frozen, and off-site requests and the site's service worker blocked, so two
+captures of the same build are identical.
+
+Each capture is compared with its baseline using the blockwise SSIM of
+image_diff.py; for changed captures the changed band, regions boxed, is
+written to visual/diff/. Results go to visual/report.json and are merged into
+quality_report.json. Accept the current captures as the new baselines with
+--update.
+
+Usage:
+    python scripts/screenshot_website.py                        # after `jekyll build` in docs/
+    python scripts/screenshot_website.py --viewports desktop,mobile --contexts 6
+    python scripts/screenshot_website.py --compare-only         # re-diff the last captures
+    python scripts/screenshot_website.py --update               # accept as baselines
+"""
+
+import asyncio
+import json
+import os
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
 from pathlib import Path
+from typing import Optional
+from urllib.parse import urlsplit
+
+from image_diff import THRESHOLD, compare_files
+from quality_check import BASE_URL, SITE_DIR, merge_report, serve_site
+
+ROOT = Path(__file__).parent.parent
+VISUAL_DIR = ROOT / 'visual'
+BASELINE_DIR = VISUAL_DIR / 'baseline'
+CURRENT_DIR = VISUAL_DIR / 'current'
+DIFF_DIR = VISUAL_DIR / 'diff'
+VISUAL_REPORT_PATH = VISUAL_DIR / 'report.json'
+
+VIEWPORTS = {
+    'desktop': {'width': 1920, 'height': 1080},
+    'tablet': {'width': 768, 'height': 1024},
+    'mobile': {'width': 375, 'height': 812},
+}
+# Built pages that are not part of the course content
+SKIPPED_PAGES = {'404.html', 'offline.html'}
+SKIPPED_DIRS = {'assets', 'api'}
+STABILIZE_CSS = ('*, *::before, *::after { animation: none !important; '
+                 'transition: none !important; caret-color: transparent !important; }')
+
+
+def site_pages(site_dir: Path = SITE_DIR) -> list[str]:
+    """Site paths of every built page, in a stable order."""
+    paths = []
+    for path in sorted(site_dir.rglob('*.html')):
+        rel = path.relative_to(site_dir).as_posix()
+        if rel in SKIPPED_PAGES or rel.split('/', 1)[0] in SKIPPED_DIRS:
+            continue
+        paths.append('/' + rel[:-len('index.html')] if rel.endswith('index.html') else '/' + rel)
+    return paths
+
+
+def capture_name(path: str, viewport: str) -> str:
+    """File name of the capture of a page at a viewport, e.g. weeks__week-1@mobile.png."""
+    slug = path.strip('/').removesuffix('.html').replace('/', '__') or 'index'
+    return f'{slug}@{viewport}.png'
+
+
+async def capture_async(base_url: str, paths: list[str], viewports: list[str],
+                        output_dir: Path, contexts: int = 4,
+                        on_capture=None) -> dict[str, Optional[str]]:
+    """Capture every (page, viewport); {capture name: error message or None}."""
+    from playwright.async_api import async_playwright
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    queue = asyncio.Queue()
+    for path in paths:
+        for viewport in viewports:
+            queue.put_nowait((path, viewport))
+    errors = {}
+    origin = '{0.scheme}://{0.netloc}'.format(urlsplit(base_url))
+
+    async def block_off_site(route):
+        if route.request.url.startswith(origin):
+            await route.continue_()
+        else:
+            await route.abort()
+
+    async def worker(context):
+        page = await context.new_page()
+        while True:
+            try:
+                path, viewport = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            name = capture_name(path, viewport)
+            try:
+                await page.set_viewport_size(VIEWPORTS[viewport])
+                await page.goto(base_url + path, wait_until='load', timeout=30000)
+                await page.add_style_tag(content=STABILIZE_CSS)
+                await page.evaluate('document.fonts.ready.then(() => true)')
+                await page.screenshot(path=str(output_dir / name), full_page=True,
+                                      animations='disabled', caret='hide')
+                errors[name] = None
+            except Exception as e:
+                errors[name] = str(e)
+            if on_capture:
+                on_capture(name, errors[name])
+        await page.close()
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        browser_contexts = []
+        for _ in range(max(1, contexts)):
+            context = await browser.new_context(device_scale_factor=1, reduced_motion='reduce',
+                                                service_workers='block')
+            await context.route('**/*', block_off_site)
+            browser_contexts.append(context)
+        await asyncio.gather(*(worker(context) for context in browser_contexts))
+        await browser.close()
+    return errors
+
+
+def compare_captures(names: list[str], baseline_dir: Path = BASELINE_DIR,
+                     current_dir: Path = CURRENT_DIR, diff_dir: Path = DIFF_DIR,
+                     threshold: float = THRESHOLD, workers: Optional[int] = None) -> list[dict]:
+    """Diff every capture against its baseline; results follow the order of names.
+
+    Decoding and diffing release the GIL, so captures are compared in threads.
+    """
+    diff_dir.mkdir(parents=True, exist_ok=True)
+
+    def diff(name: str) -> dict:
+        page, viewport = name[:-len('.png')].rsplit('@', 1)
+        result = {'name': name, 'page': page, 'viewport': viewport}
+        current, baseline = current_dir / name, baseline_dir / name
+        (diff_dir / name).unlink(missing_ok=True)
+        if not current.exists():
+            return {**result, 'status': 'error', 'issues': ["No capture"]}
+        if not baseline.exists():
+            return {**result, 'status': 'new', 'issues': ["No baseline"]}
+        outcome = compare_files(baseline, current, threshold, diff_dir / name)
+        regions = [asdict(region) for region in outcome.regions]
+        issues = [f"{r['width']}x{r['height']} changed at ({r['x']}, {r['y']})" for r in regions]
+        if outcome.size != outcome.baseline_size:
+            issues.insert(0, f"Size {outcome.baseline_size[0]}x{outcome.baseline_size[1]} -> "
+                             f"{outcome.size[0]}x{outcome.size[1]}")
+        return {**result, 'status': 'changed' if outcome.changed else 'pass',
+                'score': outcome.score, 'changed_fraction': outcome.changed_fraction,
+                'regions': regions, 'issues': issues}
+
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool:
+        return list(pool.map(diff, names))
+
+
+def update_baselines(names: list[str], current_dir: Path = CURRENT_DIR,
+                     baseline_dir: Path = BASELINE_DIR) -> int:
+    """Copy the current captures over their baselines; returns the number copied."""
+    baseline_dir.mkdir(parents=True, exist_ok=True)
+    copied = 0
+    for name in names:
+        if (current_dir / name).exists():
+            shutil.copyfile(current_dir / name, baseline_dir / name)
+            copied += 1
+    return copied
+
+
+def report_entries(results: list[dict]) -> list[dict]:
+    """quality_report.json entries for the captures that differ from their baseline."""
+    entries = []
+    for result in results:
+        if result['status'] == 'pass':
+            continue
+        page = result['page'].replace('__', '/')
+        entries.append({
+            'name': f"Visual: {result['name']}",
+            'url': f"{BASE_URL}/{'' if page == 'index' else page}",
+            'status': 'issues' if result['status'] == 'changed' else 'error',
+            'issues': result['issues'],
+        })
+    changed = sum(1 for r in results if r['status'] != 'pass')
+    entries.append({
+        'name': 'Visual',
+        'url': BASE_URL + '/',
+        'status': 'pass' if not changed else 'issues',
+        'issues': [f"{changed} of {len(results)} captures differ from the baseline"] if changed
+        else [],
+    })
+    return entries
+
 
-def main():
-    output_path = Path(__file__).parent.parent / "website_screenshot.png"
+def main(argv: Optional[list[str]] = None) -> int:
+    import argparse
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page(viewport={'width': 1920, 'height': 1080})
+    parser = argparse.ArgumentParser(description="Visual regression suite for the site")
+    parser.add_argument('--site', type=Path, default=SITE_DIR, help="Built site to serve")
+    parser.add_argument('--viewports', default=','.join(VIEWPORTS),
+                        help=f"Comma-separated viewports ({', '.join(VIEWPORTS)})")
+    parser.add_argument('--contexts', type=int, default=4, help="Concurrent browser contexts")
+    parser.add_argument('--threshold', type=float, default=THRESHOLD,
+                        help="Tile SSIM below which a region counts as changed")
+    parser.add_argument('--compare-only', action='store_true',
+                        help="Diff the existing captures in visual/current without capturing")
+    parser.add_argument('--update', action='store_true',
+                        help="Accept the current captures as the new baselines")
+    parser.add_argument('--no-report', action='store_true',
+                        help="Do not update quality_report.json")
+    args = parser.parse_args(argv)
 
-        print("Navigating to course website...")
-        page.goto('https://digital-ai-finance.github.io/agentic-artificial-intelligence/')
-        page.wait_for_load_state('networkidle')
+    viewports = args.viewports.split(',')
+    unknown = [v for v in viewports if v not in VIEWPORTS]
+    if unknown:
+        parser.error(f"unknown viewports: {', '.join(unknown)}")
 
-        # Wait a bit more for any JavaScript to finish
-        page.wait_for_timeout(2000)
+    if args.compare_only:
+        names = sorted(path.name for path in CURRENT_DIR.glob('*.png')
+                       if path.stem.rsplit('@', 1)[-1] in viewports)
+    else:
+        if not (args.site / 'index.html').exists():
+            print(f"No built site in {args.site}; run `bundle exec jekyll build` in docs/ first")
+            return 1
+        names = [capture_name(path, viewport)
+                 for path in site_pages(args.site) for viewport in viewports]
+        start = time.perf_counter()
+        server, local_url = serve_site(args.site)
+        try:
+            errors = asyncio.run(capture_async(
+                local_url, site_pages(args.site), viewports, CURRENT_DIR, args.contexts,
+                on_capture=lambda name, error: error and print(f"ERROR  {name}: {error}")))
+        finally:
+            server.shutdown()
+        print(f"Captured {sum(1 for e in errors.values() if e is None)} of {len(names)} "
+              f"screenshots in {time.perf_counter() - start:.1f}s")
 
-        # Check for 12 weeks
-        week_links = page.locator('a:has-text("Week")').all()
-        print(f"Found {len(week_links)} week links")
+    if args.update:
+        print(f"Updated {update_baselines(names)} baselines in {BASELINE_DIR}")
+        return 0
 
-        # Take full-page screenshot
-        page.screenshot(path=str(output_path), full_page=True)
-        print(f"Screenshot saved to: {output_path}")
+    start = time.perf_counter()
+    results = compare_captures(names, threshold=args.threshold)
+    elapsed = time.perf_counter() - start
+    for result in results:
+        if result['status'] != 'pass':
+            print(f"{result['status'].upper():8} {result['name']}")
+            for issue in result['issues']:
+                print(f"         - {issue}")
+    counts = {status: sum(1 for r in results if r['status'] == status)
+              for status in ('pass', 'changed', 'new', 'error')}
+    print(f"\nCompared {len(results)} captures in {elapsed:.1f}s: {counts['pass']} unchanged, "
+          f"{counts['changed']} changed, {counts['new']} without baseline, "
+          f"{counts['error']} errors")
 
-        # Print page title
-        title = page.title()
-        print(f"Page title: {title}")
+    VISUAL_DIR.mkdir(exist_ok=True)
+    VISUAL_REPORT_PATH.write_text(json.dumps(results, indent=2) + '\n', encoding='utf-8')
+    if not args.no_report:
+        merge_report(report_entries(results), 'Visual')
+    print(f"Detailed report: {VISUAL_REPORT_PATH}")
+    return 0 if counts['pass'] == len(results) else 1
 
-        browser.close()
 
 if __name__ == "__main__":
-    main()
+    exit(main())
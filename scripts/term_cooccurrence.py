@@ -0,0 +1,168 @@
+"""
+Term co-occurrence analysis over the lecture slides.
+
+Builds a sparse term x slide incidence matrix from the lecture term index,
+multiplies it by its transpose to count the slides every pair of terms
+shares, and scores each pair with normalized pointwise mutual information
+(NPMI). The strongest associations become suggested related terms, and the
+connected components of the association graph become term clusters.
+
+Everything is sparse matrix algebra, so it scales to thousands of terms over
+hundreds of decks; only the non-zero pairs are ever materialized.
+
+Usage:
+    python scripts/term_cooccurrence.py
+    python scripts/term_cooccurrence.py --min-slides 3 --top-k 8
+"""
+
+from typing import Optional
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components
+
+# Pairs must share at least this many slides to count as related
+MIN_SHARED_SLIDES = 2
+# Suggested related terms per term
+TOP_K = 5
+# NPMI above which two terms are linked when forming clusters
+CLUSTER_THRESHOLD = 0.6
+
+
+def incidence_matrix(term_ids: np.ndarray, slide_keys: np.ndarray,
+                     n_terms: int) -> tuple[sparse.csr_matrix, int]:
+    """Binary term x slide matrix from parallel arrays of (term id, slide key) postings.
+
+    Slide keys can be any integers identifying a slide (e.g. file * 2**16 +
+    slide); they are compacted to column indices. Returns the matrix and the
+    number of slides.
+    """
+    slides, columns = np.unique(slide_keys, return_inverse=True)
+    matrix = sparse.csr_matrix(
+        (np.ones(len(term_ids), dtype=np.float64), (term_ids, columns)),
+        shape=(n_terms, len(slides)),
+    )
+    matrix.data[:] = 1.0  # a term mentioned twice on one slide still counts once
+    return matrix, len(slides)
+
+
+def npmi_matrix(incidence: sparse.csr_matrix, n_slides: int, min_shared: int = MIN_SHARED_SLIDES
+                ) -> tuple[sparse.coo_matrix, sparse.coo_matrix]:
+    """Shared-slide counts and NPMI for every term pair that co-occurs at least min_shared times.
+
+    NPMI(a, b) = log(p(a,b) / (p(a) p(b))) / -log p(a,b), in [-1, 1]; the
+    diagonal is dropped. Both results are COO matrices with the same pattern.
+    """
+    shared = (incidence @ incidence.T).tocoo()
+    frequency = np.asarray(incidence.sum(axis=1)).ravel()
+
+    keep = (shared.row != shared.col) & (shared.data >= min_shared)
+    rows, cols, counts = shared.row[keep], shared.col[keep], shared.data[keep]
+
+    p_joint = counts / n_slides
+    p_a = frequency[rows] / n_slides
+    p_b = frequency[cols] / n_slides
+    with np.errstate(divide='ignore', invalid='ignore'):
+        npmi = np.log(p_joint / (p_a * p_b)) / -np.log(p_joint)
+    # Pairs that share every slide (p_joint == 1) are perfectly associated
+    npmi = np.where(p_joint >= 1.0, 1.0, npmi)
+
+    shape = shared.shape
+    return (sparse.coo_matrix((counts, (rows, cols)), shape=shape),
+            sparse.coo_matrix((npmi, (rows, cols)), shape=shape))
+
+
+def suggest_related(terms: list[str], counts: sparse.coo_matrix, npmi: sparse.coo_matrix,
+                    top_k: int = TOP_K) -> dict[str, list[dict]]:
+    """Top-k positively associated partners per term by NPMI (ties: shared slides, then name)."""
+    positive = np.flatnonzero(npmi.data > 0)
+    if not len(positive):
+        return {}
+    names = np.array(terms, dtype=object)
+    # One lexsort over all pairs groups them by term, best partners first
+    order = positive[np.lexsort((
+        names[npmi.col[positive]],
+        -counts.data[positive],
+        -npmi.data[positive],
+        npmi.row[positive],
+    ))]
+    rows = npmi.row[order]
+    starts = np.flatnonzero(np.r_[True, rows[1:] != rows[:-1]])
+    ends = np.r_[starts[1:], len(rows)]
+
+    related = {}
+    for start, end in zip(starts, ends):
+        picked = order[start:min(end, start + top_k)]
+        related[terms[int(rows[start])]] = [
+            {
+                'term': terms[int(npmi.col[i])],
+                'npmi': round(float(npmi.data[i]), 3),
+                'shared_slides': int(counts.data[i]),
+            }
+            for i in picked
+        ]
+    return related
+
+
+def term_clusters(terms: list[str], npmi: sparse.coo_matrix,
+                  threshold: float = CLUSTER_THRESHOLD) -> list[list[str]]:
+    """Connected components of the graph linking pairs with NPMI >= threshold (size >= 2)."""
+    strong = npmi.data >= threshold
+    graph = sparse.coo_matrix(
+        (np.ones(strong.sum()), (npmi.row[strong], npmi.col[strong])), shape=npmi.shape
+    )
+    _, labels = connected_components(graph, directed=False)
+    sizes = np.bincount(labels)
+    clusters = [
+        sorted((terms[i] for i in np.flatnonzero(labels == label)), key=str.lower)
+        for label in np.flatnonzero(sizes >= 2)
+    ]
+    return sorted(clusters, key=lambda c: (-len(c), c[0].lower()))
+
+
+def analyze(index, min_shared: int = MIN_SHARED_SLIDES, top_k: int = TOP_K,
+            threshold: float = CLUSTER_THRESHOLD) -> dict:
+    """Suggested related terms and clusters for a CorpusIndex (see corpus_index.py)."""
+    postings = index.postings
+    slide_keys = postings['file'].astype(np.int64) * 2**16 + postings['slide']
+    incidence, n_slides = incidence_matrix(
+        postings['term'].astype(np.int64), slide_keys, len(index.terms)
+    )
+    counts, npmi = npmi_matrix(incidence, n_slides, min_shared)
+    return {
+        'slides': n_slides,
+        'related': suggest_related(index.terms, counts, npmi, top_k),
+        'clusters': term_clusters(index.terms, npmi, threshold),
+    }
+
+
+def main(argv: Optional[list[str]] = None):
+    import argparse
+    import time
+
+    from corpus_index import load_index
+
+    parser = argparse.ArgumentParser(description="Suggest related terms from slide co-occurrence")
+    parser.add_argument('--min-slides', type=int, default=MIN_SHARED_SLIDES,
+                        help="Minimum shared slides for a pair to count")
+    parser.add_argument('--top-k', type=int, default=TOP_K, help="Suggestions per term")
+    parser.add_argument('--threshold', type=float, default=CLUSTER_THRESHOLD,
+                        help="NPMI needed to link two terms into a cluster")
+    args = parser.parse_args(argv)
+
+    index, _ = load_index()
+    start = time.perf_counter()
+    result = analyze(index, args.min_slides, args.top_k, args.threshold)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    print(f"{len(index.terms)} terms over {result['slides']} slides ({elapsed:.1f} ms)\n")
+    for term, related in sorted(result['related'].items(), key=lambda x: x[0].lower()):
+        partners = ', '.join(f"{r['term']} ({r['npmi']:.2f})" for r in related)
+        print(f"  {term}: {partners}")
+    print(f"\nClusters (NPMI >= {args.threshold}):")
+    for cluster in result['clusters']:
+        print(f"  - {', '.join(cluster)}")
+
+
+if __name__ == '__main__':
+    main()
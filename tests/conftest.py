@@ -1,7 +1,23 @@
 """Pytest configuration for chart tests."""
 
+import sys
+from pathlib import Path
+
 import pytest
 
+# The docs tooling in scripts/ imports its siblings by bare module name
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+
+def pytest_addoption(parser):
+    """Add chart rendering options."""
+    parser.addoption(
+        "--chart-workers",
+        type=int,
+        default=None,
+        help="Number of parallel chart render workers (default: CPU count)",
+    )
+
 
 def pytest_configure(config):
     """Add custom markers."""
@@ -16,3 +32,28 @@ def project_root():
     from pathlib import Path
 
     return Path(__file__).parent.parent
+
+
+@pytest.fixture(scope="session")
+def rendered_charts(request, tmp_path_factory):
+    """Render every selected chart once, in parallel, into a temp directory.
+
+    Charts are sharded across a pool of warm workers; PDFs go to the temp
+    directory so the committed files are never overwritten. Returns a mapping
+    from chart script path to (ChartResult, output directory).
+    """
+    from chart_engine import RenderEngine
+
+    charts = sorted(
+        {
+            item.callspec.params["chart_path"]
+            for item in request.session.items
+            if "chart_path" in getattr(getattr(item, "callspec", None), "params", {})
+        }
+    )
+    output_dir = tmp_path_factory.mktemp("charts")
+    workers = request.config.getoption("--chart-workers")
+
+    with RenderEngine(workers=workers) as engine:
+        results = engine.render(charts, output_dir=output_dir)
+        return {result.path: (result, output_dir / result.path.parent.name) for result in results}
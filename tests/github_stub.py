@@ -0,0 +1,194 @@
+"""
+Minimal local stand-in for the GitHub issues REST API, for the issue engine tests.
+
+Serves milestones and issues of one repository from memory, with paginated
+listings (Link headers), rate-limit headers, ETags with 304s for conditional
+GETs (which, as on GitHub, do not count against the rate limit) and optional
+injected failures.
+"""
+
+import hashlib
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+class GitHubStub:
+    """In-memory repository state plus a server thread; use as a context manager."""
+
+    def __init__(self, repo="owner/repo", milestones=(), rate_limit=5000):
+        self.repo = repo
+        self.milestones = [
+            {"number": i, "title": title} for i, title in enumerate(milestones, start=1)
+        ]
+        self.issues = []
+        self.remaining = rate_limit
+        self.requests = []
+        self.connections = set()
+        # Responses served before the real handler: [(status, headers, body)]
+        self.failures = []
+        self.active = 0
+        self.max_active = 0
+        self.delay = 0.0
+        self.not_modified = 0
+        self.lock = threading.Lock()
+        self.server = None
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def add_issue(self, title, body="", labels=(), milestone=None, state="open"):
+        with self.lock:
+            number = len(self.issues) + 1
+            self.issues.append(
+                {
+                    "number": number,
+                    "title": title,
+                    "body": body,
+                    "labels": [{"name": label} for label in labels],
+                    "milestone": next(
+                        (m for m in self.milestones if m["title"] == milestone), None
+                    ),
+                    "state": state,
+                    "html_url": f"https://github.com/{self.repo}/issues/{number}",
+                }
+            )
+            return self.issues[-1]
+
+    def __enter__(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # Keep-alive, so a pooled client reuses its connections
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def send_json(self, status, payload, headers=None):
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def handle_request(self, method):
+                length = int(self.headers.get("Content-Length") or 0)
+                payload = json.loads(self.rfile.read(length)) if length else None
+                with stub.lock:
+                    stub.requests.append((method, self.path, dict(self.headers), payload))
+                    stub.connections.add(self.client_address[1])
+                    stub.active += 1
+                    stub.max_active = max(stub.max_active, stub.active)
+                    failure = stub.failures.pop(0) if stub.failures else None
+                try:
+                    time.sleep(stub.delay)
+                    if failure:
+                        status, headers, body = failure
+                    else:
+                        status, body, headers = stub.route(method, self.path, payload)
+                    etag = None
+                    if method == "GET" and status == 200:
+                        content = json.dumps([body, headers.get("Link")]).encode()
+                        etag = f'"{hashlib.sha1(content).hexdigest()}"'
+                    not_modified = etag is not None and self.headers.get("If-None-Match") == etag
+                    with stub.lock:
+                        if not_modified:
+                            stub.not_modified += 1
+                        else:
+                            stub.remaining = max(0, stub.remaining - 1)
+                        limits = {
+                            "X-RateLimit-Remaining": str(stub.remaining),
+                            "X-RateLimit-Reset": str(int(time.time()) + 3600),
+                        }
+                    if not_modified:
+                        self.send_response(304)
+                        self.send_header("ETag", etag)
+                        for key, value in limits.items():
+                            self.send_header(key, value)
+                        self.end_headers()
+                    else:
+                        self.send_json(
+                            status, body, {**limits, **headers, **({"ETag": etag} if etag else {})}
+                        )
+                finally:
+                    with stub.lock:
+                        stub.active -= 1
+
+            def do_GET(self):
+                self.handle_request("GET")
+
+            def do_POST(self):
+                self.handle_request("POST")
+
+            def do_PATCH(self):
+                self.handle_request("PATCH")
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(
+            target=self.server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        ).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def page(self, items, path, query):
+        per_page = int(query.get("per_page", ["30"])[0])
+        page = int(query.get("page", ["1"])[0])
+        chunk = items[(page - 1) * per_page : page * per_page]
+        headers = {}
+        if page * per_page < len(items):
+            next_query = {k: v[0] for k, v in query.items()}
+            next_query["page"] = str(page + 1)
+            link = "&".join(f"{k}={v}" for k, v in next_query.items())
+            headers["Link"] = f'<{self.url}{path}?{link}>; rel="next"'
+        return chunk, headers
+
+    def route(self, method, raw_path, payload):
+        parts = urlsplit(raw_path)
+        path, query = parts.path, parse_qs(parts.query)
+        base = f"/repos/{self.repo}"
+        if method == "GET" and path == f"{base}/milestones":
+            return (200, *self.page(self.milestones, path, query))
+        if method == "GET" and path == f"{base}/issues":
+            state = query.get("state", ["open"])[0]
+            with self.lock:
+                issues = [i for i in self.issues if state == "all" or i["state"] == state]
+            return (200, *self.page(issues, path, query))
+        if method == "POST" and path == f"{base}/issues":
+            milestone = next(
+                (m["title"] for m in self.milestones if m["number"] == payload.get("milestone")),
+                None,
+            )
+            issue = self.add_issue(
+                payload["title"], payload.get("body", ""), payload.get("labels", []), milestone
+            )
+            return 201, issue, {}
+        match = re.fullmatch(rf"{base}/issues/(\d+)", path)
+        if match and method in ("GET", "PATCH"):
+            issue = next((i for i in self.issues if i["number"] == int(match.group(1))), None)
+            if issue is None:
+                return 404, {"message": "Not Found"}, {}
+            if method == "PATCH":
+                with self.lock:
+                    for key, value in payload.items():
+                        if key == "labels":
+                            issue["labels"] = [{"name": label} for label in value]
+                        elif key == "milestone":
+                            issue["milestone"] = next(
+                                (m for m in self.milestones if m["number"] == value), None
+                            )
+                        else:
+                            issue[key] = value
+            return 200, issue, {}
+        return 404, {"message": "Not Found"}, {}
@@ -0,0 +1,80 @@
+"""
+Tests for the incremental Beamer deck build, using a stub LaTeX executable.
+"""
+
+import stat
+import sys
+
+import pytest
+
+from beamer_build import aux_dir_for, build_decks, find_decks
+
+# Writes <output-directory>/<deck>.pdf; fails on decks containing \fail
+FAKE_LATEX = f"""#!{sys.executable}
+import sys
+from pathlib import Path
+
+if sys.argv[1] == "--version":
+    print("fake-latex 1.0")
+    sys.exit(0)
+out = Path(next(a.split("=", 1)[1] for a in sys.argv if a.startswith("-output-directory=")))
+deck = Path(sys.argv[-1])
+source = deck.read_text()
+if "\\\\fail" in source:
+    print("! Undefined control sequence.")
+    sys.exit(1)
+(out / deck.with_suffix(".pdf").name).write_text("%PDF " + str(len(source)))
+"""
+
+
+@pytest.fixture
+def fake_latex(tmp_path):
+    path = tmp_path / "fake-latex"
+    path.write_text(FAKE_LATEX)
+    path.chmod(path.stat().st_mode | stat.S_IEXEC)
+    return str(path)
+
+
+@pytest.fixture
+def decks(tmp_path):
+    root = tmp_path / "course"
+    for n in (1, 2):
+        lesson = root / f"L0{n}_Test"
+        (lesson / "01_chart").mkdir(parents=True)
+        (lesson / "01_chart" / "chart.pdf").write_bytes(b"%PDF chart")
+        (lesson / f"L0{n}_Test.tex").write_text(r"\includegraphics{01_chart/chart.pdf}" "\n")
+    return root
+
+
+def _build(root, latex, **kwargs):
+    results = build_decks(
+        find_decks(root), jobs=2, latex=latex, root=root, state_path=root / "state.json", **kwargs
+    )
+    return {r.deck.parent.name: r.status for r in results}
+
+
+def test_only_stale_decks_are_rebuilt(decks, fake_latex):
+    assert _build(decks, fake_latex) == {"L01_Test": "built", "L02_Test": "built"}
+    assert _build(decks, fake_latex) == {"L01_Test": "skipped", "L02_Test": "skipped"}
+
+    (decks / "L02_Test" / "01_chart" / "chart.pdf").write_bytes(b"%PDF changed chart")
+    assert _build(decks, fake_latex) == {"L01_Test": "skipped", "L02_Test": "built"}
+
+    (decks / "L01_Test" / "L01_Test.pdf").unlink()
+    assert _build(decks, fake_latex, dry_run=True) == {"L01_Test": "stale", "L02_Test": "skipped"}
+
+
+def test_each_deck_has_its_own_aux_dir(decks, fake_latex):
+    _build(decks, fake_latex)
+    aux_dirs = {aux_dir_for(deck) for deck in find_decks(decks)}
+    assert len(aux_dirs) == 2
+    for deck in find_decks(decks):
+        assert (aux_dir_for(deck) / deck.with_suffix(".pdf").name).exists()
+        assert deck.with_suffix(".pdf").exists()
+
+
+def test_failed_deck_is_retried_next_build(decks, fake_latex):
+    tex = decks / "L01_Test" / "L01_Test.tex"
+    tex.write_text(tex.read_text() + "\\fail\n")
+    assert _build(decks, fake_latex) == {"L01_Test": "failed", "L02_Test": "built"}
+    assert _build(decks, fake_latex) == {"L01_Test": "failed", "L02_Test": "skipped"}
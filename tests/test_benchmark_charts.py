@@ -0,0 +1,45 @@
+"""
+Tests for the chart benchmark regression checks.
+"""
+
+from benchmark_charts import compare
+
+BASELINE = {
+    "L01/01_a/a.py": {
+        "ok": True,
+        "wall_s": 1.0,
+        "cpu_s": 1.0,
+        "peak_rss_kb": 1000,
+        "artists": 100,
+        "output_bytes": 20000,
+    }
+}
+
+
+def _current(**changes):
+    metrics = dict(BASELINE["L01/01_a/a.py"], **changes)
+    return {"L01/01_a/a.py": metrics}
+
+
+def test_unchanged_chart_passes():
+    assert compare(_current(), BASELINE) == []
+
+
+def test_slowdown_beyond_threshold_fails():
+    regressions = compare(_current(wall_s=1.5), BASELINE, max_slowdown=25)
+    assert [(r["metric"], r["change_pct"]) for r in regressions] == [("wall_s", 50.0)]
+
+
+def test_small_absolute_slowdown_is_ignored():
+    baseline = {"L01/01_a/a.py": dict(BASELINE["L01/01_a/a.py"], wall_s=0.01)}
+    assert compare(_current(wall_s=0.02), baseline, max_slowdown=25) == []
+
+
+def test_output_growth_beyond_threshold_fails():
+    regressions = compare(_current(output_bytes=23000), BASELINE, max_growth=10)
+    assert [r["metric"] for r in regressions] == ["output_bytes"]
+
+
+def test_failed_chart_is_a_regression():
+    current = {"L01/01_a/a.py": {"ok": False, "error": "ValueError: boom"}}
+    assert compare(current, BASELINE)[0]["metric"] == "ok"
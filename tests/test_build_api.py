@@ -0,0 +1,90 @@
+"""
+Tests for the incremental JSON API generator in scripts/build_api.py.
+"""
+
+import gzip
+import json
+
+import pytest
+
+from build_api import build_api, load_manifest, stale_endpoints
+
+WEEKS = """
+- number: 1
+  title: "Introduction"
+  folder: "L01_Introduction"
+  description: 'Agents "in the loop"'
+  topics: [ReAct]
+  papers:
+    - title: "ReAct"
+      authors: "Yao et al."
+      year: 2023
+      arxiv: "2210.03629"
+  notebooks: []
+"""
+
+
+@pytest.fixture
+def docs(tmp_path):
+    data = tmp_path / "_data"
+    data.mkdir()
+    (tmp_path / "_config.yml").write_text(
+        'url: "https://example.org"\nbaseurl: "/course"\ncourse:\n  name: "Agentic AI"\n',
+        encoding="utf-8",
+    )
+    (data / "weeks.yml").write_text(WEEKS, encoding="utf-8")
+    (data / "glossary.yml").write_text(
+        '- term: "Agent"\n  definition: \'Acts "autonomously"\'\n  related: []\n  week: 1\n',
+        encoding="utf-8",
+    )
+    (data / "charts.yml").write_text("[]\n", encoding="utf-8")
+    (data / "exercises.yml").write_text(
+        '- week: 1\n  title: "Classify"\n  difficulty: "Advanced"\n', encoding="utf-8"
+    )
+    (data / "quizzes.yml").write_text('week1:\n  - question: "Q?"\n', encoding="utf-8")
+    return tmp_path
+
+
+def test_outputs_are_valid_minified_json_with_siblings(docs):
+    api = docs / "api"
+    status = build_api(api, docs)
+    assert set(status.values()) == {"built"}
+
+    data = (api / "course.json").read_bytes()
+    course = json.loads(data)
+    assert b"\n " not in data
+    assert course["course"]["website"] == "https://example.org/course"
+    assert course["weeks"][0]["description"] == 'Agents "in the loop"'
+    assert course["weeks"][0]["papers"][0]["url"] == "https://arxiv.org/abs/2210.03629"
+    assert course["weeks"][0]["slides_url"].endswith("/slides/L01_Introduction.pdf")
+    assert gzip.decompress((api / "course.json.gz").read_bytes()) == data
+
+    assert json.loads((api / "quizzes.json").read_bytes())["quizzes"][0]["question_count"] == 1
+    exercises = json.loads((api / "exercises.json").read_bytes())
+    assert exercises["exercises"][0]["exercises"][0]["id"] == "L01-E1"
+    assert exercises["difficulty_distribution"] == {"advanced": 1}
+
+    entry = load_manifest(api)["endpoints"]["course"]
+    assert entry["bytes"] == len(data)
+    assert entry["etag"].strip('"') == entry["sha256"][:16]
+
+
+def test_only_endpoints_of_changed_sources_are_rebuilt(docs):
+    api = docs / "api"
+    build_api(api, docs)
+    assert set(build_api(api, docs).values()) == {"fresh"}
+
+    with open(docs / "_data" / "glossary.yml", "a", encoding="utf-8") as f:
+        f.write('- term: "Tool"\n  definition: "A function"\n  week: 1\n')
+    assert stale_endpoints(api, docs) == ["course", "glossary"]
+    status = build_api(api, docs)
+    assert {name for name, state in status.items() if state == "built"} == {"course", "glossary"}
+
+    # A deleted sibling is recreated without rebuilding its JSON
+    (api / "weeks.json.gz").unlink()
+    assert build_api(api, docs)["weeks"] == "compressed"
+    assert (api / "weeks.json.gz").exists()
+
+    # A hand-edited output no longer matches the manifest and is regenerated
+    (api / "charts.json").write_text("{}", encoding="utf-8")
+    assert build_api(api, docs)["charts"] == "built"
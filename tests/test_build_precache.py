@@ -0,0 +1,75 @@
+"""
+Tests for the service worker precache manifest generator in scripts/build_precache.py.
+"""
+
+import pytest
+
+from build_precache import build_manifest, delta, inject, site_url
+
+SERVICE_WORKER = """const BASE = '/course';
+const PRECACHE_MANIFEST = [];
+self.addEventListener('install', () => {});
+"""
+
+
+@pytest.fixture
+def site(tmp_path):
+    files = {
+        "index.html": "home",
+        "offline.html": "offline",
+        "glossary.html": "terms",
+        "weeks/week-1.html": "week",
+        "assets/css/custom.css": "body {}",
+        "api/weeks.json": "{}",
+        "api/weeks.json.gz": "gz",
+        "api/search/index.json": "{}",
+        "api/search/ag.json": "{}",
+        "api/search/docs-0.json": "[]",
+        "assets/js/search.js": "search",
+        "slides/L01.pdf": "pdf",
+        "assets/charts/agent.png": "png",
+        "sw.js": SERVICE_WORKER,
+    }
+    for name, content in files.items():
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+    return tmp_path
+
+
+def test_site_url_matches_jekyll_links():
+    assert site_url("index.html") == "/"
+    assert site_url("weeks/index.html") == "/weeks/"
+    assert site_url("weeks/week-1.html") == "/weeks/week-1"
+    assert site_url("assets/js/search.js") == "/assets/js/search.js"
+
+
+def test_manifest_holds_only_the_app_shell(site):
+    urls = {entry["url"] for entry in build_manifest(site)}
+    assert urls == {"/", "/offline", "/assets/css/custom.css", "/assets/js/search.js"}
+
+
+def test_search_shards_are_not_precached(site):
+    urls = [entry["url"] for entry in build_manifest(site)]
+    assert not [url for url in urls if url.startswith("/api/")]
+
+
+def test_revisions_only_change_with_content(site):
+    before = build_manifest(site)
+    (site / "assets/css/custom.css").write_text("body { margin: 0 }", encoding="utf-8")
+    (site / "glossary.html").write_text("more terms", encoding="utf-8")  # not precached
+    after = build_manifest(site)
+    changed = [a["url"] for a, b in zip(after, before) if a["revision"] != b["revision"]]
+    assert changed == ["/assets/css/custom.css"]
+    assert delta(before, after) == {"changed": 1, "changed_bytes": 18, "removed": 0}
+
+
+def test_inject_replaces_the_placeholder_once(site):
+    source = inject(SERVICE_WORKER, build_manifest(site))
+    assert source.startswith("const BASE = '/course';\nconst PRECACHE_MANIFEST = [{\"url\":")
+    assert '{"url":"/offline","revision":' in source
+    assert source.count("PRECACHE_MANIFEST") == 1
+    # Injecting into an already injected worker replaces the old list
+    assert inject(source, []) == SERVICE_WORKER
+    with pytest.raises(ValueError):
+        inject("self.addEventListener('fetch', () => {});", [])
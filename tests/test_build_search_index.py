@@ -0,0 +1,92 @@
+"""
+Tests for the prefix-sharded search index in scripts/build_search_index.py.
+"""
+
+import json
+
+import pytest
+
+from build_search_index import SearchIndex, build_search_index, latex_to_text, tokenize
+
+LECTURE = r"""\begin{frame}[plain]
+\titlepage
+\end{frame}
+\begin{frame}[t]{Corrective Retrieval}
+% speaker note: mention CRAG
+\textbf{CRAG} grades retrieved documents \textcolor{mlred}{before generation}
+\includegraphics[width=0.5\textwidth]{03_crag/crag.pdf}
+\end{frame}
+"""
+
+GLOSSARY = """
+- term: "Self-RAG"
+  definition: "Retrieval with reflection tokens that critique generations."
+  related: ["CRAG"]
+  week: 7
+"""
+
+
+@pytest.fixture
+def site(tmp_path):
+    data = tmp_path / "_data"
+    data.mkdir()
+    (data / "glossary.yml").write_text(GLOSSARY, encoding="utf-8")
+    (data / "quizzes.yml").write_text(
+        'week7:\n  - question: "What does CRAG grade?"\n'
+        '    options: ["Documents", "Tokens"]\n    explanation: "Retrieved documents."\n',
+        encoding="utf-8",
+    )
+    lesson = tmp_path / "L07_Advanced_RAG"
+    lesson.mkdir()
+    tex = lesson / "L07_Advanced_RAG.tex"
+    tex.write_text(LECTURE, encoding="utf-8")
+    manifest = build_search_index(tmp_path / "search", data, [tex])
+    return tmp_path / "search", manifest
+
+
+def test_rebuild_removes_only_its_own_files(site, tmp_path):
+    directory, manifest = site
+    data, tex = tmp_path / "_data", tmp_path / "L07_Advanced_RAG" / "L07_Advanced_RAG.tex"
+    (directory / "weeks.json").write_text("{}", encoding="utf-8")  # not written by the builder
+    (directory / "zz.json").write_text("{}", encoding="utf-8")
+    stale = directory / f"{manifest['shards'][0]}.json"
+    tex.write_text("", encoding="utf-8")
+    (data / "glossary.yml").write_text("[]", encoding="utf-8")
+    (data / "quizzes.yml").write_text("{}", encoding="utf-8")
+    rebuilt = build_search_index(directory, data, [tex])
+    assert rebuilt["shards"] == [] and not stale.exists()
+    assert sorted(p.name for p in directory.iterdir()) == ["index.json", "weeks.json", "zz.json"]
+
+
+def test_latex_to_text_keeps_only_prose():
+    text = latex_to_text(r"\textbf{CRAG} \textcolor{red}{grades} 30\% % comment")
+    assert text == "CRAG grades 30%"
+    assert tokenize("The Self-RAG agent") == ["self", "rag", "agent"]
+
+
+def test_shards_are_split_by_prefix(site):
+    directory, manifest = site
+    assert manifest["documents"] == 3
+    for prefix in manifest["shards"]:
+        shard = json.loads((directory / f"{prefix}.json").read_text(encoding="utf-8"))
+        assert all(token.startswith(prefix) for token in shard)
+    metrics = manifest["metrics"]
+    assert metrics["index_size"]["shards"] == len(manifest["shards"])
+    assert metrics["query_latency"]["queries"] > 0
+
+
+def test_search_loads_only_the_needed_shards(site):
+    directory, _ = site
+    index = SearchIndex(directory)
+    hits = index.search("crag")
+    # The quiz has CRAG in its title, which outweighs one mention in a slide body
+    assert [hit["type"] for hit in hits] == ["quiz", "glossary", "slide"]
+    slide = hits[-1]
+    assert slide["title"] == "Corrective Retrieval"
+    assert slide["url"] == "slides/L07_Advanced_RAG.pdf#page=2"
+    assert "comment" not in slide["snippet"] and "crag.pdf" not in slide["snippet"]
+    assert set(index.shards) == {"cr"}
+
+    # Every word must match, and a partly typed word matches as a prefix
+    assert [hit["title"] for hit in index.search("reflect crit")] == ["Self-RAG"]
+    assert index.search("reflection generation planning") == []
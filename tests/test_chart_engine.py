@@ -0,0 +1,117 @@
+"""
+Tests for the warm-worker chart rendering engine.
+Verifies that state set by one chart does not leak into the next and that
+deterministic mode produces byte-identical PDFs.
+"""
+
+import hashlib
+from pathlib import Path
+
+from chart_engine import RenderEngine, render_subprocess
+
+ROOT = Path(__file__).parent.parent
+
+LEAKY_CHART = """
+import matplotlib.pyplot as plt
+plt.rcParams.update({"font.size": 31})
+plt.figure()
+print("leaky done")
+"""
+
+CLEAN_CHART = """
+import matplotlib.pyplot as plt
+assert plt.rcParams["font.size"] != 31, "rcParams leaked from previous chart"
+assert not plt.get_fignums(), "figures leaked from previous chart"
+"""
+
+FAILING_CHART = """
+raise ValueError("broken chart")
+"""
+
+
+def _write(tmp_path: Path, name: str, source: str) -> Path:
+    chart_dir = tmp_path / f"01_{name}"
+    chart_dir.mkdir()
+    path = chart_dir / f"{name}.py"
+    path.write_text(source, encoding="utf-8")
+    return path
+
+
+def test_state_is_reset_between_charts(tmp_path: Path):
+    """A single warm worker must reset rcParams and figures between charts."""
+    leaky = _write(tmp_path, "leaky", LEAKY_CHART)
+    clean = _write(tmp_path, "clean", CLEAN_CHART)
+
+    with RenderEngine(workers=1) as engine:
+        results = list(engine.render([leaky, clean]))
+
+    assert [r.ok for r in results] == [True, True], results[1].error
+    assert "leaky done" in results[0].stdout
+    assert all(r.seconds >= 0 for r in results)
+
+
+def test_failures_are_reported(tmp_path: Path):
+    """Exceptions in a chart become failed results instead of killing the worker."""
+    broken = _write(tmp_path, "broken", FAILING_CHART)
+    clean = _write(tmp_path, "clean", CLEAN_CHART)
+
+    with RenderEngine(workers=1) as engine:
+        broken_result, clean_result = engine.render([broken, clean])
+
+    assert not broken_result.ok
+    assert "broken chart" in broken_result.error
+    assert clean_result.ok
+
+
+def test_subprocess_path_matches(tmp_path: Path):
+    """The fresh-interpreter fallback reports results in the same shape."""
+    clean = _write(tmp_path, "clean", CLEAN_CHART)
+    result = render_subprocess(clean)
+    assert result.ok, result.error
+    assert result.mode == "subprocess"
+
+
+def test_renders_are_byte_identical(tmp_path: Path):
+    """Deterministic mode gives identical PDF bytes across runs and render paths."""
+    source = ROOT / "L08_GraphRAG_Knowledge/03_community_detection/community_detection.py"
+    chart = _write(tmp_path, "community_detection", source.read_text(encoding="utf-8"))
+    pdf = chart.with_suffix(".pdf")
+
+    digests = []
+    with RenderEngine(workers=1) as engine:
+        for _ in range(2):
+            assert engine.render_one(chart).ok
+            digests.append(hashlib.sha256(pdf.read_bytes()).hexdigest())
+    assert render_subprocess(chart).ok
+    digests.append(hashlib.sha256(pdf.read_bytes()).hexdigest())
+
+    assert len(set(digests)) == 1, digests
+    assert b"/CreationDate (D:20240101000000Z)" in pdf.read_bytes()
+
+
+def test_web_export_writes_svg_and_thumbnails(tmp_path: Path):
+    """Web export produces an SVG and PNG/WebP thumbnails alongside the PDF."""
+    from PIL import Image
+
+    from chart_engine import THUMBNAIL_WIDTHS
+
+    chart = _write(
+        tmp_path,
+        "simple",
+        "from pathlib import Path\n"
+        "import matplotlib.pyplot as plt\n"
+        "plt.figure(figsize=(10, 6))\n"
+        "plt.plot([1, 2, 3])\n"
+        'plt.savefig(Path(__file__).parent / "simple.pdf", bbox_inches="tight")\n',
+    )
+    web_dir = tmp_path / "web"
+
+    with RenderEngine(workers=1, web_dir=web_dir) as engine:
+        result = engine.render_one(chart)
+
+    assert result.ok, result.error
+    assert (web_dir / "simple.svg").exists()
+    for width in THUMBNAIL_WIDTHS:
+        for ext in ("png", "webp"):
+            with Image.open(web_dir / f"simple-{width}.{ext}") as image:
+                assert image.width == width
@@ -0,0 +1,162 @@
+"""
+Tests for the content-addressed render manifest in chart_manifest.py and the
+stale chart selection of update_all_charts.py.
+"""
+
+import subprocess
+
+import pytest
+
+import chart_manifest
+import update_all_charts
+from chart_engine import DEFAULT_SEED, ChartResult
+
+SCRIPT = """import matplotlib.pyplot as plt
+plt.rcParams.update({'font.size': 24})
+data = 'scores.csv'
+"""
+
+
+@pytest.fixture
+def charts(tmp_path, monkeypatch):
+    """Two rendered charts under tmp_path, with shared data and an engine file."""
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    (data_dir / "scores.csv").write_text("a,b\n1,2\n")
+    (data_dir / "unused.csv").write_text("x\n")
+    engine = tmp_path / "chart_engine.py"
+    engine.write_text("# engine v1\n")
+    monkeypatch.setattr(chart_manifest, "DATA_DIR", data_dir)
+    monkeypatch.setattr(chart_manifest, "ENGINE_FILES", [engine])
+    monkeypatch.setattr(
+        chart_manifest, "library_versions", lambda: {"python": "3.11", "matplotlib": "3.8"}
+    )
+    monkeypatch.setattr(update_all_charts, "BASE_DIR", tmp_path)
+
+    paths = []
+    for name, source in (("alpha", SCRIPT), ("beta", "print('no data')\n")):
+        chart_dir = tmp_path / "L01_Test" / f"01_{name}"
+        chart_dir.mkdir(parents=True)
+        path = chart_dir / f"{name}.py"
+        path.write_text(source)
+        paths.append(path)
+    manifest = {"version": chart_manifest.MANIFEST_VERSION, "charts": {}}
+    for path in paths:
+        render(manifest, path, tmp_path)
+    return tmp_path, paths, manifest
+
+
+def render(manifest, path, root):
+    chart_manifest.expected_output(path).write_bytes(b"%PDF " + path.read_bytes())
+    inputs = chart_manifest.chart_inputs(
+        path, chart_manifest.library_versions(), chart_manifest.engine_hash(), DEFAULT_SEED
+    )
+    chart_manifest.record_render(manifest, path, inputs, 0.1, root)
+
+
+def stale(paths, manifest, **kwargs):
+    return [p.stem for p in update_all_charts.select_stale_charts(paths, manifest, **kwargs)[0]]
+
+
+def test_unchanged_charts_are_skipped(charts):
+    root, paths, manifest = charts
+    assert stale(paths, manifest) == []
+    # The manifest survives a save and reload
+    chart_manifest.save_manifest(manifest, root / "manifest.json")
+    assert stale(paths, chart_manifest.load_manifest(root / "manifest.json")) == []
+
+
+def test_editing_the_script_or_its_data_rerenders_only_that_chart(charts):
+    root, paths, manifest = charts
+    (root / "data" / "unused.csv").write_text("y\n")
+    assert stale(paths, manifest) == []
+    (root / "data" / "scores.csv").write_text("a,b\n1,3\n")
+    assert stale(paths, manifest) == ["alpha"]
+    render(manifest, paths[0], root)
+    paths[1].write_text("print('edited')\n")
+    assert stale(paths, manifest) == ["beta"]
+
+
+def test_engine_or_library_changes_rerender_everything(charts, monkeypatch):
+    root, paths, manifest = charts
+    (root / "chart_engine.py").write_text("# engine v2\n")
+    assert stale(paths, manifest) == ["alpha", "beta"]
+    for path in paths:
+        render(manifest, path, root)
+    assert stale(paths, manifest) == []
+    monkeypatch.setattr(
+        chart_manifest, "library_versions", lambda: {"python": "3.11", "matplotlib": "3.9"}
+    )
+    assert stale(paths, manifest) == ["alpha", "beta"]
+
+
+def test_render_options_are_inputs(charts):
+    root, paths, manifest = charts
+    assert stale(paths, manifest, seed=DEFAULT_SEED + 1) == ["alpha", "beta"]
+    assert stale(paths, manifest, web=True) == ["alpha", "beta"]
+
+
+def test_missing_or_modified_pdf_rerenders(charts):
+    root, paths, manifest = charts
+    chart_manifest.expected_output(paths[0]).unlink()
+    pdf = chart_manifest.expected_output(paths[1])
+    pdf.write_bytes(pdf.read_bytes().upper())  # same size, new content and mtime
+    assert stale(paths, manifest) == ["alpha", "beta"]
+
+
+def test_touched_but_identical_pdf_is_still_fresh(charts):
+    root, paths, manifest = charts
+    pdf = chart_manifest.expected_output(paths[0])
+    pdf.write_bytes(pdf.read_bytes())
+    assert stale(paths, manifest) == []
+
+
+def test_force_rerenders_everything(charts, monkeypatch):
+    root, paths, manifest = charts
+    assert stale(paths, manifest, force=True) == ["alpha", "beta"]
+
+    rendered = []
+
+    def fake_render(path, seed=None):
+        rendered.append(path.stem)
+        chart_manifest.expected_output(path).write_bytes(b"%PDF")
+        return ChartResult(path, True, 0.01, mode="subprocess")
+
+    manifest_path = root / "manifest.json"
+    chart_manifest.save_manifest(manifest, manifest_path)
+    monkeypatch.setattr(update_all_charts, "discover_chart_scripts", lambda base: paths)
+    monkeypatch.setattr(update_all_charts, "render_subprocess", fake_render)
+    monkeypatch.setattr(chart_manifest, "MANIFEST_PATH", manifest_path)
+
+    assert update_all_charts.regenerate_charts(use_subprocess=True) == []
+    assert rendered == []
+    assert update_all_charts.regenerate_charts(use_subprocess=True, force=True) == []
+    assert rendered == ["alpha", "beta"]
+    # The forced renders were recorded: the next plain run skips them again
+    assert stale(paths, chart_manifest.load_manifest(manifest_path)) == []
+
+
+def test_changed_since_follows_git(charts):
+    root, paths, manifest = charts
+
+    def git(*args):
+        subprocess.run(["git", *args], cwd=root, check=True, capture_output=True)
+
+    git("init", "-q")
+    git("add", "-A")
+    git("-c", "user.name=t", "-c", "user.email=t@t", "commit", "-q", "-m", "charts")
+    assert stale(paths, manifest, changed_since="HEAD") == []
+    (root / "data" / "scores.csv").write_text("a,b\n5,6\n")
+    assert stale(paths, manifest, changed_since="HEAD") == ["alpha"]
+    (root / "chart_engine.py").write_text("# engine v3\n")
+    assert chart_manifest.changed_since("HEAD", root) is None
+    assert stale(paths, manifest, changed_since="HEAD") == ["alpha", "beta"]
+
+
+def test_unknown_revision_falls_back_to_the_manifest(charts, capsys):
+    root, paths, manifest = charts
+    subprocess.run(["git", "init", "-q"], cwd=root, check=True)
+    assert stale(paths, manifest, changed_since="no-such-rev") == []
+    assert "cannot diff against no-such-rev" in capsys.readouterr().out
+    paths[1].write_text("print('edited')\n")
+    assert stale(paths, manifest, changed_since="no-such-rev") == ["beta"]
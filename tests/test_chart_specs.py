@@ -0,0 +1,62 @@
+"""
+Tests for the declarative chart specs and their batch renderer.
+"""
+
+import numpy as np
+import pytest
+
+from chart_manifest import chart_data_files
+from chart_specs import (
+    KINDS,
+    TRANSFORMS,
+    Dataset,
+    discover_specs,
+    load_dataset,
+    load_spec,
+    render_specs,
+    resolve_variant,
+)
+
+SPECS = discover_specs()
+
+
+@pytest.mark.parametrize("spec_path", SPECS, ids=lambda p: p.stem)
+def test_spec_is_valid(spec_path):
+    """Every spec has a known kind and its series columns exist in the CSV."""
+    spec = load_spec(spec_path)
+    assert spec["kind"] in KINDS
+    data = load_dataset(spec)
+    assert data.matrix.shape == (len(data.x), len(spec["series"]))
+    for variant in spec["variants"]:
+        assert variant.get("transform") in (None, *TRANSFORMS)
+
+
+def test_transforms_are_columnwise():
+    data = Dataset(["a", "b", "c"], ["p", "q"], np.array([[1.0, 2.0], [2.0, 4.0], [4.0, 8.0]]))
+    assert data.transformed("normalize").column("q").tolist() == [25.0, 50.0, 100.0]
+    assert data.transformed("relative").column("p").tolist() == [1.0, 2.0, 4.0]
+    assert data.transformed("cumulative").column("p").tolist() == [1.0, 3.0, 7.0]
+    assert data.transformed(None) is data
+
+
+def test_variant_overrides_labels():
+    spec = load_spec(next(p for p in SPECS if p.stem == "coordination_overhead"))
+    german = resolve_variant(spec, next(v for v in spec["variants"] if v["name"] == "de"))
+    assert german["axes"]["left"]["label"] == "Aufgabenleistung (%)"
+    assert german["axes"]["left"]["ylim"] == [0, 100]
+    assert german["series"][0]["label"] == "Aufgabenleistung"
+    assert spec["series"][0]["label"] == "Task Performance"
+
+
+def test_chart_scripts_depend_on_their_csv():
+    spec = load_spec(next(p for p in SPECS if p.stem == "retrieval_comparison"))
+    script = spec["path"].parents[3] / spec["folder"] / spec["id"] / f"{spec['name']}.py"
+    assert [p.name for p in chart_data_files(script)] == [spec["data"]]
+
+
+def test_render_specs_is_deterministic(tmp_path):
+    first = render_specs(SPECS[:1], tmp_path / "a", variants=["light", "dark"], formats=("svg",))
+    second = render_specs(SPECS[:1], tmp_path / "b", variants=["light", "dark"], formats=("svg",))
+    assert len(first) == 2
+    for a, b in zip(first, second):
+        assert a.read_bytes() == b.read_bytes()
@@ -1,68 +1,40 @@
 """
 Unit tests for chart generation scripts.
 Validates that all chart scripts run without errors and produce PDF output.
+
+Charts are rendered once per session in parallel warm workers (see the
+rendered_charts fixture in conftest.py), writing PDFs to a temp directory.
 """
 
-import re
-import subprocess
-import sys
 from pathlib import Path
 
 import pytest
 
+from chart_engine import discover_chart_scripts
+
 # Project root directory
 ROOT = Path(__file__).parent.parent
 
-
-def discover_chart_scripts():
-    """Find all chart Python files in lecture folders.
-
-    Charts are named after their folder, e.g.:
-    - 01_agent_definition/agent_definition.py
-    - 02_react_paradigm/react_paradigm.py
-    """
-    charts = []
-    for lesson_dir in ROOT.glob("L*_*"):
-        if lesson_dir.is_dir():
-            for chart_dir in lesson_dir.glob("*_*"):
-                if chart_dir.is_dir():
-                    # Extract expected name from folder (e.g., "01_agent_definition" -> "agent_definition")
-                    match = re.match(r"^\d+[a-z]?_(.+)$", chart_dir.name)
-                    if match:
-                        chart_name = match.group(1)
-                        chart_py = chart_dir / f"{chart_name}.py"
-                        if chart_py.exists():
-                            charts.append(chart_py)
-    return sorted(charts)
-
-
 CHART_SCRIPTS = discover_chart_scripts()
 
 
 @pytest.mark.parametrize(
     "chart_path", CHART_SCRIPTS, ids=lambda p: f"{p.parent.parent.name}/{p.parent.name}"
 )
-def test_chart_generates_pdf(chart_path: Path, tmp_path: Path):
+def test_chart_generates_pdf(chart_path: Path, rendered_charts):
     """Test that chart script runs successfully and creates matching PDF."""
-    chart_dir = chart_path.parent
     chart_name = chart_path.stem  # e.g., "agent_definition"
-    expected_pdf = chart_dir / f"{chart_name}.pdf"
-
-    # Run the chart script
-    result = subprocess.run(
-        [sys.executable, str(chart_path)],
-        cwd=str(chart_dir),
-        capture_output=True,
-        text=True,
-        timeout=60,
-    )
+    result, output_dir = rendered_charts[chart_path]
+    expected_pdf = output_dir / f"{chart_name}.pdf"
 
     # Check script ran successfully
-    assert (
-        result.returncode == 0
-    ), f"Script failed:\nstdout: {result.stdout}\nstderr: {result.stderr}"
+    assert result.ok, f"Script failed:\nstdout: {result.stdout}\nerror: {result.error}"
+
+    # Check the chart saved exactly one PDF, named after its folder
+    pdfs = [p for p in result.outputs if p.suffix == ".pdf"]
+    assert [p.name for p in pdfs] == [expected_pdf.name], f"Unexpected outputs: {result.outputs}"
 
-    # Check PDF was created/updated
+    # Check PDF was created
     assert expected_pdf.exists(), f"PDF not created: {expected_pdf}"
 
     # Verify PDF has content (> 1KB)
@@ -0,0 +1,96 @@
+"""
+Tests for the persistent lecture term index in scripts/corpus_index.py.
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from corpus_index import CorpusIndex, lecture_files, load_index
+from extract_glossary import ROOT, find_first_occurrence
+
+LECTURE = r"""\begin{frame}[t]{What is an Agent?}
+An LLM with tools.
+\end{frame}
+\begin{frame}[t]{Retrieval}
+\textbf{RAG}: retrieval-augmented generation
+\end{frame}
+"""
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    for week, text in (
+        (1, LECTURE),
+        (2, "\\begin{frame}{Planning}\nReAct and RAG\n\\end{frame}\n"),
+    ):
+        lesson = tmp_path / f"L0{week}_Test"
+        lesson.mkdir()
+        (lesson / f"L0{week}_Test.tex").write_text(text, encoding="utf-8")
+    return tmp_path
+
+
+def test_first_occurrences_follow_week_order(corpus):
+    index, stats = load_index(corpus, path=corpus / "index.bin")
+    assert stats["rescanned"] == 2
+    first = index.first_occurrences()
+    assert first["RAG"]["week"] == 1
+    assert (first["RAG"]["slide"], first["RAG"]["slide_title"]) == (2, "Retrieval")
+    assert first["RAG"]["defined"] is True
+    assert first["ReAct"]["week"] == 2
+    assert [occ["week"] for occ in index.occurrences("RAG")] == [1, 2]
+
+
+def test_round_trip_and_incremental_refresh(corpus):
+    path = corpus / "index.bin"
+    built, _ = load_index(corpus, path=path)
+    loaded = CorpusIndex.load(path)
+    assert loaded.files == built.files
+    assert loaded.contexts == built.contexts
+    assert np.array_equal(loaded.postings, built.postings)
+
+    _, stats = load_index(corpus, path=path)
+    assert (stats["rescanned"], stats["reused"]) == (0, 2)
+
+    week2 = corpus / "L02_Test" / "L02_Test.tex"
+    os.utime(week2, ns=(0, week2.stat().st_mtime_ns + 10**9))
+    _, stats = load_index(corpus, path=path)
+    assert (stats["rescanned"], stats["rehashed"]) == (0, 1)
+
+    week2.write_text("\\begin{frame}{Planning}\nTree-of-Thoughts\n\\end{frame}\n", encoding="utf-8")
+    index, stats = load_index(corpus, path=path)
+    assert stats["rescanned"] == 1
+    assert [occ["week"] for occ in index.occurrences("RAG")] == [1]
+    assert "ReAct" not in index.first_occurrences()
+
+
+def test_corrupt_index_is_rebuilt(corpus):
+    path = corpus / "index.bin"
+    path.write_bytes(b"not an index")
+    assert CorpusIndex.load(path) is None
+    _, stats = load_index(corpus, path=path)
+    assert stats["rescanned"] == 2
+
+
+def test_index_agrees_with_per_file_scan():
+    index, _ = load_index(ROOT, path=None)
+    expected = {}
+    for tex_path in lecture_files(ROOT):
+        for term, occ in find_first_occurrence(tex_path).items():
+            expected.setdefault(term, (tex_path.relative_to(ROOT).as_posix(), occ["line"]))
+    actual = {term: (occ["file"], occ["line"]) for term, occ in index.first_occurrences().items()}
+    assert actual == expected
+
+
+def test_parallel_scan_matches_serial(corpus):
+    serial, _ = load_index(corpus, path=None)
+    scanned = []
+    parallel, stats = load_index(
+        corpus, path=None, workers=2, on_scanned=lambda path, *_: scanned.append(path)
+    )
+    assert stats["rescanned"] == 2
+    assert sorted(scanned) == ["L01_Test/L01_Test.tex", "L02_Test/L02_Test.tex"]
+    assert parallel.files == serial.files
+    assert parallel.contexts == serial.contexts
+    assert np.array_equal(parallel.postings, serial.postings)
@@ -0,0 +1,41 @@
+"""
+Tests for the glossary term scanner in scripts/extract_glossary.py.
+"""
+
+import pytest
+
+import extract_glossary
+from extract_glossary import TERM_PATTERNS, find_first_occurrence, scan_terms
+
+TEX_FILES = sorted(extract_glossary.ROOT.glob("L*_*/L*.tex"))
+
+
+def _per_term_lines(content: str) -> list[tuple[int, str]]:
+    """Reference implementation: every term's pattern against every line."""
+    hits = []
+    for line_num, line in enumerate(content.split("\n"), 1):
+        for term, pattern in TERM_PATTERNS.items():
+            if pattern.search(line):
+                hits.append((line_num, term))
+    return sorted(hits)
+
+
+def test_overlapping_terms_are_all_found():
+    content = "Self-RAG improves RAG\nUse LLM-as-Judge here\n\\textbf{MCP}: a protocol"
+    found = {(line, term) for line, _, term in scan_terms(content)}
+    assert {(1, "Self-RAG"), (1, "RAG"), (2, "LLM-as-Judge"), (2, "LLM"), (3, "MCP")} <= found
+
+
+@pytest.mark.parametrize("tex_path", TEX_FILES, ids=lambda p: p.stem[:3])
+def test_single_pass_matches_per_term_scan(tex_path):
+    content = tex_path.read_text(encoding="utf-8")
+    assert sorted((line, term) for line, _, term in scan_terms(content)) == _per_term_lines(content)
+
+
+def test_definition_detected_at_first_use(tmp_path):
+    tex = tmp_path / "L01_Test.tex"
+    tex.write_text("intro\n\\textbf{ReAct}: reasoning and acting\nCoT later\n", encoding="utf-8")
+    occurrences = find_first_occurrence(tex)
+    assert occurrences["ReAct"]["line"] == 2
+    assert occurrences["ReAct"]["defined_at_first_use"] is True
+    assert occurrences["CoT"]["defined_at_first_use"] is False
@@ -0,0 +1,41 @@
+"""
+Tests for the Beamer frame index in scripts/frame_index.py.
+"""
+
+from frame_index import FrameIndex
+
+DECK = r"""\documentclass{beamer}
+\begin{document}
+\begin{frame}[plain]
+Title page
+\end{frame}
+\begin{frame}[t]{What is an \textbf{Agent}?}
+Body
+\end{frame}
+\begin{frame}
+\frametitle{Tool Use}
+More body
+\end{frame}
+\end{document}"""
+
+
+def test_slide_lookup():
+    frames = FrameIndex.from_content(DECK)
+    assert frames.starts == [3, 6, 9]
+    assert [frames.slide_at(n) for n in (1, 3, 4, 6, 8, 9, 13)] == [0, 1, 1, 2, 2, 3, 3]
+
+
+def test_frame_titles():
+    frames = FrameIndex.from_content(DECK)
+    assert frames.titles == [None, r"What is an \textbf{Agent}?", "Tool Use"]
+    assert frames.title_at(7) == r"What is an \textbf{Agent}?"
+    assert frames.title_at(1) is None
+
+
+def test_matches_counting_frames_line_by_line(project_root):
+    deck = project_root / "L01_Introduction_Agentic_AI" / "L01_Introduction_Agentic_AI.tex"
+    frames = FrameIndex.from_file(deck)
+    count = 0
+    for line_num, line in enumerate(deck.read_text(encoding="utf-8").split("\n"), 1):
+        count += r"\begin{frame}" in line
+        assert frames.slide_at(line_num) == count
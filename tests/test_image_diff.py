@@ -0,0 +1,79 @@
+"""
+Tests for the blockwise SSIM screenshot diff in scripts/image_diff.py.
+"""
+
+import numpy as np
+from PIL import Image
+
+from image_diff import BLOCK, block_ssim, compare, compare_files, luma, tile_scores
+
+
+def page(height=480, width=640, seed=0):
+    """A page-like RGB image: white background with rows of dark 'text' blocks."""
+    rng = np.random.default_rng(seed)
+    pixels = np.full((height, width, 3), 255, dtype=np.uint8)
+    for top in range(20, height - 20, 40):
+        widths = rng.integers(40, width - 40)
+        pixels[top : top + 12, 20:widths] = rng.integers(0, 80, (12, widths - 20, 3))
+    return pixels
+
+
+def test_identical_images_have_no_regions():
+    image = Image.fromarray(page())
+    result = compare(image, image.copy())
+    assert result.score == 1.0
+    assert result.changed_fraction == 0.0
+    assert not result.changed
+
+
+def test_changed_area_is_reported_as_one_region():
+    before = page()
+    after = before.copy()
+    after[100:130, 300:360] = (200, 30, 30)
+    result = compare(Image.fromarray(before), Image.fromarray(after))
+    (region,) = result.regions
+    assert region.x <= 300 and region.x + region.width >= 360
+    assert region.y <= 100 and region.y + region.height >= 130
+    assert region.width <= 60 + 2 * BLOCK and region.height <= 30 + 2 * BLOCK
+    assert region.score < 0.98
+    assert 0 < result.changed_fraction < 0.05
+
+
+def test_separate_changes_are_separate_regions():
+    before = page()
+    after = before.copy()
+    after[10:20, 10:20] = 0
+    after[400:420, 500:520] = 0
+    regions = compare(Image.fromarray(before), Image.fromarray(after)).regions
+    assert [(r.x, r.y) for r in regions] == [(0, 0), (496, 400)]
+
+
+def test_taller_capture_reports_the_extra_rows():
+    before = page(height=480)
+    after = np.vstack([before, page(height=100, seed=1)])
+    result = compare(Image.fromarray(before), Image.fromarray(after))
+    assert [(r.x, r.y, r.width, r.height) for r in result.regions] == [(0, 480, 640, 100)]
+    assert result.size == (640, 580) and result.baseline_size == (640, 480)
+
+
+def test_band_limited_scores_match_the_full_computation():
+    before = page(height=500, width=630)
+    after = before.copy()
+    after[250:260, 0:50] = 128
+    a, b = luma(Image.fromarray(before)), luma(Image.fromarray(after))
+    np.testing.assert_allclose(tile_scores(a, b), block_ssim(a, b), atol=1e-9)
+
+
+def test_compare_files_writes_a_highlight(tmp_path):
+    before = page()
+    after = before.copy()
+    after[200:220, 100:200] = 0
+    Image.fromarray(before).save(tmp_path / "baseline.png")
+    Image.fromarray(after).save(tmp_path / "current.png")
+    result = compare_files(
+        tmp_path / "baseline.png", tmp_path / "current.png", output=tmp_path / "diff.png"
+    )
+    assert result.changed
+    with Image.open(tmp_path / "diff.png") as diff:
+        region = result.regions[0]
+        assert diff.getpixel((region.x, region.y)) == (220, 0, 0)
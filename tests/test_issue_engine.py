@@ -0,0 +1,409 @@
+"""
+Tests for the concurrent, rate-limit-aware issue engine in issue_engine.py,
+run against a local stub of the GitHub API.
+"""
+
+import threading
+
+import pytest
+
+from issue_engine import (
+    IssueCache,
+    IssueEngine,
+    IssueError,
+    Journal,
+    RateLimiter,
+    SyncOperation,
+    plan_sync,
+    sync_summary,
+)
+from tests.github_stub import GitHubStub
+
+
+class FakeClock:
+    """Clock and sleep for RateLimiter that advance virtual time instead of waiting."""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+        self.slept = []
+        self.lock = threading.Lock()
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        with self.lock:
+            self.slept.append(seconds)
+            self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def stub():
+    with GitHubStub(milestones=["M1: Content Exposure", "M2: Quiz Completion"]) as server:
+        yield server
+
+
+def engine_for(stub, clock, workers=4, cache=None):
+    limiter = RateLimiter(clock=clock.time, sleep=clock.sleep)
+    return IssueEngine(
+        stub.repo,
+        token="test-token",
+        api_url=stub.url,
+        workers=workers,
+        limiter=limiter,
+        cache=cache,
+    )
+
+
+def issues(count):
+    return [
+        {
+            "title": f"[PAGES] Issue {i}",
+            "body": f"Body {i}",
+            "labels": ["type:pages"],
+            "milestone": "M2: Quiz Completion" if i % 2 else None,
+        }
+        for i in range(count)
+    ]
+
+
+def test_creates_issues_concurrently_in_input_order(stub, clock):
+    stub.delay = 0.05
+    with engine_for(stub, clock, workers=4) as engine:
+        results = engine.create_issues(issues(12))
+    assert all(result.ok for result in results)
+    assert [r.title for r in results] == [f"[PAGES] Issue {i}" for i in range(12)]
+    assert sorted(r.number for r in results) == list(range(1, 13))
+    assert 1 < stub.max_active <= 4
+    assert len(stub.connections) <= 4  # pooled keep-alive connections
+    assert clock.slept == []
+
+
+def test_sends_token_and_resolves_milestones_once(stub, clock):
+    with engine_for(stub, clock) as engine:
+        engine.create_issues(issues(6))
+    milestone_requests = [
+        r for r in stub.requests if r[1].startswith(f"/repos/{stub.repo}/milestones")
+    ]
+    assert len(milestone_requests) == 1
+    assert all(r[2]["Authorization"] == "Bearer test-token" for r in stub.requests)
+    created = {issue["title"]: issue for issue in stub.issues}
+    assert created["[PAGES] Issue 1"]["milestone"]["title"] == "M2: Quiz Completion"
+    assert created["[PAGES] Issue 0"]["milestone"] is None
+
+
+def test_retry_after_pauses_and_retries(stub, clock):
+    stub.failures.append((403, {"Retry-After": "30"}, {"message": "secondary rate limit"}))
+    with engine_for(stub, clock, workers=1) as engine:
+        (result,) = engine.create_issues(issues(1)[:1])
+    assert result.ok
+    assert clock.slept == [30.0]
+    assert len(stub.issues) == 1
+
+
+def test_secondary_limit_without_retry_after_backs_off(stub, clock):
+    message = {"message": "You have exceeded a secondary rate limit"}
+    stub.failures += [(403, {}, message), (403, {}, message)]
+    with engine_for(stub, clock, workers=1) as engine:
+        engine.create_issue("[PAGES] Backoff", "body")
+    assert clock.slept == [60.0, 120.0]
+
+
+def test_waits_for_reset_when_the_budget_is_spent(clock):
+    limiter = RateLimiter(reserve=2, clock=clock.time, sleep=clock.sleep)
+    limiter.remaining, limiter.reset = 2, clock.now + 90
+    limiter.wait()
+    assert clock.slept == [90.0]
+    limiter.wait()  # the window has reset: no further wait
+    assert clock.slept == [90.0]
+
+
+def test_permission_errors_are_not_retried(stub, clock):
+    stub.failures.append((403, {}, {"message": "Resource not accessible by integration"}))
+    with engine_for(stub, clock) as engine:
+        with pytest.raises(IssueError) as error:
+            engine.create_issue("[PAGES] Denied", "body")
+    assert error.value.status == 403
+    assert clock.slept == []
+
+
+def test_unknown_milestone_fails_only_that_issue(stub, clock):
+    batch = issues(2)
+    batch[0]["milestone"] = "M9: Missing"
+    with engine_for(stub, clock) as engine:
+        results = engine.create_issues(batch)
+    assert [r.ok for r in results] == [False, True]
+    assert "Unknown milestone" in results[0].error
+
+
+def test_paginate_follows_links(stub, clock):
+    for i in range(250):
+        stub.add_issue(f"Issue {i}")
+    with engine_for(stub, clock) as engine:
+        listed = engine.paginate(f"/repos/{stub.repo}/issues", {"state": "all"})
+    assert len(listed) == 250
+    assert len(stub.requests) == 3
+
+
+def declared(title, body="Body", labels=("type:pages",), milestone="M1: Content Exposure"):
+    return {"title": title, "body": body, "labels": list(labels), "milestone": milestone}
+
+
+def test_plan_sync_compares_title_body_labels_and_milestone():
+    existing = [
+        {
+            "number": 1,
+            "title": "Same",
+            "body": "Body\r\n",
+            "labels": [{"name": "type:pages"}],
+            "milestone": {"title": "M1: Content Exposure"},
+        },
+        {"number": 2, "title": "new  BODY", "body": "Old", "labels": [], "milestone": None},
+        {
+            "number": 3,
+            "title": "Labels",
+            "body": "Body",
+            "labels": [{"name": "status:wip"}],
+            "milestone": {"title": "M2: Quiz Completion"},
+        },
+    ]
+    plan = plan_sync(
+        [declared("Same"), declared("New body"), declared("Labels"), declared("Missing")],
+        existing,
+    )
+    assert [(op.action, op.number, op.changes) for op in plan] == [
+        ("unchanged", 1, []),
+        ("update", 2, ["title", "body", "labels", "milestone"]),
+        ("update", 3, ["labels", "milestone"]),
+        ("create", None, ["title", "body", "labels", "milestone"]),
+    ]
+    # Labels added by hand are kept
+    assert plan[2].payload["labels"] == ["status:wip", "type:pages"]
+    assert plan_sync([declared("Missing")], existing, create=False)[0].action == "missing"
+
+
+def test_plan_sync_matches_by_number_and_skips_undeclared_fields():
+    existing = [{"number": 7, "title": "Week 1", "body": "Old", "labels": [{"name": "x"}]}]
+    (op,) = plan_sync([{"number": 7, "title": "Week 1", "body": "New"}], existing)
+    assert (op.action, op.number, op.payload) == ("update", 7, {"body": "New"})
+
+
+def test_sync_is_idempotent(stub, clock):
+    stub.add_issue("Existing", "Body", ["type:pages"], "M1: Content Exposure")
+    stub.add_issue("Stale", "Old body", ["type:pages"], "M1: Content Exposure")
+    wanted = [declared("Existing"), declared("Stale", body="New body"), declared("Fresh")]
+    with engine_for(stub, clock) as engine:
+        dry = engine.sync(wanted, dry_run=True)
+        assert [op.action for op in dry] == ["unchanged", "update", "create"]
+        assert all(method == "GET" for method, *_ in stub.requests)
+
+        first = engine.sync(wanted)
+        assert [(op.action, op.error) for op in first] == [
+            ("unchanged", None),
+            ("update", None),
+            ("create", None),
+        ]
+        assert first[2].number == 3
+        second = engine.sync(wanted)
+    assert [op.action for op in second] == ["unchanged"] * 3
+    assert [issue["body"] for issue in stub.issues] == ["Body", "New body", "Body"]
+    assert sync_summary(first) == "1 create, 1 update, 1 unchanged"
+
+
+def test_interrupted_sync_resumes_from_the_journal(stub, clock, tmp_path):
+    path = tmp_path / "journal.jsonl"
+    wanted = [declared(f"Issue {i}") for i in range(5)]
+    # The (empty) listing goes through, then the first create is rejected
+    stub.failures += [(200, {}, []), (422, {}, {"message": "Validation Failed"})]
+    with engine_for(stub, clock, workers=1) as engine:
+        first = engine.sync(wanted, journal=Journal(path, stub.repo))
+    assert [op.error is None for op in first] == [False, True, True, True, True]
+    assert len(path.read_text().splitlines()) == 4
+
+    stub.requests.clear()
+    with engine_for(stub, clock) as engine:
+        second = engine.sync(wanted, journal=Journal(path, stub.repo))
+    assert [op.action for op in second] == ["create"] + ["journaled"] * 4
+    assert sync_summary(second) == "1 create, 4 journaled"
+    assert sorted(issue["title"] for issue in stub.issues) == [f"Issue {i}" for i in range(5)]
+    assert [m for m, *_ in stub.requests].count("POST") == 1
+    # The batch completed: the journal is cleared
+    assert not path.exists()
+
+
+def test_completed_run_does_not_hide_later_remote_edits(stub, clock, tmp_path):
+    path = tmp_path / "journal.jsonl"
+    wanted = [declared("A"), declared("B")]
+    with engine_for(stub, clock) as engine:
+        engine.sync(wanted, journal=Journal(path, stub.repo))
+    issue = next(issue for issue in stub.issues if issue["title"] == "A")
+    issue["body"] = "Edited by hand"
+    issue["labels"] = []
+
+    with engine_for(stub, clock) as engine:
+        operations = engine.sync(wanted, journal=Journal(path, stub.repo))
+    assert [(op.action, op.changes) for op in operations] == [
+        ("update", ["body", "labels"]),
+        ("unchanged", []),
+    ]
+    assert issue["body"] == "Body"
+
+
+def test_journal_resyncs_changed_declarations_and_keeps_other_batches(stub, clock, tmp_path):
+    path = tmp_path / "journal.jsonl"
+    Journal(path, stub.repo, batch="other").record(
+        SyncOperation("create", "X", 9, key="x", digest="d")
+    )
+    stub.failures += [(200, {}, []), (422, {}, {"message": "Validation Failed"})]
+    with engine_for(stub, clock, workers=1) as engine:
+        engine.sync([declared("A"), declared("B"), declared("C")], journal=Journal(path, stub.repo))
+    assert set(Journal(path, stub.repo).entries) == {"b", "c"}
+    assert Journal(path, "other/repo").entries == {}
+    path.write_text(path.read_text() + '{"repo": "owner/re')  # cut short by a crash
+    assert len(Journal(path, stub.repo).entries) == 2
+
+    with engine_for(stub, clock) as engine:
+        operations = engine.sync(
+            [declared("A"), declared("B", body="Changed"), declared("C")],
+            journal=Journal(path, stub.repo),
+        )
+    assert [op.action for op in operations] == ["create", "update", "journaled"]
+    assert {issue["title"]: issue["body"] for issue in stub.issues} == {
+        "A": "Body",
+        "B": "Changed",
+        "C": "Body",
+    }
+    assert Journal(path, stub.repo).entries == {}
+    assert set(Journal(path, stub.repo, batch="other").entries) == {"x"}
+
+
+def test_update_issue_patches_without_a_shell(stub, clock, monkeypatch):
+    import update_issues_phd
+
+    stub.add_issue("[SLIDES] L01: Intro", "old")
+    monkeypatch.setattr(update_issues_phd, "IssueEngine", lambda repo: engine_for(stub, clock))
+    assert update_issues_phd.update_issue(stub.repo, 1, "new 'quoted' $body")
+    assert stub.issues[0]["body"] == "new 'quoted' $body"
+    assert [(m, p) for m, p, *_ in stub.requests] == [("PATCH", f"/repos/{stub.repo}/issues/1")]
+    assert not update_issues_phd.update_issue(stub.repo, 99, "body")
+
+
+def test_update_script_pages_past_100_and_edits_only_changed(
+    stub, clock, monkeypatch, capsys, tmp_path
+):
+    import update_issues_phd
+
+    monkeypatch.setattr(update_issues_phd, "JOURNAL_PATH", tmp_path / "journal.jsonl")
+    monkeypatch.setattr(update_issues_phd, "CACHE_PATH", tmp_path / "cache.json")
+
+    title = "[SLIDES] L01: Introduction to Agentic AI"
+    _, current_body = update_issues_phd.generate_body(title, 1)
+    for i in range(105):
+        stub.add_issue(f"[CHART] Misc {i}")  # no week: skipped
+    stub.add_issue(title, current_body)
+    stub.add_issue("[READING] L02: Papers", "outdated")
+    monkeypatch.setattr(
+        update_issues_phd, "IssueEngine", lambda repo, **kw: engine_for(stub, clock, **kw)
+    )
+    stub.repo = update_issues_phd.REPO
+
+    assert update_issues_phd.main(["--dry-run"]) == 0
+    assert "Would update: #107 [READING] L02: Papers (body)" in capsys.readouterr().out
+    assert stub.issues[106]["body"] == "outdated"
+
+    assert update_issues_phd.main([]) == 0
+    assert (
+        stub.issues[106]["body"] == update_issues_phd.generate_body("[READING] L02: Papers", 2)[1]
+    )
+    assert [m for m, *_ in stub.requests].count("PATCH") == 1
+
+
+def test_unchanged_listing_costs_a_304_from_the_cache(stub, clock, tmp_path):
+    path = tmp_path / "cache.json"
+    for i in range(150):
+        stub.add_issue(f"Issue {i}", f"Body {i}")
+    with engine_for(stub, clock, cache=IssueCache(path, stub.repo)) as engine:
+        first = engine.list_issues()
+    assert "Body 0" not in path.read_text()  # bodies are stored as hashes
+
+    remaining = stub.remaining
+    with engine_for(stub, clock, cache=IssueCache(path, stub.repo)) as engine:
+        second = engine.list_issues()
+    assert second == first
+    assert stub.not_modified == 2  # both pages
+    assert stub.remaining == remaining
+    assert all(headers.get("If-None-Match") for _, _, headers, _ in stub.requests[-2:])
+
+    stub.issues[120]["body"] = "Edited on GitHub"
+    with engine_for(stub, clock, cache=IssueCache(path, stub.repo)) as engine:
+        third = engine.list_issues()
+        assert engine.cache.number("issue 120") == 121
+    assert stub.not_modified == 3  # only the second page changed
+    assert third[120]["body_hash"] != first[120]["body_hash"]
+
+
+def test_sync_against_cached_summaries(stub, clock, tmp_path):
+    cache = IssueCache(tmp_path / "cache.json", stub.repo)
+    stub.add_issue("Existing", "Body", ["type:pages"], "M1: Content Exposure")
+    with engine_for(stub, clock, cache=cache) as engine:
+        operations = engine.sync([declared("Existing"), declared("Fresh")])
+    assert [op.action for op in operations] == ["unchanged", "create"]
+    # Issues created or edited through the engine are known by title at once
+    assert (cache.number("Fresh"), cache.number("EXISTING")) == (2, 1)
+    assert IssueCache(tmp_path / "cache.json", "other/repo").issues == {}
+
+
+def test_update_script_routes_titles_through_the_cache(stub, clock, monkeypatch, tmp_path):
+    import update_issues_phd
+
+    monkeypatch.setattr(update_issues_phd, "JOURNAL_PATH", tmp_path / "journal.jsonl")
+    monkeypatch.setattr(update_issues_phd, "CACHE_PATH", tmp_path / "cache.json")
+    monkeypatch.setattr(
+        update_issues_phd, "IssueEngine", lambda repo, **kw: engine_for(stub, clock, **kw)
+    )
+    stub.repo = update_issues_phd.REPO
+    for week in range(1, 4):
+        stub.add_issue(f"[READING] L0{week}: Papers", "outdated")
+
+    # Unknown titles: one listing fills the cache
+    assert update_issues_phd.main(["--no-journal", "--title", "[READING] L01: Papers"]) == 0
+    assert [m for m, *_ in stub.requests] == ["GET", "PATCH"]
+
+    stub.requests.clear()
+    assert update_issues_phd.main(["--no-journal", "--title", "[reading] l02: papers"]) == 0
+    assert [(m, p) for m, p, *_ in stub.requests] == [
+        ("GET", f"/repos/{stub.repo}/issues/2"),
+        ("PATCH", f"/repos/{stub.repo}/issues/2"),
+    ]
+    assert stub.issues[2]["body"] == "outdated"
+
+
+def test_update_script_checks_cached_titles_against_github(stub, clock, monkeypatch, tmp_path):
+    import update_issues_phd
+
+    monkeypatch.setattr(update_issues_phd, "JOURNAL_PATH", tmp_path / "journal.jsonl")
+    monkeypatch.setattr(update_issues_phd, "CACHE_PATH", tmp_path / "cache.json")
+    monkeypatch.setattr(
+        update_issues_phd, "IssueEngine", lambda repo, **kw: engine_for(stub, clock, **kw)
+    )
+    stub.repo = update_issues_phd.REPO
+    for week in range(1, 3):
+        stub.add_issue(f"[READING] L0{week}: Papers", "outdated")
+    assert update_issues_phd.main(["--dry-run"]) == 0  # fills the cache
+
+    # Renamed on GitHub, and the title now belongs to a newer issue; the other one is closed
+    stub.issues[0]["title"] = "[READING] L05: Papers"
+    stub.add_issue("[READING] L01: Papers", "outdated")
+    stub.issues[1]["state"] = "closed"
+    stub.requests.clear()
+    argv = ["--no-journal", "--title", "[READING] L01: Papers", "--title", "[READING] L02: Papers"]
+    assert update_issues_phd.main(argv) == 0
+    patched = [p for m, p, *_ in stub.requests if m == "PATCH"]
+    assert patched == [f"/repos/{stub.repo}/issues/3"]
+    assert [m for m, *_ in stub.requests].count("GET") == 3  # #1, #2, one listing
+    assert stub.issues[0]["body"] == stub.issues[1]["body"] == "outdated"
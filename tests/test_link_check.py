@@ -0,0 +1,175 @@
+"""
+Tests for the offline link and anchor checker in scripts/link_check.py.
+"""
+
+import json
+import re
+from pathlib import Path
+
+import pytest
+import yaml
+
+from link_check import (
+    REPO_URL,
+    check_link,
+    check_site,
+    check_sources,
+    extract,
+    report_entries,
+    site_target,
+)
+from quality_check import merge_report
+
+PAGE = """<html><body>
+<nav><a href="/course/">Home</a> <a href="/course/glossary#agent">Agent</a></nav>
+<h2 id="intro">Intro</h2><a name="legacy"></a>
+<a href="#intro">ok</a> <a href="#missing">gone</a>
+<a href="week-2.html">next</a> <a href="../glossary.html#nowhere">term</a>
+<a href="/course/slides/L01.pdf">slides</a> <img src="/course/assets/missing.png" alt="x">
+<a href="https://example.com/">external</a> <a href="mailto:team@example.com">mail</a>
+<a href="https://github.com/Digital-AI-Finance/agentic-artificial-intelligence/blob/main/L01/x.ipynb">nb</a>
+<a href="/other/">outside</a>
+<link rel="preconnect" href="/course/nowhere">
+</body></html>
+"""
+
+
+@pytest.fixture
+def site(tmp_path):
+    files = {
+        "index.html": '<h1 id="top">Home</h1>',
+        "glossary.html": '<dt id="agent">Agent</dt>',
+        "weeks/week-1.html": PAGE,
+        "weeks/week-2.html": "<p>Week 2</p>",
+        "slides/L01.pdf": "%PDF",
+    }
+    for name, content in files.items():
+        path = tmp_path / "_site" / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+    (tmp_path / "L01").mkdir()
+    (tmp_path / "L01" / "x.ipynb").write_text("{}", encoding="utf-8")
+    return tmp_path
+
+
+def test_extract_reads_anchors_and_links():
+    anchors, links = extract(PAGE)
+    assert anchors == {"intro", "legacy"}
+    assert ("img", "/course/assets/missing.png") in links
+    assert ("a", "mailto:team@example.com") in links
+    assert not any(url == "/course/nowhere" for _, url in links)
+
+
+def test_extract_unescapes_entities():
+    _, links = extract('<a href="/a?x=1&amp;y=2">q</a>')
+    assert links == [("a", "/a?x=1&y=2")]
+
+
+def test_site_target_resolves_like_a_browser():
+    assert site_target("week-2.html", "weeks/week-1.html", "/course") == (
+        "/course/weeks/week-2.html",
+        "",
+    )
+    assert site_target("../#top", "weeks/week-1.html", "/course") == ("/course/", "top")
+    assert site_target("?q=1#a", "weeks/week-1.html", "/course") == (
+        "/course/weeks/week-1.html",
+        "a",
+    )
+    assert site_target("//cdn.example.com/x.js", "index.html", "/course") is None
+    assert site_target("https://example.com/", "index.html", "/course") is None
+
+
+def test_check_site_reports_broken_links_and_anchors(site):
+    broken, stats = check_site(site / "_site", "/course", root=site)
+    found = {(b.page, b.href): b.reason for b in broken}
+    assert found == {
+        ("weeks/week-1.html", "#missing"): "missing anchor #missing",
+        ("weeks/week-1.html", "../glossary.html#nowhere"): "missing anchor #nowhere",
+        ("weeks/week-1.html", "/course/assets/missing.png"): "not found",
+        ("weeks/week-1.html", "/other/"): "outside the site (/course)",
+    }
+    assert stats["pages"] == 4
+    assert stats["anchors"] == 4
+
+
+def test_check_site_checks_repository_links(site):
+    (site / "L01" / "x.ipynb").unlink()
+    broken, _ = check_site(site / "_site", "/course", root=site)
+    assert any(b.reason == "missing repository file L01/x.ipynb" for b in broken)
+
+
+def test_check_site_is_the_same_with_workers(site):
+    for i in range(60):
+        (site / "_site" / f"extra-{i}.html").write_text('<a href="/course/gone">x</a>')
+    serial, _ = check_site(site / "_site", "/course", root=site)
+    parallel, _ = check_site(site / "_site", "/course", workers=2, root=site)
+    assert serial == parallel
+    assert len(serial) == 64
+
+
+def test_check_sources_covers_markdown_and_week_data(tmp_path):
+    docs = tmp_path / "docs"
+    (docs / "weeks").mkdir(parents=True)
+    (docs / "_data").mkdir()
+    (docs / "slides").mkdir()
+    (docs / "slides" / "L01_Intro.pdf").write_text("%PDF")
+    (docs / "_data" / "weeks.yml").write_text(
+        "- number: 1\n  folder: L01_Intro\n  notebooks:\n    - file: missing.ipynb\n"
+    )
+    (docs / "weeks" / "week-1.md").write_text(
+        "---\nweek_number: 1\n---\n"
+        "[Reading]({{ '/slides/gone.pdf' | relative_url }}) [Site](https://example.com/a.pdf)\n"
+    )
+    broken, count = check_sources(docs, root=tmp_path)
+    assert count == 4
+    assert {(b.href, b.reason) for b in broken} == {
+        ("/slides/gone.pdf", "not found"),
+        (
+            "https://colab.research.google.com/github/Digital-AI-Finance/"
+            "agentic-artificial-intelligence/blob/main/L01_Intro/missing.ipynb",
+            "missing repository file L01_Intro/missing.ipynb",
+        ),
+    }
+
+
+def test_merge_report_keeps_page_checks(site, tmp_path):
+    report = tmp_path / "quality_report.json"
+    page_check = {"name": "Home", "url": "u", "status": "pass", "issues": []}
+    report.write_text(json.dumps([page_check, {"name": "Links", "status": "pass"}]))
+    broken, stats = check_site(site / "_site", "/course", root=site)
+    merge_report(report_entries(broken, stats), "Links", report)
+    results = json.loads(report.read_text())
+    assert results[0] == page_check
+    assert [r["name"] for r in results[1:]] == ["Links: weeks/week-1.html", "Links"]
+    assert results[1]["url"].endswith("/weeks/week-1.html")
+    assert results[-1]["status"] == "issues"
+
+
+def test_public_site_urls_are_checked_as_site_paths(site):
+    (site / "_site" / "index.html").write_text(
+        '<a href="https://digital-ai-finance.github.io/agentic-artificial-intelligence/gone">x</a>'
+    )
+    broken, _ = check_site(site / "_site", "/agentic-artificial-intelligence", root=site)
+    assert [(b.page, b.reason) for b in broken if b.href.endswith("/gone")] == [
+        ("index.html", "not found")
+    ]
+
+
+def test_chart_gallery_repository_links_resolve():
+    docs = Path(__file__).parent.parent / "docs"
+    template = (docs / "charts.md").read_text(encoding="utf-8")
+    hrefs = [h for h in re.findall(r'href="([^"]+)"', template) if REPO_URL.match(h)]
+    assert len(hrefs) == 3
+    broken = []
+    for week in yaml.safe_load((docs / "_data" / "charts.yml").read_text(encoding="utf-8")):
+        for chart in week["charts"]:
+            for href in hrefs:
+                url = (
+                    href.replace("{{ week.folder }}", week["folder"])
+                    .replace("{{ chart.id }}", chart["id"])
+                    .replace("{{ stem }}", chart["id"][3:])
+                )
+                reason = check_link("a", url, "charts.html", set(), {}, "/course")
+                if reason:
+                    broken.append(reason)
+    assert broken == []
@@ -0,0 +1,107 @@
+"""
+Tests for the page-weight and performance budgets in scripts/perf_budget.py.
+"""
+
+from perf_budget import (
+    BUDGETS,
+    budget_issues,
+    evaluate,
+    load_budgets,
+    main,
+    page_type,
+    pages_to_measure,
+    summarize,
+)
+
+ORIGIN = "http://127.0.0.1:8000"
+
+
+def metrics(transfer_kb=100, requests=10, largest_kb=50, fcp=300.0, dcl=400.0):
+    return {
+        "transfer_bytes": transfer_kb * 1024,
+        "requests": requests,
+        "external_requests": 0,
+        "largest_asset": {"url": "/course/assets/big.png", "bytes": largest_kb * 1024},
+        "fcp_ms": fcp,
+        "dcl_ms": dcl,
+    }
+
+
+def test_page_types():
+    assert page_type("/") == "home"
+    assert page_type("/weeks/week-3.html") == "week"
+    assert page_type("/charts.html") == "gallery"
+    assert page_type("/glossary.html") == "reference"
+    assert {page_type(path) for path, _ in pages_to_measure()} <= set(BUDGETS)
+
+
+def test_load_budgets_overrides_per_type(tmp_path):
+    budgets_file = tmp_path / "budgets.yml"
+    budgets_file.write_text("week:\n  transfer_kb: 100\nslides:\n  requests: 5\n")
+    budgets = load_budgets(budgets_file)
+    assert budgets["week"]["transfer_kb"] == 100
+    assert budgets["week"]["requests"] == BUDGETS["week"]["requests"]
+    assert budgets["slides"] == {"requests": 5}
+    assert BUDGETS["week"]["transfer_kb"] != 100
+
+
+def test_summarize_counts_local_transfer_only():
+    entries = [
+        {"url": f"{ORIGIN}/course/", "bytes": 2000},
+        {"url": f"{ORIGIN}/course/assets/chart.png", "bytes": 9000},
+        {"url": "https://fonts.example.com/font.woff2", "bytes": 0},
+    ]
+    result = summarize(entries, 120.25, 150.0, ORIGIN, blocked=2)
+    assert result["transfer_bytes"] == 11000
+    assert result["requests"] == 2
+    assert result["external_requests"] == 2
+    assert result["largest_asset"] == {"url": "/course/assets/chart.png", "bytes": 9000}
+    assert result["fcp_ms"] == 120.2
+
+
+def test_budget_issues():
+    budget = {"transfer_kb": 200, "requests": 20, "largest_asset_kb": 100, "fcp_ms": 1000}
+    assert budget_issues(metrics(), budget) == []
+    issues = budget_issues(metrics(transfer_kb=300, largest_kb=150, fcp=None), budget)
+    assert issues == [
+        "Transfer 300 KB > 200 KB",
+        "Largest asset 150 KB > 100 KB (/course/assets/big.png)",
+    ]
+
+
+def test_evaluate_fails_pages_that_got_heavier():
+    budgets = load_budgets()
+    previous = {
+        "pages": {
+            "/": {"metrics": metrics(transfer_kb=100)},
+            "/glossary.html": {"metrics": metrics(transfer_kb=100, requests=10)},
+        }
+    }
+    measured = {
+        "/": ("Home", metrics(transfer_kb=100)),
+        "/glossary.html": ("Glossary", metrics(transfer_kb=120, requests=12)),
+        "/weeks/week-1.html": ("Week 1", metrics()),
+    }
+    home, glossary, week = evaluate(measured, budgets, previous)
+    assert home["status"] == "pass" and home["delta"]["transfer_bytes"] == 0
+    assert glossary["status"] == "issues"
+    assert glossary["issues"] == [
+        "Heavier by 20.0 KB (100 -> 120 KB)",
+        "2 more requests (10 -> 12)",
+    ]
+    assert glossary["type"] == "reference"
+    assert week["status"] == "pass" and "delta" not in week
+
+
+def test_main_requires_a_built_site(tmp_path, capsys):
+    assert main(["--site", str(tmp_path)]) == 1
+    assert "No built site" in capsys.readouterr().out
+
+
+def test_evaluate_reports_pages_that_failed_to_load():
+    previous = {"pages": {"/quizzes.html": {"status": "error", "issues": ["HTTP 404"]}}}
+    measured = {"/quizzes.html": ("Quizzes", {"error": "net::ERR_CONNECTION_REFUSED"})}
+    (entry,) = evaluate(measured, load_budgets(), previous)
+    assert entry["status"] == "error"
+    assert entry["issues"] == ["net::ERR_CONNECTION_REFUSED"]
+    assert "metrics" not in entry
@@ -0,0 +1,66 @@
+"""
+Tests for the site quality checks and the local site server in scripts/quality_check.py.
+"""
+
+import json
+import urllib.error
+import urllib.request
+
+import pytest
+
+from quality_check import merge_report, page_issues, pages_to_check, serve_site
+
+
+def test_page_issues():
+    assert page_issues("Course Home", True, 1, 0, True) == []
+    assert page_issues("", False, 2, 3, False) == [
+        "Missing or short page title",
+        "No main content area found",
+        "Multiple H1 headings (2)",
+        "3 images missing alt text",
+        "No navigation element",
+    ]
+    assert "No H1 heading" in page_issues("Course Home", True, 0, 0, True)
+
+
+def test_pages_cover_all_weeks():
+    paths = [path for path, _ in pages_to_check()]
+    assert paths[0] == "/"
+    assert "/weeks/week-12.html" in paths and len(paths) == 16
+
+
+def test_page_audit_keeps_entries_merged_by_other_checks(tmp_path):
+    report = tmp_path / "quality_report.json"
+    old_page = {"name": "Week 1", "status": "error", "issues": ["timeout"]}
+    merged = [
+        {"name": "Links", "status": "pass"},
+        {"name": "Performance: Home", "status": "issues"},
+        {"name": "Visual", "status": "pass"},
+    ]
+    report.write_text(json.dumps([old_page] + merged))
+    page = {"name": "Week 1", "url": "u", "status": "pass", "issues": []}
+    merge_report([page], path=report)
+    assert json.loads(report.read_text()) == [page] + merged
+    merge_report([{"name": "Visual", "status": "issues"}], "Visual", report)
+    assert [r["name"] for r in json.loads(report.read_text())][:1] == ["Week 1"]
+
+
+def test_local_server_mirrors_github_pages(tmp_path):
+    (tmp_path / "index.html").write_text("home", encoding="utf-8")
+    (tmp_path / "weeks").mkdir()
+    (tmp_path / "weeks" / "week-1.html").write_text("week one", encoding="utf-8")
+    server, base_url = serve_site(tmp_path, "/course")
+    try:
+        assert base_url.endswith("/course")
+
+        def get(path):
+            with urllib.request.urlopen(base_url + path, timeout=5) as response:
+                return response.read().decode()
+
+        assert get("/") == "home"
+        assert get("/weeks/week-1.html") == "week one"
+        assert get("/weeks/week-1") == "week one"
+        with pytest.raises(urllib.error.HTTPError):
+            get("/missing.html")
+    finally:
+        server.shutdown()
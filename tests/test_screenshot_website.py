@@ -0,0 +1,76 @@
+"""
+Tests for the visual regression suite in scripts/screenshot_website.py.
+"""
+
+import numpy as np
+from PIL import Image
+
+from screenshot_website import (
+    capture_name,
+    compare_captures,
+    report_entries,
+    site_pages,
+    update_baselines,
+)
+
+
+def write_png(path, pixels):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    Image.fromarray(pixels).save(path)
+
+
+def test_site_pages_and_capture_names(tmp_path):
+    for name in ["index.html", "glossary.html", "weeks/index.html", "weeks/week-1.html"]:
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / name).write_text("<h1>page</h1>")
+    for name in ["404.html", "offline.html", "assets/demo.html"]:
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / name).write_text("skip")
+    paths = site_pages(tmp_path)
+    assert paths == ["/glossary.html", "/", "/weeks/", "/weeks/week-1.html"]
+    assert [capture_name(path, "mobile") for path in paths] == [
+        "glossary@mobile.png",
+        "index@mobile.png",
+        "weeks@mobile.png",
+        "weeks__week-1@mobile.png",
+    ]
+
+
+def test_compare_captures_statuses(tmp_path):
+    baseline, current, diff = tmp_path / "baseline", tmp_path / "current", tmp_path / "diff"
+    white = np.full((200, 320, 3), 255, dtype=np.uint8)
+    changed = white.copy()
+    changed[50:80, 100:150] = 0
+    write_png(baseline / "index@desktop.png", white)
+    write_png(current / "index@desktop.png", white)
+    write_png(baseline / "weeks__week-1@desktop.png", white)
+    write_png(current / "weeks__week-1@desktop.png", changed)
+    write_png(current / "glossary@desktop.png", white)
+    names = [
+        "index@desktop.png",
+        "weeks__week-1@desktop.png",
+        "glossary@desktop.png",
+        "quizzes@desktop.png",
+    ]
+
+    results = compare_captures(names, baseline, current, diff, workers=2)
+    assert [r["status"] for r in results] == ["pass", "changed", "new", "error"]
+    assert results[1]["page"] == "weeks__week-1" and results[1]["viewport"] == "desktop"
+    assert len(results[1]["regions"]) == 1
+    assert (diff / "weeks__week-1@desktop.png").exists()
+    assert not (diff / "index@desktop.png").exists()
+
+    entries = report_entries(results)
+    assert [e["name"] for e in entries] == [
+        "Visual: weeks__week-1@desktop.png",
+        "Visual: glossary@desktop.png",
+        "Visual: quizzes@desktop.png",
+        "Visual",
+    ]
+    assert entries[0]["url"].endswith("/weeks/week-1")
+    assert entries[-1]["issues"] == ["3 of 4 captures differ from the baseline"]
+
+    assert update_baselines(names, current, baseline) == 3
+    results = compare_captures(names, baseline, current, diff)
+    assert [r["status"] for r in results] == ["pass", "pass", "pass", "error"]
+    assert not (diff / "weeks__week-1@desktop.png").exists()
@@ -0,0 +1,66 @@
+"""
+Tests for the sparse term co-occurrence analysis in scripts/term_cooccurrence.py.
+"""
+
+import math
+
+import numpy as np
+
+from term_cooccurrence import incidence_matrix, npmi_matrix, suggest_related, term_clusters
+
+TERMS = ["RAG", "Self-RAG", "CRAG", "agent", "MCP"]
+
+# (term id, slide) postings; RAG/Self-RAG/CRAG share slides 0-2, agent is everywhere
+POSTINGS = [
+    (0, 0),
+    (1, 0),
+    (2, 0),
+    (0, 0),
+    (0, 1),
+    (1, 1),
+    (2, 1),
+    (0, 2),
+    (2, 2),
+    (3, 0),
+    (3, 1),
+    (3, 2),
+    (3, 3),
+    (3, 4),
+    (3, 5),
+    (4, 4),
+    (4, 5),
+]
+
+
+def _matrices(min_shared=2):
+    terms, slides = np.array(POSTINGS).T
+    incidence, n_slides = incidence_matrix(terms, slides, len(TERMS))
+    return incidence, n_slides, *npmi_matrix(incidence, n_slides, min_shared)
+
+
+def test_incidence_is_binary():
+    incidence, n_slides, _, _ = _matrices()
+    assert n_slides == 6
+    assert incidence[0, 0] == 1  # RAG twice on slide 0 counts once
+    assert incidence.sum(axis=1).A.ravel().tolist() == [3, 2, 3, 6, 2]
+
+
+def test_npmi_matches_formula():
+    _, _, counts, npmi = _matrices()
+    scores = npmi.todense()
+    shared = counts.todense()
+    assert shared[0, 2] == 3
+    p_ab, p_a, p_b = 3 / 6, 3 / 6, 3 / 6
+    expected = math.log(p_ab / (p_a * p_b)) / -math.log(p_ab)
+    assert math.isclose(scores[0, 2], expected)
+    # Pairs sharing fewer than min_shared slides are dropped
+    assert shared[3, 3] == 0 and shared[0, 4] == 0
+
+
+def test_suggestions_and_clusters():
+    _, _, counts, npmi = _matrices()
+    related = suggest_related(TERMS, counts, npmi, top_k=2)
+    assert [r["term"] for r in related["RAG"]] == ["CRAG", "Self-RAG"]
+    # agent co-occurs with everything, so its NPMI with RAG is not positive
+    assert "agent" not in {r["term"] for r in related["RAG"]}
+    assert term_clusters(TERMS, npmi, threshold=0.5) == [["CRAG", "RAG", "Self-RAG"]]
@@ -0,0 +1,123 @@
+"""
+Tests for deck dependency parsing and the chart watcher's rebuild plan.
+"""
+
+import os
+
+import pytest
+
+import chart_manifest
+import watch_charts
+from beamer_build import deck_dependencies, dependents, find_decks
+from chart_engine import ChartResult
+from watch_charts import ChartWatcher, changed_files, snapshot
+
+DECK = r"""
+\documentclass{beamer}
+\begin{document}
+\input{frames/intro}
+\includegraphics[width=0.6\textwidth]{01_alpha/alpha.pdf}
+% \includegraphics{02_beta/beta.pdf}
+\end{document}
+"""
+
+
+@pytest.fixture
+def lecture(tmp_path):
+    """A minimal lecture tree: one deck, one \\input file and three charts."""
+    lesson = tmp_path / "L01_Test"
+    for folder in ("01_alpha", "02_beta", "03_gamma"):
+        chart_dir = lesson / folder
+        chart_dir.mkdir(parents=True)
+        (chart_dir / f"{folder[3:]}.py").write_text("print('chart')\n")
+    (lesson / "frames").mkdir()
+    (lesson / "frames" / "intro.tex").write_text(r"\includegraphics{03_gamma/gamma}" "\n")
+    (lesson / "03_gamma" / "gamma.pdf").write_bytes(b"%PDF")
+    (lesson / "L01_Test.tex").write_text(DECK)
+    return tmp_path
+
+
+def test_deck_dependencies_follow_inputs_and_skip_comments(lecture):
+    deck = lecture / "L01_Test" / "L01_Test.tex"
+    names = [
+        p.relative_to(lecture.resolve() / "L01_Test").as_posix() for p in deck_dependencies(deck)
+    ]
+    assert names == ["L01_Test.tex", "frames/intro.tex", "01_alpha/alpha.pdf", "03_gamma/gamma.pdf"]
+
+
+def test_real_decks_reference_existing_charts():
+    index = dependents(find_decks())
+    charts = [path for path in index if path.suffix == ".pdf"]
+    assert len(charts) >= 40
+    assert all(path.exists() for path in charts)
+
+
+def test_plan_maps_charts_to_decks(lecture):
+    watcher = ChartWatcher(root=lecture, latex=None)
+    lesson = lecture.resolve() / "L01_Test"
+    deck = lesson / "L01_Test.tex"
+
+    assert watcher.plan({lesson / "01_alpha" / "alpha.py"}) == (
+        [lesson / "01_alpha" / "alpha.py"],
+        [deck],
+    )
+    assert watcher.plan({lesson / "03_gamma" / "gamma.py"})[1] == [deck]
+    # beta is only referenced in a comment, so no deck needs rebuilding
+    assert watcher.plan({lesson / "02_beta" / "beta.py"}) == ([lesson / "02_beta" / "beta.py"], [])
+    assert watcher.plan({lesson / "frames" / "intro.tex"}) == ([], [deck])
+
+
+def test_snapshot_detects_changes(lecture):
+    before = snapshot(lecture)
+    script = lecture.resolve() / "L01_Test" / "01_alpha" / "alpha.py"
+    script.write_text("print('changed')\n")
+    os.utime(script, ns=(0, before[script] + 1_000_000))
+    assert changed_files(before, snapshot(lecture)) == {script}
+
+
+class SilentEngine:
+    """Reports every chart as rendered without writing its PDF."""
+
+    def start(self):
+        pass
+
+    def render(self, charts):
+        return [ChartResult(path, True, 0.01) for path in charts]
+
+
+def test_rebuild_treats_a_missing_pdf_as_a_failure(lecture, monkeypatch):
+    monkeypatch.setattr(chart_manifest, "MANIFEST_PATH", lecture / "manifest.json")
+    watcher = ChartWatcher(root=lecture.resolve(), engine=SilentEngine(), latex=None)
+    script = lecture.resolve() / "L01_Test" / "01_alpha" / "alpha.py"
+
+    assert watcher.rebuild({script}) is False
+    assert chart_manifest.load_manifest(lecture / "manifest.json")["charts"] == {}
+
+
+def test_watch_keeps_polling_after_a_failed_rebuild(lecture, monkeypatch):
+    class Stop(Exception):
+        pass
+
+    script = lecture.resolve() / "L01_Test" / "01_alpha" / "alpha.py"
+    # Two separate saves, each followed by a quiet poll that triggers its rebuild
+    snapshots = iter([{}, {script: 1}, {script: 1}, {script: 2}, {script: 2}])
+    monkeypatch.setattr(watch_charts, "snapshot", lambda root: next(snapshots))
+
+    def sleep(interval):
+        if len(calls) == 2:
+            raise Stop
+
+    monkeypatch.setattr(watch_charts.time, "sleep", sleep)
+    calls = []
+
+    def rebuild(changed):
+        calls.append(changed)
+        if len(calls) == 1:
+            raise FileNotFoundError("alpha.pdf")
+        return True
+
+    watcher = ChartWatcher(root=lecture.resolve(), engine=SilentEngine(), latex=None)
+    watcher.rebuild = rebuild
+    with pytest.raises(Stop):
+        watcher.watch(debounce=0)
+    assert calls == [{script}, {script}]
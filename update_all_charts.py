@@ -2,12 +2,20 @@
 Update all existing charts with proper font scaling and create new charts.
 Font size 24pt base -> 14pt when displayed at 60%
 """
+import argparse
 import os
 import subprocess
+import time
 from pathlib import Path
 
+import chart_manifest
+from chart_engine import DEFAULT_SEED, RenderEngine, discover_chart_scripts, render_subprocess
+
 BASE_DIR = Path(__file__).parent
 
+# Web formats (SVG, PNG/WebP thumbnails) for the chart gallery, built by the Pages workflow
+WEB_DIR = BASE_DIR / "docs" / "assets" / "charts"
+
 # Standard font settings for 60% display scaling
 FONT_SETTINGS = """plt.rcParams.update({
     'font.size': 24, 'axes.labelsize': 24, 'axes.titlesize': 26,
@@ -41,17 +49,144 @@ def update_chart_fonts():
             chart_file.write_text(new_content, encoding='utf-8')
             print(f"Updated (variant): {chart_file}")
 
-def regenerate_charts():
-    """Regenerate all chart PDFs."""
-    chart_files = list(BASE_DIR.glob("L*/*/chart.py"))
+def select_stale_charts(
+    chart_files, manifest, force=False, changed_since=None, seed=DEFAULT_SEED, web=False
+):
+    """Split charts into (stale, fresh) using the render manifest.
+
+    force renders everything; changed_since renders charts whose script or data
+    changed since that git revision, regardless of the manifest. A revision git
+    cannot diff against falls back to checking every chart against the manifest.
+    """
+    if force:
+        return list(chart_files), []
 
+    if changed_since is not None:
+        try:
+            changed = chart_manifest.changed_since(changed_since, BASE_DIR)
+        except subprocess.CalledProcessError:
+            print(f"Warning: cannot diff against {changed_since}; checking the manifest instead")
+        else:
+            if changed is None:
+                return list(chart_files), []
+            stale = [
+                c for c in chart_files
+                if c.resolve() in changed
+                or any(d.resolve() in changed for d in chart_manifest.chart_data_files(c))
+            ]
+            return stale, [c for c in chart_files if c not in stale]
+
+    versions = chart_manifest.library_versions()
+    engine = chart_manifest.engine_hash()
+    stale, fresh = [], []
     for chart_file in chart_files:
-        print(f"Regenerating: {chart_file}")
-        subprocess.run(["python", str(chart_file)], cwd=chart_file.parent)
+        inputs = chart_manifest.chart_inputs(chart_file, versions, engine, seed, web)
+        if chart_manifest.is_up_to_date(manifest, chart_file, inputs, BASE_DIR):
+            fresh.append(chart_file)
+        else:
+            stale.append(chart_file)
+    return stale, fresh
+
+
+def regenerate_charts(
+    workers=None,
+    use_subprocess=False,
+    force=False,
+    changed_since=None,
+    seed=DEFAULT_SEED,
+    web=False,
+):
+    """Regenerate chart PDFs whose inputs changed since the last build.
+
+    Charts run in a pool of warm workers by default; use_subprocess=True falls
+    back to one fresh interpreter per chart for timing comparisons. With a seed
+    (the default) output is deterministic; seed=None renders as the scripts would
+    standalone. web=True also exports SVG and PNG/WebP thumbnails into WEB_DIR.
+    """
+    if web and use_subprocess:
+        raise ValueError("Web export needs the warm render engine, not --subprocess")
+
+    start = time.perf_counter()
+    chart_files = discover_chart_scripts(BASE_DIR)
+    manifest = chart_manifest.load_manifest()
+    stale, fresh = select_stale_charts(chart_files, manifest, force, changed_since, seed, web)
+    print(f"{len(stale)} charts to render, {len(fresh)} up to date")
+    if not stale:
+        print(f"Nothing to do ({(time.perf_counter() - start) * 1000:.1f} ms)")
+        return []
+
+    if use_subprocess:
+        results = (render_subprocess(chart_file, seed=seed) for chart_file in stale)
+        mode = "subprocess"
+    else:
+        engine = RenderEngine(workers=workers, seed=seed, web_dir=WEB_DIR if web else None).start()
+        results = engine.render(stale)
+        mode = f"warm x{engine.workers}"
+
+    versions = chart_manifest.library_versions()
+    engine_hash = chart_manifest.engine_hash()
+    failed = []
+    chart_seconds = 0.0
+    for result in results:
+        chart_seconds += result.seconds
+        status = "OK" if result.ok else "FAILED"
+        print(f"{status:6} {result.seconds:6.2f}s  {result.path.relative_to(BASE_DIR)}")
+        if result.ok and chart_manifest.expected_output(result.path).exists():
+            inputs = chart_manifest.chart_inputs(result.path, versions, engine_hash, seed, web)
+            chart_manifest.record_render(manifest, result.path, inputs, result.seconds, BASE_DIR)
+        else:
+            failed.append(result)
+            print(result.error)
+
+    if not use_subprocess:
+        engine.close()
+    chart_manifest.save_manifest(manifest)
+
+    total = time.perf_counter() - start
+    print(f"\nRendered {len(stale)} charts ({mode}): {total:.2f}s wall, {chart_seconds:.2f}s in charts")
+    return failed
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Update chart fonts and regenerate chart PDFs")
+    parser.add_argument("--workers", type=int, default=None, help="Number of warm render workers")
+    parser.add_argument(
+        "--subprocess",
+        action="store_true",
+        help="Render each chart in a fresh interpreter (old behaviour, for timing comparison)",
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="Re-render every chart, ignoring the manifest"
+    )
+    parser.add_argument(
+        "--changed-since",
+        metavar="GIT_REV",
+        help="Re-render charts whose script changed since this git revision",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=DEFAULT_SEED, help="Random seed injected before each chart"
+    )
+    parser.add_argument(
+        "--no-deterministic",
+        action="store_true",
+        help="Do not seed charts or pin PDF metadata (output bytes differ per run)",
+    )
+    parser.add_argument(
+        "--web",
+        action="store_true",
+        help="Also export SVG and PNG/WebP thumbnails to docs/assets/charts for the gallery",
+    )
+    args = parser.parse_args()
+
     print("Updating chart fonts...")
     update_chart_fonts()
     print("\nRegenerating charts...")
-    regenerate_charts()
+    failed = regenerate_charts(
+        workers=args.workers,
+        use_subprocess=args.subprocess,
+        force=args.force,
+        changed_since=args.changed_since,
+        seed=None if args.no_deterministic else args.seed,
+        web=args.web,
+    )
     print("\nDone!")
+    raise SystemExit(1 if failed else 0)
@@ -1,12 +1,22 @@
 """
 PhD-Level Issue Enhancement Script
 Updates all 81 issues with research depth, Bloom's taxonomy, and technical specifications
+
+Only issues whose body differs from the generated one are edited;
+run with --dry-run to list them without changing anything. Completed edits
+are journaled, so an interrupted run picks up where it stopped. Issue state
+is cached locally and refreshed with conditional requests, so an unchanged
+listing costs a 304; --title "[SLIDES] L01: ..." updates single issues
+found by title in that cache.
 """
 
-import subprocess
-import json
 import re
 
+from issue_engine import (
+    CACHE_PATH, JOURNAL_PATH, REPO, IssueCache, IssueEngine, IssueError, Journal,
+    print_operation, sync_summary, title_key,
+)
+
 # Research papers by week (verified arXiv/DOI)
 PAPERS = {
     1: [
@@ -627,16 +637,20 @@ def generate_slides_body(title, week):
     """Generate enhanced SLIDES issue body"""
     content = SLIDES_CONTENT.get(week, {})
     papers = format_papers_table(week)
+    # Defaults are bound first: f-string expressions cannot contain backslashes before 3.12
+    objectives = content.get('objectives', '## Learning Objectives\n- To be defined')
+    definitions = content.get('definitions', '## Technical Content\n- To be defined')
+    slide_structure = content.get('slide_structure', '## Slide Structure\n- To be defined')
 
     body = f"""# {title}
 
-{content.get('objectives', '## Learning Objectives\n- To be defined')}
+{objectives}
 
-{content.get('definitions', '## Technical Content\n- To be defined')}
+{definitions}
 
 {papers}
 
-{content.get('slide_structure', '## Slide Structure\n- To be defined')}
+{slide_structure}
 
 ## Acceptance Criteria
 - [ ] All DOIs/arXiv links verified and accessible
@@ -1045,75 +1059,103 @@ Students work in teams of 2-3 to develop a novel contribution.
     return body
 
 def update_issue(repo, number, body):
-    """Update a single issue with new body"""
-    # Write body to temp file to handle escaping
-    import tempfile
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False, encoding='utf-8') as f:
-        f.write(body)
-        temp_path = f.name
-
-    cmd = f'gh issue edit {number} --repo {repo} --body-file "{temp_path}"'
-    result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-
-    import os
-    os.unlink(temp_path)
-
-    if result.returncode != 0:
-        print(f"Error updating issue #{number}: {result.stderr}")
-        return False
+    """Update a single issue with new body (one PATCH; no temp file, no shell)"""
+    with IssueEngine(repo) as engine:
+        try:
+            engine.edit_issue(number, body=body)
+        except IssueError as e:
+            print(f"Error updating issue #{number}: {e}")
+            return False
     return True
 
-def main():
-    repo = "Digital-AI-Finance/agentic-artificial-intelligence"
-
-    # Get all issues
-    result = subprocess.run(
-        f'gh issue list --repo {repo} --limit 100 --json number,title',
-        shell=True, capture_output=True, text=True
-    )
-    issues = json.loads(result.stdout)
-
-    print(f"Found {len(issues)} issues to update")
-
-    # Process each issue
-    for issue in issues:
-        number = issue['number']
-        title = issue['title']
-        week = get_week_from_title(title)
-
-        if not week:
-            print(f"Skipping issue #{number}: {title} (no week found)")
-            continue
-
-        # Determine issue type and generate body
-        if '[SLIDES]' in title:
-            body = generate_slides_body(title, week)
-            issue_type = "SLIDES"
-        elif '[NOTEBOOK]' in title:
-            body = generate_notebook_body(title, week)
-            issue_type = "NOTEBOOK"
-        elif '[CHART]' in title:
-            body = generate_chart_body(title, week)
-            issue_type = "CHART"
-        elif '[EXERCISE]' in title:
-            body = generate_exercise_body(title, week)
-            issue_type = "EXERCISE"
-        elif '[READING]' in title:
-            body = generate_reading_body(title, week)
-            issue_type = "READING"
-        elif '[PROJECT]' in title:
-            body = generate_project_body()
-            issue_type = "PROJECT"
-        else:
-            print(f"Skipping issue #{number}: {title} (unknown type)")
-            continue
-
-        print(f"Updating issue #{number} ({issue_type}): {title[:50]}...")
+def cached_issue(engine, cache, title):
+    """The open issue the cache maps this title to, if it still has that title on GitHub"""
+    number = cache.number(title)
+    if number is None:
+        return None
+    try:
+        issue = engine.get_issue(number)  # conditional: a 304 when unchanged
+    except IssueError:
+        return None  # deleted or transferred
+    if issue['state'] != 'open' or title_key(issue['title']) != title_key(title):
+        return None  # renamed or closed since it was cached
+    return issue
+
+def generate_body(title, week):
+    """(issue type, enhanced body) for an issue title, or None for an unknown type"""
+    if '[SLIDES]' in title:
+        return "SLIDES", generate_slides_body(title, week)
+    elif '[NOTEBOOK]' in title:
+        return "NOTEBOOK", generate_notebook_body(title, week)
+    elif '[CHART]' in title:
+        return "CHART", generate_chart_body(title, week)
+    elif '[EXERCISE]' in title:
+        return "EXERCISE", generate_exercise_body(title, week)
+    elif '[READING]' in title:
+        return "READING", generate_reading_body(title, week)
+    elif '[PROJECT]' in title:
+        return "PROJECT", generate_project_body()
+    return None
 
-        if update_issue(repo, number, body):
-            print(f"  -> Updated successfully")
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Enhance the course issues with PhD-level bodies")
+    parser.add_argument('--dry-run', action='store_true',
+                        help="Show which issues would be updated without changing anything")
+    parser.add_argument('--no-journal', action='store_true',
+                        help="Ignore the journal of completed operations and check every issue")
+    parser.add_argument('--title', action='append', default=[],
+                        help="Only update the issue with this title (repeatable)")
+    args = parser.parse_args(argv)
+    journal = None if args.no_journal else Journal(JOURNAL_PATH, REPO, batch='phd')
+
+    cache = IssueCache(CACHE_PATH, REPO)
+    with IssueEngine(REPO, cache=cache) as engine:
+        if args.title:
+            # Titles resolve to numbers from the local cache; list only when that misses
+            listed = None
+            issues = []
+            for title in args.title:
+                issue = cached_issue(engine, cache, title)
+                if issue is None:
+                    if listed is None:
+                        listed = engine.list_issues(state='open')
+                    issue = next((i for i in listed
+                                  if title_key(i['title']) == title_key(title)), None)
+                if issue is None:
+                    print(f"Skipping {title} (no such open issue)")
+                else:
+                    issues.append(issue)
         else:
-            print(f"  -> FAILED")
+            # Get all open issues (every page, not just the first 100); a 304 when unchanged
+            issues = engine.list_issues(state='open')
+        print(f"Found {len(issues)} issues")
+
+        declared = []
+        for issue in issues:
+            number = issue['number']
+            title = issue['title']
+            week = get_week_from_title(title)
+
+            if not week:
+                print(f"Skipping issue #{number}: {title} (no week found)")
+                continue
+
+            generated = generate_body(title, week)
+            if generated is None:
+                print(f"Skipping issue #{number}: {title} (unknown type)")
+                continue
+            issue_type, body = generated
+            declared.append({'number': number, 'title': title, 'body': body})
+
+        # Only issues whose body differs from the generated one are edited
+        operations = engine.sync(declared, create=False, dry_run=args.dry_run, existing=issues,
+                                 journal=journal,
+                                 on_operation=lambda op: print_operation(op, args.dry_run))
+
+    print(sync_summary(operations, args.dry_run))
+    return 1 if any(op.error for op in operations) else 0
 
 if __name__ == "__main__":
-    main()
+    exit(main())
@@ -0,0 +1,179 @@
+"""
+Watch chart scripts and lecture decks, rebuilding only what a change affects.
+
+Polls L*/*/*.py, L*/*.tex and the shared chart data in docs/_data/chart_specs.
+After a burst of saves has settled (the debounce window), changed charts are
+re-rendered in a warm worker and every deck that \\includegraphics one of
+their PDFs is recompiled. A saved .tex file recompiles just that deck.
+
+Usage:
+    python watch_charts.py
+    python watch_charts.py --no-latex          # only re-render charts
+    python watch_charts.py --debounce 1.0 --latex xelatex
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+import beamer_build
+import chart_manifest
+from chart_engine import DEFAULT_SEED, RenderEngine, discover_chart_scripts
+
+ROOT = Path(__file__).parent
+
+WATCH_PATTERNS = ["L*/*/*.py", "L*/*.tex", "docs/_data/chart_specs/*.csv"]
+
+
+def snapshot(root: Path = ROOT) -> dict[Path, int]:
+    """Modification time of every watched file."""
+    mtimes = {}
+    for pattern in WATCH_PATTERNS:
+        for path in root.glob(pattern):
+            try:
+                mtimes[path.resolve()] = path.stat().st_mtime_ns
+            except FileNotFoundError:
+                pass
+    return mtimes
+
+
+def changed_files(old: dict[Path, int], new: dict[Path, int]) -> set[Path]:
+    """Files added, modified or removed between two snapshots."""
+    return {path for path in old.keys() | new.keys() if old.get(path) != new.get(path)}
+
+
+class ChartWatcher:
+    """Maps file changes to chart renders and deck builds.
+
+    The render engine and the chart/deck dependency indexes are kept for the
+    whole session; the deck index is rebuilt only when a .tex file changes.
+    """
+
+    def __init__(
+        self,
+        root: Path = ROOT,
+        engine: Optional[RenderEngine] = None,
+        latex: Optional[str] = beamer_build.DEFAULT_LATEX,
+        seed: Optional[int] = DEFAULT_SEED,
+    ):
+        self.root = root
+        self.engine = engine or RenderEngine(workers=1, seed=seed)
+        self.latex = latex
+        self.seed = seed
+        self.charts = {path.resolve() for path in discover_chart_scripts(root)}
+        self.decks = [deck.resolve() for deck in beamer_build.find_decks(root)]
+        self.deck_index = beamer_build.dependents(self.decks)
+
+    def plan(self, changed: set[Path]) -> tuple[list[Path], list[Path]]:
+        """Charts to re-render and decks to rebuild for a set of changed files."""
+        charts = {path for path in changed if path in self.charts}
+        data = {path for path in changed if path.suffix == ".csv"}
+        if data:
+            charts |= {
+                chart
+                for chart in self.charts
+                if any(p.resolve() in data for p in chart_manifest.chart_data_files(chart))
+            }
+
+        tex = {path for path in changed if path.suffix == ".tex"}
+        if tex:
+            self.deck_index = beamer_build.dependents(self.decks)
+        decks = {deck for path in tex for deck in self.deck_index.get(path, [])}
+        for chart in charts:
+            decks.update(self.deck_index.get(chart_manifest.expected_output(chart).resolve(), []))
+        return sorted(charts), sorted(decks)
+
+    def rebuild(self, changed: set[Path]) -> bool:
+        """Render changed charts, then rebuild the decks that use them."""
+        charts, decks = self.plan(changed)
+        failed: set[Path] = set()
+        if charts:
+            manifest = chart_manifest.load_manifest()
+            versions = chart_manifest.library_versions()
+            engine_hash = chart_manifest.engine_hash()
+            for result in self.engine.render(charts):
+                status = "OK" if result.ok else "FAILED"
+                print(f"{status:6} {result.seconds:6.2f}s  {result.path.relative_to(self.root)}")
+                if result.ok and chart_manifest.expected_output(result.path).exists():
+                    inputs = chart_manifest.chart_inputs(
+                        result.path, versions, engine_hash, self.seed
+                    )
+                    chart_manifest.record_render(
+                        manifest, result.path, inputs, result.seconds, self.root
+                    )
+                else:
+                    output = chart_manifest.expected_output(result.path)
+                    failed.add(output.resolve())
+                    print(result.error if not result.ok else f"No {output.name} was written")
+            chart_manifest.save_manifest(manifest)
+
+        # Keep the previous deck PDF rather than building it with a broken chart
+        skip = {deck for output in failed for deck in self.deck_index.get(output, [])}
+        decks = [deck for deck in decks if deck not in skip]
+        ok = not failed
+        if self.latex:
+            for deck in decks:
+                result = beamer_build.compile_deck(deck, self.latex, passes=1)
+                status = "OK" if result.ok else "FAILED"
+                print(f"{status:6} {result.seconds:6.2f}s  {deck.relative_to(self.root)}")
+                if not result.ok:
+                    ok = False
+                    print(result.log)
+        return ok
+
+    def watch(self, interval: float = 0.3, debounce: float = 0.5):
+        """Poll for changes forever; a batch is processed once saves stop for `debounce`."""
+        self.engine.start()
+        previous = snapshot(self.root)
+        print(f"Watching {len(previous)} files (Ctrl+C to stop)...")
+        pending: set[Path] = set()
+        last_change = 0.0
+        while True:
+            time.sleep(interval)
+            current = snapshot(self.root)
+            changed = changed_files(previous, current)
+            previous = current
+            if changed:
+                pending |= changed
+                last_change = time.monotonic()
+                continue
+            if pending and time.monotonic() - last_change >= debounce:
+                start = time.perf_counter()
+                names = ", ".join(sorted(p.name for p in pending))
+                print(f"\nChanged: {names}")
+                batch, pending = pending, set()
+                # One broken edit must not end the session: report it and keep polling
+                try:
+                    self.rebuild(batch)
+                except Exception as e:
+                    print(f"Rebuild failed: {type(e).__name__}: {e}")
+                else:
+                    print(f"Done in {time.perf_counter() - start:.2f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-render charts and decks on save")
+    parser.add_argument("--interval", type=float, default=0.3, help="Polling interval (seconds)")
+    parser.add_argument(
+        "--debounce", type=float, default=0.5, help="Quiet period before rebuilding (seconds)"
+    )
+    parser.add_argument(
+        "--latex", default=beamer_build.DEFAULT_LATEX, help="LaTeX engine for deck rebuilds"
+    )
+    parser.add_argument("--no-latex", action="store_true", help="Only re-render charts")
+    args = parser.parse_args()
+
+    watcher = ChartWatcher(latex=None if args.no_latex else args.latex)
+    try:
+        watcher.watch(args.interval, args.debounce)
+    except KeyboardInterrupt:
+        print("\nStopped")
+    finally:
+        watcher.engine.terminate()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())